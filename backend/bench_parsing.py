@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Parser benchmark on saved HTML fixtures (fixtures/html/).
+
+Compares the old parsing path (html.parser over the whole page) with the
+current one (lxml + SoupStrainer over the card containers only) using each
+scraper's real parse_listing. No network or browser needed:
+
+    python bench_parsing.py [--rounds 20]
+
+See bench_scrapers.py for the per-card / memory regression suite.
+"""
+
+import argparse
+import time
+
+from fixtures import load_fixture
+from scrapers.indeed_scraper import IndeedScraper
+from scrapers.naukri_scraper import NaukriScraper
+from scrapers.placementindia_scraper import PlacementIndiaScraper
+from scrapers.remoteonly_scraper import RemoteOnlyScraper
+from scrapers.shine_scraper import ShineScraper
+
+SCRAPERS = {
+    "naukri": NaukriScraper,
+    "indeed": IndeedScraper,
+    "placementindia": PlacementIndiaScraper,
+    "shine": ShineScraper,
+    "remoteonly": RemoteOnlyScraper,
+}
+
+
+def time_parse(scraper, html: str, rounds: int):
+    """Best-of-`rounds` wall time of parse_listing, and the number of jobs it returned."""
+    best = float("inf")
+    jobs = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        jobs = scraper.parse_listing(html)
+        best = min(best, time.perf_counter() - started)
+    return best, len(jobs)
+
+
+def legacy(scraper):
+    """Same scraper, configured like the old code: html.parser, whole page."""
+    scraper.html_parser = "html.parser"
+    for attr in ("card_strainer", "all_cards_strainer"):
+        if hasattr(scraper, attr):
+            setattr(scraper, attr, None)
+    return scraper
+
+
+def run(rounds: int):
+    print(f"{'source':<16}{'jobs':>6}{'html.parser':>14}{'lxml+strainer':>16}{'speedup':>10}")
+    for name, scraper_cls in SCRAPERS.items():
+        html = load_fixture(name)
+        old_time, old_jobs = time_parse(legacy(scraper_cls()), html, rounds)
+        new_time, new_jobs = time_parse(scraper_cls(), html, rounds)
+        if old_jobs != new_jobs:
+            print(f"WARNING: {name} returned {old_jobs} jobs before and {new_jobs} after")
+        print(f"{name:<16}{new_jobs:>6}{old_time * 1000:>12.1f}ms{new_time * 1000:>14.1f}ms{old_time / new_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    run(args.rounds)
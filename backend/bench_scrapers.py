@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Offline scraper benchmark and parsing regression suite.
+
+Every scraper parses its recorded page from fixtures/html/ with its real
+parse_listing; we report parse time per card, cards per second and peak
+memory. PlacementIndia is also run end to end (HTTP mode) against a local
+stand-in server (fixtures/server.py); --browser does the same for the
+Selenium scrapers (needs Chrome). Nothing touches the network.
+
+The parsed jobs are always checked field by field against the committed
+snapshot in fixtures/expected_jobs.json (exit 1 on any difference); rewrite
+it with --update-expected after an intended parser change. Timings can also
+be compared with a baseline saved on the same machine.
+
+    python bench_scrapers.py                           # report + field check
+    python bench_scrapers.py --update-expected         # accept current parse output
+    python bench_scrapers.py --save-baseline bench_baseline.json
+    python bench_scrapers.py --baseline bench_baseline.json   # also exit 1 on slowdowns
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# The stand-in servers are local; do not throttle them like real sites
+os.environ.setdefault("SCRAPER_RATE_PER_SECOND", "1000")
+os.environ.setdefault("SCRAPER_BURST", "1000")
+
+from fixtures import FIXTURE_DIR, FIXTURE_SOURCES, load_fixture
+from fixtures.server import FixtureServer
+from scrapers.async_http import shutdown_fetch_loop
+from scrapers.indeed_scraper import IndeedScraper
+from scrapers.naukri_scraper import NaukriScraper
+from scrapers.placementindia_scraper import PlacementIndiaScraper
+from scrapers.remoteonly_scraper import RemoteOnlyScraper
+from scrapers.shine_scraper import ShineScraper
+
+SCRAPERS = {
+    "naukri": NaukriScraper,
+    "indeed": IndeedScraper,
+    "placementindia": PlacementIndiaScraper,
+    "shine": ShineScraper,
+    "remoteonly": RemoteOnlyScraper,
+}
+
+
+EXPECTED_JOBS = os.path.join(os.path.dirname(FIXTURE_DIR), "expected_jobs.json")
+
+
+def job_snapshot(job) -> dict:
+    """A parsed job's fields (scraped_at varies; the description is digested)."""
+    fields = job.model_dump(exclude={"scraped_at", "job_description"})
+    fields["description_sha1"] = hashlib.sha1(job.job_description.encode("utf-8")).hexdigest()
+    return fields
+
+
+def parse_snapshot() -> dict:
+    return {source: [job_snapshot(job) for job in SCRAPERS[source]().parse_listing(load_fixture(source))]
+            for source in FIXTURE_SOURCES}
+
+
+def compare_fields(current: dict, expected: dict) -> list:
+    """Differences between parsed jobs and the committed snapshot."""
+    problems = []
+    for source, expected_jobs in expected.items():
+        jobs = current.get(source, [])
+        if len(jobs) != len(expected_jobs):
+            problems.append(f"{source}: parsed {len(jobs)} jobs, expected {len(expected_jobs)}")
+        for n, (job, want) in enumerate(zip(jobs, expected_jobs)):
+            diff = sorted(key for key in set(job) | set(want) if job.get(key) != want.get(key))
+            if diff:
+                problems.append(f"{source}[{n}] {want.get('job_id')}: {', '.join(diff)} changed")
+    return problems
+
+
+def bench_parse(source: str, rounds: int) -> dict:
+    scraper = SCRAPERS[source]()
+    html = load_fixture(source)
+    scraper.parse_listing(html)  # warm-up (selector compilation, imports)
+
+    best = float("inf")
+    cards = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        cards = len(scraper.parse_listing(html))
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    scraper.parse_listing(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "cards": cards,
+        "parse_ms": round(best * 1000, 2),
+        "ms_per_card": round(best * 1000 / cards, 3) if cards else None,
+        "cards_per_sec": round(cards / best, 1) if best else None,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def bench_end_to_end(source: str) -> dict:
+    with FixtureServer(source) as server:
+        scraper = server.point(SCRAPERS[source]())
+        started = time.perf_counter()
+        if source == "placementindia":
+            jobs = scraper.scrape_jobs(pages=1, show_browser=False)
+        else:
+            jobs = scraper.scrape_jobs()
+        elapsed = time.perf_counter() - started
+    return {"cards": len(jobs), "scrape_ms": round(elapsed * 1000, 1)}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Regressions: fewer cards parsed, or time/memory above baseline * (1 + tolerance)."""
+    problems = []
+    for source, base in baseline.items():
+        current = results.get(source)
+        if current is None:
+            continue
+        if current["cards"] != base["cards"]:
+            problems.append(f"{source}: parsed {current['cards']} cards, baseline {base['cards']}")
+        for key in ("ms_per_card", "peak_kib"):
+            if base.get(key) and current.get(key) and current[key] > base[key] * (1 + tolerance):
+                problems.append(f"{source}: {key} {current[key]} > baseline {base[key]} (+{tolerance:.0%})")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--browser", action="store_true", help="also run the Selenium scrapers end to end")
+    parser.add_argument("--baseline", help="JSON baseline to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown vs baseline (0.5 = +50%%)")
+    parser.add_argument("--save-baseline", help="write this run's parse results as a baseline")
+    parser.add_argument("--update-expected", action="store_true", help=f"rewrite {os.path.relpath(EXPECTED_JOBS)}")
+    args = parser.parse_args()
+
+    results = {source: bench_parse(source, args.rounds) for source in FIXTURE_SOURCES}
+    print(f"{'source':<16}{'cards':>6}{'parse':>10}{'ms/card':>10}{'cards/s':>10}{'peak':>12}")
+    for source, r in results.items():
+        print(f"{source:<16}{r['cards']:>6}{r['parse_ms']:>8.1f}ms{r['ms_per_card'] or 0:>10.3f}"
+              f"{r['cards_per_sec'] or 0:>10.0f}{r['peak_kib']:>9.0f}KiB")
+
+    e2e_sources = ["placementindia"] + (["naukri", "indeed", "shine", "remoteonly"] if args.browser else [])
+    for source in e2e_sources:
+        r = bench_end_to_end(source)
+        print(f"end-to-end {source}: {r['cards']} jobs in {r['scrape_ms']:.0f}ms (local stand-in server)")
+    shutdown_fetch_loop()
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+
+    problems = []
+    snapshot = parse_snapshot()
+    if args.update_expected:
+        with open(EXPECTED_JOBS, "w") as f:
+            json.dump(snapshot, f, indent=1, sort_keys=True)
+        print(f"Expected jobs written to {EXPECTED_JOBS}")
+    else:
+        with open(EXPECTED_JOBS) as f:
+            problems += compare_fields(snapshot, json.load(f))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            problems += compare(results, json.load(f), args.tolerance)
+    for p in problems:
+        print(f"REGRESSION {p}")
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Skill matcher benchmark (utils/skills.py) against the old substring scan.
+
+The corpus is the job cards parsed from the recorded pages in fixtures/html/
+(title + description) plus resume-length documents built from them. Reports
+documents per second for both matchers and a few cards where they disagree
+(substring false positives such as "Java" in "JavaScript"). Offline:
+
+    python bench_skills.py [--rounds 5]
+"""
+
+import argparse
+import time
+
+from fixtures import FIXTURE_SOURCES, load_fixture
+from scrapers.registry import SCRAPER_CLASSES
+from scrapers.indeed_scraper import IndeedScraper
+from utils.skills import find_skills
+
+# The list BaseScraper.extract_skills used to scan with `in`
+LEGACY_SKILLS = [
+    'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'Angular', 'Vue.js',
+    'Flutter', 'Dart', 'Swift', 'Kotlin', 'PHP', 'Laravel', 'Django',
+    'Flask', 'SQL', 'MongoDB', 'PostgreSQL', 'MySQL', 'Redis', 'Docker',
+    'Kubernetes', 'AWS', 'Azure', 'GCP', 'Git', 'HTML', 'CSS', 'Figma',
+    'Adobe XD', 'Photoshop', 'Machine Learning', 'AI', 'TensorFlow',
+    'PyTorch', 'Data Science', 'Analytics', 'Tableau', 'Power BI'
+]
+
+
+def legacy_skills(text: str):
+    lower = text.lower()
+    return [skill for skill in LEGACY_SKILLS if skill.lower() in lower]
+
+
+def corpus():
+    scrapers = {**SCRAPER_CLASSES, "indeed": IndeedScraper}
+    cards = []
+    for source in FIXTURE_SOURCES:
+        for job in scrapers[source]().parse_listing(load_fixture(source)):
+            cards.append(f"{job.job_title}. {job.job_description}")
+    # Resume-sized documents (~3-4 KB) from consecutive cards
+    resumes = ["\n".join(cards[i:i + 20]) for i in range(0, len(cards), 20)]
+    return cards, resumes
+
+
+def docs_per_second(match, docs, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for doc in docs:
+            match(doc)
+        best = min(best, time.perf_counter() - started)
+    return len(docs) / best
+
+
+def run(rounds: int):
+    cards, resumes = corpus()
+    print(f"{'corpus':<10}{'docs':>6}{'substring':>14}{'matcher':>14}   (docs/s)")
+    for name, docs in (("cards", cards), ("resumes", resumes)):
+        old = docs_per_second(legacy_skills, docs, rounds)
+        new = docs_per_second(find_skills, docs, rounds)
+        print(f"{name:<10}{len(docs):>6}{old:>14,.0f}{new:>14,.0f}")
+
+    print("\nWhere they disagree (first 5 cards):")
+    shown = 0
+    for doc in cards:
+        old, new = set(legacy_skills(doc)), set(find_skills(doc))
+        if old - new and shown < 5:
+            print(f"  {doc[:70]!r}\n    substring only: {sorted(old - new)}")
+            shown += 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    run(args.rounds)
@@ -0,0 +1,19 @@
+# backend/fixtures/__init__.py
+"""Recorded listing pages for offline scraper runs and benchmarks.
+
+fixtures/html/<source>.html holds one saved listing page per scraper.
+"""
+import os
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "html")
+
+FIXTURE_SOURCES = ["naukri", "indeed", "placementindia", "shine", "remoteonly"]
+
+
+def fixture_path(source: str) -> str:
+    return os.path.join(FIXTURE_DIR, f"{source}.html")
+
+
+def load_fixture(source: str) -> str:
+    with open(fixture_path(source), encoding="utf-8") as f:
+        return f.read()
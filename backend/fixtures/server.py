@@ -0,0 +1,65 @@
+# backend/fixtures/server.py
+"""Local HTTP stand-in for the job sites.
+
+Serves a recorded fixture page for every GET, so the real scrapers (their URL
+building, fetching, readiness waits and parsing) can run with no network:
+
+    with FixtureServer("placementindia") as server:
+        scraper = PlacementIndiaScraper()
+        server.point(scraper)
+        jobs = scraper.scrape_jobs(show_browser=False)
+
+Each source gets its own server (and port) because several sites serve their
+listings from "/".
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fixtures import load_fixture
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    body: bytes = b""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        # Keep benchmark output clean
+        pass
+
+
+class FixtureServer:
+    def __init__(self, source: str, host: str = "127.0.0.1", port: int = 0):
+        handler = type(f"{source}Handler", (_FixtureHandler,), {"body": load_fixture(source).encode("utf-8")})
+        self.source = source
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def point(self, scraper):
+        """Redirect a scraper instance to this server instead of the live site."""
+        scraper.base_url = self.url
+        return scraper
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
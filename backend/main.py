@@ -1,24 +1,35 @@
 # backend/main.py
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
-from models.job import Job, JobResponse
-from scrapers.naukri_scraper import NaukriScraper
-from scrapers.remoteonly_scraper import RemoteOnlyScraper
-from scrapers.placementindia_scraper import PlacementIndiaScraper
-from scrapers.shine_scraper import ShineScraper
+from models.job import Job, JobResponse, JobSearchResponse, ScoredJob
+from scrapers.registry import build_scrapers, source_tasks, remember_fingerprints
+from scrapers.driver_pool import get_driver_pool
+from scrapers.async_http import shutdown_fetch_loop
 from utils.data_processor import DataProcessor
+from utils.fanout import ScrapeFanout, STATUS_TIMEOUT
+from utils.job_ids import listing_etag
+from utils.job_filters import JobFilters
+from utils.job_store import JobStore, decode_cursor
+from utils.scheduler import RefreshScheduler
+from utils.recommendation_cache import RecommendationCache
+from utils.scrape_cache import ScrapeCache
+from utils.task_queue import TaskQueue
+from utils.vector_index import JobVectorIndex
 from motor.motor_asyncio import AsyncIOMotorClient
 from routes.auth import router as auth_router
-from routes.parse_resume import router as parse_router
-from routes.recommendations import router as recommend_router
+from routes.parse_resume import router as parse_router, preload_resume_parser, resume_parser_stats, shutdown_resume_parser
+from routes.recommendations import router as recommend_router, gemini_stats
 from routes.apply_placementindia import router as apply_router
 from routes.applications import router as applications_router
+from routes.scrape_tasks import router as scrape_tasks_router
 import os
+import asyncio
+import json
 from dotenv import load_dotenv
 
 # Load .env early so environment variables (e.g., GEMINI_API_KEY) are available
@@ -49,16 +60,15 @@ app.add_middleware(
 )
 
 # Initialize scraper and processor
-naukri_scraper = NaukriScraper()
-remoteonly_scraper = RemoteOnlyScraper()
-placementindia_scraper = PlacementIndiaScraper()
-shine_scraper = ShineScraper()
+scrapers_by_source = build_scrapers()
 data_processor = DataProcessor()
+scrape_fanout = ScrapeFanout()
 app.include_router(auth_router)
 app.include_router(parse_router)
 app.include_router(recommend_router)
 app.include_router(apply_router)
 app.include_router(applications_router)
+app.include_router(scrape_tasks_router)
 
 @app.on_event("startup")
 async def startup_event():
@@ -70,88 +80,275 @@ async def startup_event():
         await app.state.db.users.create_index("email", unique=True)
     except Exception as e:
         print(f"Index creation error: {e}")
+    try:
+        # Job ids are stable across scrapes, so (user, job) identifies an application
+        await app.state.db.applications.create_index([("user_id", 1), ("job_id", 1)], unique=True)
+    except Exception as e:
+        print(f"Applications index creation error: {e}")
+    app.state.job_store = JobStore(app.state.db)
+    try:
+        await app.state.job_store.ensure_indexes()
+    except Exception as e:
+        print(f"Job store index creation error: {e}")
+    try:
+        # Seed the near-duplicate index from the store, off the event loop
+        recent = await app.state.job_store.recent_jobs(int(os.getenv("DEDUP_WARM_JOBS", "20000")))
+        await asyncio.get_running_loop().run_in_executor(None, data_processor.near_duplicates.warm, recent)
+    except Exception as e:
+        print(f"Dedup index warm-up error: {e}")
+    try:
+        # Cards already stored don't need parsing again on the next incremental scrape
+        fingerprints = await app.state.job_store.card_fingerprints(int(os.getenv("SCRAPER_SEEN_WARM_CARDS", "50000")))
+        remember_fingerprints(scrapers_by_source, fingerprints)
+    except Exception as e:
+        print(f"Card fingerprint warm-up error: {e}")
+    app.state.scrape_cache = ScrapeCache(app.state.db)
+    try:
+        await app.state.scrape_cache.ensure_indexes()
+    except Exception as e:
+        print(f"Scrape cache index creation error: {e}")
+    app.state.recommendation_cache = RecommendationCache(app.state.db)
+    try:
+        await app.state.recommendation_cache.ensure_indexes()
+    except Exception as e:
+        print(f"Recommendation cache index creation error: {e}")
+    app.state.task_queue = TaskQueue(app.state.db)
+    try:
+        await app.state.task_queue.ensure_indexes()
+    except Exception as e:
+        print(f"Task queue index creation error: {e}")
+    app.state.refresh_scheduler = RefreshScheduler(
+        app.state.job_store, scrape_fanout, _source_tasks, queue=app.state.task_queue
+    )
+    app.state.refresh_scheduler.start()
+    # Nearest-neighbour index over stored jobs for /api/recommendations without a job list
+    # (left unset when it cannot be opened; recommendations then require a job list)
+    try:
+        job_index = JobVectorIndex()
+        await asyncio.get_running_loop().run_in_executor(None, job_index.load)
+        job_index.start(app.state.job_store)
+        app.state.job_index = job_index
+    except Exception as e:
+        print(f"Job vector index startup error: {e}")
+    # Start browsers off the event loop so startup does not block on Chrome
+    asyncio.get_running_loop().run_in_executor(None, get_driver_pool().warm)
+    # Same for the resume parser processes loading spaCy (RESUME_NLP_PRELOAD)
+    asyncio.get_running_loop().run_in_executor(None, preload_resume_parser)
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    scheduler = getattr(app.state, 'refresh_scheduler', None)
+    if scheduler is not None:
+        await scheduler.stop()
+    job_index = getattr(app.state, 'job_index', None)
+    if job_index is not None:
+        await job_index.stop()
     db = getattr(app.state, 'db', None)
     if db is not None:
         client = db.client
         client.close()
+    scrape_fanout.shutdown()
+    shutdown_resume_parser()
+    get_driver_pool().close_all()
+    await asyncio.get_running_loop().run_in_executor(None, shutdown_fetch_loop)
 
 @app.get("/")
 async def root():
     return {"message": "JobScraper API is running!", "status": "active"}
 
+def _source_tasks(search_term: str, location: str, pages: int, incremental: bool = False) -> dict:
+    return source_tasks(scrapers_by_source, search_term, location, pages, incremental)
+
+async def _scrape_sources(search_term: str, location: str, pages: int, sources: List[str]) -> dict:
+    """Scrape `sources` now and store what came back; the ScrapeCache loader for /api/jobs."""
+    tasks = {name: task for name, task in _source_tasks(search_term, location, pages).items() if name in sources}
+    results = await scrape_fanout.run_sources(tasks)
+    query = JobStore.query_key(search_term, location)
+    for source, (jobs, status) in results.items():
+        if status == "ok":
+            try:
+                await app.state.job_store.upsert_jobs(source, query, jobs)
+            except Exception as e:
+                print(f"Job store error storing {source}: {e}")
+    return results
+
+async def _cached_scrape(search_term: str, location: str, pages: int, sources: List[str]) -> dict:
+    """Per-source (jobs, status); identical concurrent requests share one scrape."""
+    return await app.state.scrape_cache.get(
+        search_term, location, pages, sources,
+        lambda missing: _scrape_sources(search_term, location, pages, missing),
+    )
+
+def _breakdown(results: dict) -> dict:
+    return {source: STATUS_TIMEOUT if status == STATUS_TIMEOUT else len(jobs or []) for source, (jobs, status) in results.items()}
+
 @app.get("/api/jobs", response_model=JobResponse)
 async def get_jobs(
+    request: Request,
+    response: Response,
     search_term: str = Query(default="software developer", description="Job search term"),
     location: str = Query(default="India", description="Job location"),
-    pages: int = Query(default=2, description="Number of pages to scrape", ge=1, le=5)
+    pages: int = Query(default=2, description="Number of pages to scrape", ge=1, le=5),
+    max_staleness: int = Query(default=900, ge=0, description="Max age (seconds) of stored jobs before a synchronous refresh"),
+    limit: int = Query(default=100, ge=1, le=500, description="Jobs per page"),
+    after: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    city: Optional[str] = Query(default=None, description="Only jobs in this city / state (Bengaluru == Bangalore)"),
+    job_type: Optional[str] = Query(default=None, description="e.g. Full-time"),
+    source: Optional[str] = Query(default=None, description="e.g. naukri"),
+    remote_friendly: Optional[bool] = Query(default=None),
+    skills: Optional[List[str]] = Query(default=None, description="Jobs listing all of these skills"),
+    posted_within_days: Optional[int] = Query(default=None, ge=0, description="Jobs first seen within this many days"),
 ):
+    store: JobStore = app.state.job_store
+    scheduler: RefreshScheduler = app.state.refresh_scheduler
+    query = JobStore.query_key(search_term, location)
+    filters = JobFilters(city, job_type, source, remote_friendly, skills, posted_within_days)
+    if after:
+        try:
+            decode_cursor(after)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    next_cursor = None
     try:
-        all_jobs = []
         source_breakdown = {}
-
-        # Use Naukri scraper for real job data
+        last_updated = await store.last_refreshed(query, scheduler.sources)
+        # Only the first page may trigger a refresh; later pages continue the same listing
+        stale = last_updated is None or (datetime.utcnow() - last_updated).total_seconds() > max_staleness
+        if stale and not after:
+            source_breakdown = _breakdown(await _cached_scrape(search_term, location, pages, scheduler.sources))
+            last_updated = await store.last_refreshed(query, scheduler.sources) or datetime.utcnow()
+        stored_jobs, next_cursor = await store.find_jobs(query, filters, limit, after)
+    except Exception as e:
+        # Store unavailable: scrape directly so the endpoint keeps working (first page only)
+        print(f"Job store error, scraping directly: {e}")
         try:
-            naukri_jobs = naukri_scraper.scrape_jobs(search_term, location, pages)
-            all_jobs.extend(naukri_jobs)
-            source_breakdown["naukri"] = len(naukri_jobs)
+            results = await _cached_scrape(search_term, location, pages, scheduler.sources)
+            source_breakdown = _breakdown(results)
+            stored_jobs = [job for jobs, status in results.values() if status == "ok" for job in jobs]
+            stored_jobs = data_processor.filter_jobs(stored_jobs, filters=filters)[:limit]
+            last_updated = datetime.utcnow()
         except Exception as e:
-            print(f"Error with Naukri scraper: {e}")
-            source_breakdown["naukri"] = 0
+            raise HTTPException(status_code=500, detail=f"Error scraping jobs: {str(e)}")
 
-        # Use RemoteOnly scraper for remote jobs
-        try:
-            remote_jobs = remoteonly_scraper.scrape_jobs(search_term=search_term, location="remote", pages=1)
-            all_jobs.extend(remote_jobs)
-            source_breakdown["remoteonly"] = len(remote_jobs)
-        except Exception as e:
-            print(f"Error with RemoteOnly scraper: {e}")
-            source_breakdown["remoteonly"] = 0
+    # Remove exact and cross-source near duplicates (within this page)
+    unique_jobs = data_processor.remove_near_duplicates(stored_jobs)
 
-        # Use PlacementIndia scraper (lightweight requests-based)
-        try:
-            pi_jobs = placementindia_scraper.scrape_jobs(search_term=search_term, location=location, pages=1)
-            all_jobs.extend(pi_jobs)
-            source_breakdown["placementindia"] = len(pi_jobs)
-        except Exception as e:
-            print(f"Error with PlacementIndia scraper: {e}")
-            source_breakdown["placementindia"] = 0
+    counts = {}
+    for job in unique_jobs:
+        counts[job.source.lower()] = counts.get(job.source.lower(), 0) + 1
+    for name in scheduler.sources:
+        # Keep "timeout" markers from a synchronous refresh; otherwise report served counts
+        if source_breakdown.get(name) != "timeout":
+            source_breakdown[name] = counts.get(name, 0)
 
-        # Use Shine scraper (homepage domain carousels)
-        try:
-            shine_jobs = shine_scraper.scrape_jobs(search_term=search_term, location=location, pages=1)
-            all_jobs.extend(shine_jobs)
-            source_breakdown["shine"] = len(shine_jobs)
-        except Exception as e:
-            print(f"Error with Shine scraper: {e}")
-            source_breakdown["shine"] = 0
+    # Job ids are stable, so an unchanged listing has an unchanged ETag
+    etag = listing_etag(unique_jobs)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    return JobResponse(
+        jobs=unique_jobs,
+        total_count=len(unique_jobs),
+        source_breakdown=source_breakdown,
+        last_updated=last_updated,
+        next_cursor=next_cursor,
+    )
 
-        # Remove duplicates
-        unique_jobs = data_processor.remove_duplicates(all_jobs)
+def _stream_frame(event: str, data: dict, sse: bool) -> str:
+    if sse:
+        return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+    return json.dumps({"type": event, **data}, default=str) + "\n"
 
-        return JobResponse(
-            jobs=unique_jobs,
-            total_count=len(unique_jobs),
-            source_breakdown=source_breakdown,
-            last_updated=datetime.now()
-        )
+@app.get("/api/jobs/stream")
+async def stream_jobs(
+    search_term: str = Query(default="software developer", description="Job search term"),
+    location: str = Query(default="India", description="Job location"),
+    pages: int = Query(default=2, description="Number of pages to scrape", ge=1, le=5),
+    format: str = Query(default="ndjson", pattern="^(ndjson|sse)$", description="ndjson or sse"),
+):
+    """Scrape every source and stream jobs as each one finishes.
+
+    Frames: one "jobs" frame per source (already-sent duplicates removed), a
+    "source_status" frame for sources that time out or fail, then a final
+    "summary" frame with total_count / source_breakdown / last_updated.
+    """
+    sse = format == "sse"
+    store: Optional[JobStore] = getattr(app.state, "job_store", None)
+    query = JobStore.query_key(search_term, location)
+
+    async def frames():
+        deduper = data_processor.stream_deduper()
+        source_breakdown = {}
+        total = 0
+        async for source, jobs, status in scrape_fanout.iter_sources(_source_tasks(search_term, location, pages)):
+            if status != "ok":
+                source_breakdown[source] = status
+                yield _stream_frame("source_status", {"source": source, "status": status}, sse)
+                continue
+            if store is not None:
+                try:
+                    await store.upsert_jobs(source, query, jobs)
+                except Exception as e:
+                    print(f"Job store error while streaming {source}: {e}")
+            fresh = deduper.filter(jobs)
+            source_breakdown[source] = len(fresh)
+            total += len(fresh)
+            yield _stream_frame("jobs", {"source": source, "jobs": [job.model_dump(mode="json") for job in fresh]}, sse)
+        yield _stream_frame("summary", {
+            "total_count": total,
+            "source_breakdown": source_breakdown,
+            "last_updated": datetime.utcnow().isoformat(),
+        }, sse)
+
+    media_type = "text/event-stream" if sse else "application/x-ndjson"
+    return StreamingResponse(frames(), media_type=media_type, headers={"Cache-Control": "no-cache"})
 
+@app.get("/api/jobs/search", response_model=JobSearchResponse)
+async def search_jobs(
+    q: str = Query(..., min_length=1, description="Words to search in title, skills, company and description"),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0, le=1000),
+    city: Optional[str] = Query(default=None, description="Only jobs in this city / state (Bengaluru == Bangalore)"),
+    job_type: Optional[str] = Query(default=None, description="e.g. Full-time"),
+    source: Optional[str] = Query(default=None, description="e.g. naukri"),
+    remote_friendly: Optional[bool] = Query(default=None),
+    skills: Optional[List[str]] = Query(default=None, description="Jobs listing all of these skills"),
+    posted_within_days: Optional[int] = Query(default=None, ge=0, description="Jobs first seen within this many days"),
+):
+    """Ranked search over every stored job; never scrapes."""
+    store: JobStore = app.state.job_store
+    filters = JobFilters(city, job_type, source, remote_friendly, skills, posted_within_days)
+    try:
+        results = await store.search_jobs(q, filters, limit, offset)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error scraping jobs: {str(e)}")
+        raise HTTPException(status_code=503, detail=f"Job search unavailable: {str(e)}")
+
+    scored = [ScoredJob(**job.model_dump(), score=score) for job, score in results]
+    unique_jobs = data_processor.remove_near_duplicates(scored)
+    return JobSearchResponse(
+        query=q,
+        jobs=unique_jobs,
+        total_count=len(unique_jobs),
+        next_offset=offset + limit if len(results) == limit else None,
+    )
 
 @app.get("/api/health")
 async def health_check():
+    # Per-source circuit breaker state: closed (healthy), open (failing fast) or half_open
     return {
         "status": "healthy",
         "timestamp": datetime.now(),
         "scrapers": {
-            "naukri": "active",
-            "remoteonly": "active",
-            "placementindia": "active",
-            "shine": "active"
-        }
+            source: scraper.breaker.snapshot()
+            for source, scraper in scrapers_by_source.items()
+        },
+        "driver_pool": get_driver_pool().stats(),
+        "scrape_cache": app.state.scrape_cache.stats() if hasattr(app.state, "scrape_cache") else None,
+        "resume_parser": resume_parser_stats(),
+        "gemini": gemini_stats(),
+        "job_index": app.state.job_index.stats() if hasattr(app.state, "job_index") else None,
+        "recommendation_cache": app.state.recommendation_cache.stats() if hasattr(app.state, "recommendation_cache") else None,
     }
 
 if __name__ == "__main__":
@@ -26,4 +26,16 @@ class JobResponse(BaseModel):
     jobs: List[Job]
     total_count: int
     source_breakdown: dict
-    last_updated: datetime
\ No newline at end of file
+    last_updated: datetime
+    # Pass as `after` to get the next page; None on the last page
+    next_cursor: Optional[str] = None
+
+class ScoredJob(Job):
+    score: float
+
+class JobSearchResponse(BaseModel):
+    query: str
+    jobs: List[ScoredJob]
+    total_count: int
+    # Pass as `offset` for the next page of results; None when there are no more
+    next_offset: Optional[int] = None
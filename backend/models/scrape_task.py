@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class ScrapeTaskCreate(BaseModel):
+    """Scrape request for the worker queue; sources defaults to every source."""
+    search_term: str = "software developer"
+    location: str = "India"
+    pages: int = Field(default=1, ge=1, le=5)
+    sources: Optional[List[str]] = None
+
+
+class ScrapeTaskPublic(BaseModel):
+    id: str
+    status: str
+    search_term: str
+    location: str
+    pages: int
+    sources: List[str]
+    attempts: int = 0
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    worker_id: Optional[str] = None
+    source_breakdown: Optional[dict] = None
+    error: Optional[str] = None
+
+
+def scrape_task_doc_to_public(doc: dict) -> ScrapeTaskPublic:
+    return ScrapeTaskPublic(
+        id=str(doc.get("_id")),
+        status=doc.get("status"),
+        search_term=doc.get("search_term"),
+        location=doc.get("location"),
+        pages=doc.get("pages", 1),
+        sources=doc.get("sources") or [],
+        attempts=doc.get("attempts", 0),
+        created_at=doc.get("created_at"),
+        started_at=doc.get("started_at"),
+        finished_at=doc.get("finished_at"),
+        worker_id=doc.get("worker_id"),
+        source_breakdown=doc.get("source_breakdown"),
+        error=doc.get("error"),
+    )
@@ -3,6 +3,7 @@ from typing import List
 from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, Request
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
 
 from models.application import ApplicationCreate, ApplicationPublic, application_doc_to_public
 from utils.auth import get_current_user_id
@@ -45,7 +46,12 @@ async def create_application(
         "experience_required": payload.experience_required,
         "skills": payload.skills,
     }
-    result = await db.applications.insert_one(doc)
+    try:
+        result = await db.applications.insert_one(doc)
+    except DuplicateKeyError:
+        # Concurrent request for the same user+job won the insert
+        existing = await db.applications.find_one({"user_id": ObjectId(user_id), "job_id": payload.job_id})
+        return application_doc_to_public(existing)
     doc["_id"] = result.inserted_id
     return application_doc_to_public(doc)
 
@@ -1,16 +1,40 @@
 from fastapi import APIRouter, File, UploadFile, HTTPException
-from typing import List, Optional, Dict
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Dict, Tuple
 import re
+import json
+import time
+import zipfile
 from io import BytesIO
+from contextlib import asynccontextmanager
+from utils.skills import find_skills
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import asyncio
 import threading
-import tempfile
-import subprocess
 import shutil
+import resource
 import os
 
-# Lazy-loaded NLP model (spaCy) to avoid startup cost; thread-safe init
+# NLP model (spaCy), loaded inside the parser pool's worker processes, never in
+# the API process: when each worker starts (RESUME_NLP_PRELOAD=1, the default,
+# with a warm-up inference) or lazily on first use. Name extraction only needs
+# NER, so the other pipeline components are excluded at load time.
+NLP_MODELS = [os.getenv("RESUME_NLP_MODEL", "en_core_web_sm"), "en_core_web_md"]
+NLP_EXCLUDE = ["tagger", "parser", "lemmatizer", "attribute_ruler", "senter"]
 _nlp = None
 _nlp_lock = threading.Lock()
+_nlp_info: Dict = {}  # load diagnostics of this process
+
+# Text extraction (pypdf fallback) and name extraction are CPU-bound, so they
+# run in a small process pool; at most RESUME_MAX_CONCURRENCY uploads are
+# parsed at once and the rest wait (resume_parser_stats reports how many).
+PDFTOTEXT_TIMEOUT = 20
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+MAX_CONCURRENCY = int(os.getenv("RESUME_MAX_CONCURRENCY", "4"))
+_slots = asyncio.Semaphore(MAX_CONCURRENCY)
+_stats = {"waiting": 0, "active": 0, "parsed": 0, "failed": 0}
 
 router = APIRouter(prefix="/api", tags=["resume"])
 
@@ -26,54 +50,67 @@ def _extract_phone(text: str):
     return m.group(0) if m else None
 
 
-def _find_skills(text: str, keywords: List[str]):
-    found = []
-    lower = text.lower()
-    for k in keywords:
-        if k.lower() in lower:
-            found.append(k)
-    return found
-
-
 def _load_nlp():
     global _nlp
-    if _nlp is not None:
+    if _nlp is not None or _nlp_info:
         return _nlp
     with _nlp_lock:
-        if _nlp is not None:
+        if _nlp is not None or _nlp_info:
             return _nlp
+        started = time.monotonic()
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
         try:
             import spacy  # type: ignore
-            try:
-                _nlp = spacy.load("en_core_web_sm")
-            except Exception:
-                # Attempt alternative small model name or raise; fallback to None
+            for model in NLP_MODELS:
+                # Attempt alternative model names; fallback to None
                 try:
-                    _nlp = spacy.load("en_core_web_md")
+                    _nlp = spacy.load(model, exclude=NLP_EXCLUDE)
+                    _nlp_info["model"] = model
+                    break
                 except Exception:
-                    _nlp = None
-        except Exception:
-            _nlp = None
+                    continue
+        except Exception as e:
+            _nlp_info["error"] = str(e)
+        _nlp_info.update({
+            "loaded": _nlp is not None,
+            "pipeline": list(_nlp.pipe_names) if _nlp is not None else [],
+            "load_seconds": round(time.monotonic() - started, 3),
+            # ru_maxrss is in KiB on Linux
+            "load_rss_mb": round((resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024, 1),
+        })
     return _nlp
 
 
-def _extract_name(text: str) -> Optional[str]:
-    if not text:
-        return None
+def _init_parser_process():
+    """Pool initializer: load the model and run one inference so the first resume is fast."""
     nlp = _load_nlp()
-    if nlp:
-        try:
-            doc = nlp(text[:5000])  # examine first part only for speed
-            # Prefer PERSON entities; choose longest token span
-            persons = [ent.text.strip() for ent in doc.ents if ent.label_ == "PERSON"]
-            if persons:
-                # Heuristic: return the first with <=4 words and contains at least one space
-                for p in persons:
-                    if 2 <= len(p.split()) <= 4:
-                        return p
-                return persons[0]
-        except Exception:
-            pass
+    if nlp is not None:
+        started = time.monotonic()
+        nlp("Priya Sharma is a software engineer at Infosys in Bangalore.")
+        _nlp_info["warmup_seconds"] = round(time.monotonic() - started, 3)
+
+
+def _parser_process_info() -> Dict:
+    return {
+        "pid": os.getpid(),
+        "rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        **_nlp_info,
+    }
+
+
+def _name_from_doc(doc) -> Optional[str]:
+    # Prefer PERSON entities; choose longest token span
+    persons = [ent.text.strip() for ent in doc.ents if ent.label_ == "PERSON"]
+    if persons:
+        # Heuristic: return the first with <=4 words and contains at least one space
+        for p in persons:
+            if 2 <= len(p.split()) <= 4:
+                return p
+        return persons[0]
+    return None
+
+
+def _name_from_lines(text: str) -> Optional[str]:
     # Fallback heuristic: first line with 2-3 capitalized words
     for line in text.splitlines():
         tokens = line.strip().split()
@@ -84,6 +121,33 @@ def _extract_name(text: str) -> Optional[str]:
     return None
 
 
+def _extract_name(text: str) -> Optional[str]:
+    if not text:
+        return None
+    nlp = _load_nlp()
+    if nlp:
+        try:
+            name = _name_from_doc(nlp(text[:5000]))  # examine first part only for speed
+            if name:
+                return name
+        except Exception:
+            pass
+    return _name_from_lines(text)
+
+
+def _extract_names(texts: List[str]) -> List[Optional[str]]:
+    """_extract_name for a batch: one nlp.pipe pass instead of an nlp() call per resume."""
+    names: List[Optional[str]] = [None] * len(texts)
+    nlp = _load_nlp()
+    if nlp:
+        try:
+            for i, doc in enumerate(nlp.pipe([t[:5000] for t in texts], batch_size=len(texts))):
+                names[i] = _name_from_doc(doc)
+        except Exception:
+            pass
+    return [name or _name_from_lines(text) for name, text in zip(names, texts)]
+
+
 def _extract_sections(text: str) -> Dict[str, List[str]]:
     """Heuristically extract Education and Experience sections.
     Looks for heading lines (case-insensitive) and captures subsequent non-empty lines
@@ -148,6 +212,103 @@ def _extract_sections(text: str) -> Dict[str, List[str]]:
     return sections
 
 
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            preload = os.getenv("RESUME_NLP_PRELOAD", "1") == "1"
+            _pool = ProcessPoolExecutor(
+                max_workers=_pool_size(),
+                initializer=_init_parser_process if preload else None,
+                # Not fork: a forked child would inherit the API process's
+                # running event loop, Mongo client and their threads' locks
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _pool_size() -> int:
+    return int(os.getenv("RESUME_PARSER_PROCESSES", "2"))
+
+
+def preload_resume_parser():
+    """Startup hook: start the parser processes now so they load spaCy before the first upload."""
+    if os.getenv("RESUME_NLP_PRELOAD", "1") != "1":
+        return
+    pool = _get_pool()
+    for _ in range(_pool_size()):
+        pool.submit(_parser_process_info)
+
+
+def shutdown_resume_parser():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def resume_parser_stats() -> Dict[str, int]:
+    # waiting: uploads queued for a parse slot; active: being parsed right now
+    return dict(_stats)
+
+
+async def _pdftotext(content: bytes) -> Optional[str]:
+    """Pipe the PDF through pdftotext (stdin -> stdout) without blocking the loop."""
+    if not shutil.which("pdftotext"):
+        return None
+    proc = await asyncio.create_subprocess_exec(
+        "pdftotext", "-enc", "UTF-8", "-", "-",
+        stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(content), timeout=PDFTOTEXT_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+    if proc.returncode == 0 and stdout:
+        return stdout.decode("utf-8", errors="ignore")
+    return None
+
+
+def _pypdf_text(content: bytes) -> Optional[str]:
+    try:
+        from pypdf import PdfReader  # type: ignore
+        reader = PdfReader(BytesIO(content))
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+    except Exception:
+        return None
+
+
+async def _extract_text(content: bytes) -> Optional[str]:
+    text = None
+    try:
+        text = await _pdftotext(content)
+    except Exception:
+        pass
+    if not text or len(text.strip()) < 20:
+        # In-process fallback (pinned pypdf), in the pool since it is CPU-bound
+        text = await asyncio.get_running_loop().run_in_executor(_get_pool(), _pypdf_text, content)
+    return text
+
+
+@asynccontextmanager
+async def _parse_slot():
+    """Hold one of the RESUME_MAX_CONCURRENCY parse slots, counted in _stats."""
+    _stats["waiting"] += 1
+    try:
+        await _slots.acquire()
+    finally:
+        _stats["waiting"] -= 1
+    _stats["active"] += 1
+    try:
+        yield
+    finally:
+        _stats["active"] -= 1
+        _slots.release()
+
+
 @router.post("/parse-resume")
 async def parse_resume(file: UploadFile = File(...)):
     if not file.filename:
@@ -157,71 +318,33 @@ async def parse_resume(file: UploadFile = File(...)):
     if not content:
         raise HTTPException(status_code=400, detail="Uploaded file is empty")
 
-    text = None  # <-- IMPORTANT: do NOT try utf-8 decode
+    async with _parse_slot():
+        text = await _extract_text(content)  # <-- IMPORTANT: do NOT try utf-8 decode
 
-    # Always use pdftotext first
-    if shutil.which("pdftotext"):
-        tmp_path = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmpf:
-                tmpf.write(content)
-                tmpf.flush()
-                tmp_path = tmpf.name
+        # If STILL nothing (rare), fallback
+        if not text or len(text.strip()) < 20:
+            _stats["failed"] += 1
+            raise HTTPException(400, "Failed to extract text")
 
-            cmds = [
-                ["pdftotext", "-enc", "UTF-8", tmp_path, "-"],
-                ["pdftotext", tmp_path, "-"],
-            ]
-
-            for cmd in cmds:
-                try:
-                    res = subprocess.run(
-                        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=20
-                    )
-                    if res.returncode == 0 and res.stdout:
-                        text = res.stdout.decode("utf-8", errors="ignore")
-                        break
-                except:
-                    continue
+        name = await asyncio.get_running_loop().run_in_executor(_get_pool(), _extract_name, text)
+        _stats["parsed"] += 1
 
-        finally:
-            if tmp_path:
-                try:
-                    os.remove(tmp_path)
-                except:
-                    pass
+    return _build_result(file.filename, len(content), text, name)
 
-    # If STILL nothing (rare), fallback
-    if not text or len(text.strip()) < 20:
-        raise HTTPException(400, "Failed to extract text")
 
+def _build_result(filename: str, size: int, text: str, name: Optional[str]) -> dict:
     # Basic parsing heuristics
     email = _extract_email(text or "")
     phone = _extract_phone(text or "")
-    name = _extract_name(text or "")
-
-    # simple skills keyword scan
-    keywords = [
-        "Python",
-        "Dart",
-        "Flutter",
-        "Java",
-        "JavaScript",
-        "React",
-        "Node",
-        "SQL",
-        "MongoDB",
-        "AWS",
-        "Docker",
-        "Kubernetes",
-    ]
-    skills = _find_skills(text or "", keywords)
+
+    # Shared skill taxonomy (utils.skills), single pass over the text
+    skills = find_skills(text or "")
 
     sections = _extract_sections(text or "")
 
     result = {
-        "filename": file.filename,
-        "size": len(content),
+        "filename": filename,
+        "size": size,
         "email": email,
         "phone": phone,
         "name": name,
@@ -232,3 +355,161 @@ async def parse_resume(file: UploadFile = File(...)):
     }
 
     return result
+
+
+@router.get("/parse-resume/diagnostics")
+async def parse_resume_diagnostics():
+    """spaCy load time / memory / pipeline per parser process, plus queue stats."""
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    answers = await asyncio.gather(
+        *[loop.run_in_executor(pool, _parser_process_info) for _ in range(_pool_size())],
+        return_exceptions=True,
+    )
+    processes = {a["pid"]: a for a in answers if isinstance(a, dict)}
+    return {
+        "preload": os.getenv("RESUME_NLP_PRELOAD", "1") == "1",
+        "excluded_components": NLP_EXCLUDE,
+        "processes": list(processes.values()),
+        "stats": resume_parser_stats(),
+    }
+
+
+def _unpack_uploads(
+    uploads: List[Tuple[str, bytes]], max_files: int, max_member_bytes: int, max_total_bytes: int
+) -> List[Tuple[str, bytes]]:
+    """Expand .zip uploads into their PDF members; other files pass through.
+
+    Blocking (decompression), so run it in an executor. Sizes are checked from
+    the zip headers before anything is inflated (zipfile never reads past the
+    declared size), and expansion stops one file past `max_files`.
+    """
+    files: List[Tuple[str, bytes]] = []
+    total = 0
+    for filename, content in uploads:
+        if len(files) > max_files:
+            break
+        if not filename.lower().endswith(".zip"):
+            files.append((filename, content))
+            total += len(content)
+            continue
+        try:
+            with zipfile.ZipFile(BytesIO(content)) as archive:
+                for member in archive.infolist():
+                    if len(files) > max_files:
+                        break
+                    if member.is_dir() or not member.filename.lower().endswith(".pdf"):
+                        continue
+                    name = f"{filename}/{member.filename}"
+                    if member.file_size > max_member_bytes:
+                        raise HTTPException(status_code=413, detail=f"{name} is larger than {max_member_bytes // 2**20} MB")
+                    total += member.file_size
+                    if total > max_total_bytes:
+                        raise HTTPException(status_code=413, detail=f"Batch expands to more than {max_total_bytes // 2**20} MB")
+                    files.append((name, archive.read(member)))
+        except zipfile.BadZipFile:
+            files.append((filename, b""))
+    return files
+
+
+@router.post("/parse-resumes")
+async def parse_resumes(files: List[UploadFile] = File(...)):
+    """Parse many resumes (PDFs and/or zips of PDFs) and stream one NDJSON line per file.
+
+    Text extraction runs concurrently; names are extracted in batches of
+    RESUME_BATCH_SIZE with a single nlp.pipe pass per batch in the parser pool.
+    Both share the RESUME_MAX_CONCURRENCY slots with /api/parse-resume.
+    Lines are {"type": "resume", ...parse-resume fields} or {"type": "error",
+    "filename", "detail"}, in completion order, then a "summary" line with
+    resumes_per_second.
+    """
+    max_files = int(os.getenv("RESUME_BATCH_MAX_FILES", "200"))
+    raw = [(f.filename or "", await f.read()) for f in files]
+    uploads = await asyncio.get_running_loop().run_in_executor(
+        None,
+        _unpack_uploads,
+        raw,
+        max_files,
+        int(os.getenv("RESUME_ZIP_MEMBER_MAX_MB", "10")) * 2**20,
+        int(os.getenv("RESUME_BATCH_MAX_MB", "200")) * 2**20,
+    )
+    if not uploads:
+        raise HTTPException(status_code=400, detail="No files uploaded")
+    if len(uploads) > max_files:
+        raise HTTPException(status_code=413, detail=f"At most {max_files} resumes per batch")
+
+    batch_size = int(os.getenv("RESUME_BATCH_SIZE", "16"))
+
+    async def extract(filename: str, content: bytes):
+        async with _parse_slot():
+            text = await _extract_text(content) if content else None
+        return filename, len(content), text
+
+    async def parse_batch(batch):
+        async with _parse_slot():
+            names = await asyncio.get_running_loop().run_in_executor(
+                _get_pool(), _extract_names, [text for _, _, text in batch]
+            )
+        return [_build_result(filename, size, text, name) for (filename, size, text), name in zip(batch, names)]
+
+    def line(data: dict) -> str:
+        return json.dumps(data, default=str) + "\n"
+
+    async def results():
+        started = time.monotonic()
+        parsed = 0
+        queued = iter(uploads)
+        extracts = set()
+        batches = set()
+        pending = []
+
+        def refill():
+            # Only as many extractions as there are slots, so a full batch
+            # queues for the next free slot instead of behind every file
+            for filename, content in queued:
+                extracts.add(asyncio.create_task(extract(filename, content)))
+                if len(extracts) >= MAX_CONCURRENCY:
+                    break
+
+        try:
+            refill()
+            # One wait over both kinds of task, so each batch's resumes are
+            # sent as soon as it finishes while other files are still extracting
+            while extracts or batches:
+                done, _ = await asyncio.wait(extracts | batches, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task in batches:
+                        batches.discard(task)
+                        for result in task.result():
+                            parsed += 1
+                            _stats["parsed"] += 1
+                            yield line({"type": "resume", **result})
+                        continue
+                    extracts.discard(task)
+                    filename, size, text = task.result()
+                    if not text or len(text.strip()) < 20:
+                        _stats["failed"] += 1
+                        yield line({"type": "error", "filename": filename, "detail": "Failed to extract text"})
+                        continue
+                    pending.append((filename, size, text))
+                    if len(pending) >= batch_size:
+                        batches.add(asyncio.create_task(parse_batch(pending)))
+                        pending = []
+                refill()
+                if pending and not extracts:
+                    batches.add(asyncio.create_task(parse_batch(pending)))
+                    pending = []
+        finally:
+            # Client went away mid-batch
+            for task in extracts | batches:
+                task.cancel()
+        elapsed = time.monotonic() - started
+        yield line({
+            "type": "summary",
+            "files": len(uploads),
+            "parsed": parsed,
+            "seconds": round(elapsed, 3),
+            "resumes_per_second": round(parsed / elapsed, 2) if elapsed else None,
+        })
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
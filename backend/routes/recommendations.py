@@ -4,16 +4,28 @@
 Expected request JSON:
 {
   "resume_data": { ... },
-  "jobs": [ { Job model dict }, ... ],
+  "jobs": [ { Job model dict }, ... ],   (optional)
   "max_recommendations": 5
 }
 
 Returns JobResponse with top N jobs.
+
+Every job is scored locally (utils.ranking); Gemini, when enabled, only
+reorders the best RECOMMEND_RERANK_TOP_K of them.
+
+Without `jobs`, candidates are the RECOMMEND_CANDIDATES stored jobs nearest
+to the resume in the job vector index (utils.vector_index).
+
+Results are cached per resume and candidate-job version
+(utils.recommendation_cache), so repeating a request skips Gemini.
+
+POST /api/recommendations/batch takes several resumes against one job pool;
+concurrent reranks (from either endpoint) are packed into shared prompts.
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any
-import os, json, re
+from typing import List, Dict, Any, Optional
+import asyncio, functools, os, json, re
 from dotenv import load_dotenv
 
 # Ensure .env is loaded (in case main didn't run first in certain execution contexts)
@@ -21,6 +33,9 @@ load_dotenv()
 from datetime import datetime
 
 from models.job import Job, JobResponse
+from utils.ranking import JobMatrix, rank_jobs, resume_terms
+from utils.recommendation_cache import job_set_version
+from utils.vector_index import embed_terms
 
 router = APIRouter()
 
@@ -28,6 +43,28 @@ class RecommendationRequest(BaseModel):
     resume_data: Dict[str, Any]
     jobs: List[Job] = Field(default_factory=list)
     max_recommendations: int = 5
+    # Let Gemini rerank the local top-K; defaults to on when GEMINI_API_KEY is set
+    use_llm: Optional[bool] = None
+
+class BatchRecommendationItem(BaseModel):
+    user_id: Optional[str] = None
+    resume_data: Dict[str, Any]
+    max_recommendations: int = 5
+
+class BatchRecommendationRequest(BaseModel):
+    requests: List[BatchRecommendationItem]
+    # Shared job pool; empty means candidates from the job vector index per resume
+    jobs: List[Job] = Field(default_factory=list)
+    use_llm: Optional[bool] = None
+
+class UserRecommendations(JobResponse):
+    user_id: Optional[str] = None
+    # Set (with no jobs) when this item failed; the rest of the batch is unaffected
+    error: Optional[str] = None
+
+class BatchRecommendationResponse(BaseModel):
+    # Same order as the request's `requests`
+    results: List[UserRecommendations]
 
 """Gemini model selection.
 
@@ -38,6 +75,26 @@ we will try both.
 """
 GEMINI_MODEL = "gemini-2.5-flash"
 
+# How many locally ranked jobs Gemini gets to reorder
+RERANK_TOP_K = int(os.getenv("RECOMMEND_RERANK_TOP_K", "20"))
+# Stored jobs pulled from the vector index when the request has no `jobs`
+CANDIDATES = int(os.getenv("RECOMMEND_CANDIDATES", "200"))
+
+# Gemini calls are bounded: GEMINI_TIMEOUT_SECONDS covers queueing plus the call,
+# at most GEMINI_MAX_CONCURRENCY run at once (size it to the quota) and past
+# GEMINI_MAX_WAITING queued requests we don't queue at all. Either way the
+# request falls back to the local ranking.
+GEMINI_TIMEOUT = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "8"))
+GEMINI_MAX_WAITING = int(os.getenv("GEMINI_MAX_WAITING", "16"))
+_gemini_slots = asyncio.Semaphore(int(os.getenv("GEMINI_MAX_CONCURRENCY", "4")))
+_gemini_stats = {"waiting": 0, "active": 0, "ok": 0, "timeouts": 0, "rejected": 0, "errors": 0, "batched": 0}
+
+# Reranks arriving within GEMINI_BATCH_WINDOW_MS of each other share one packed
+# prompt (up to GEMINI_BATCH_SIZE resumes); 0 disables batching
+GEMINI_BATCH_WINDOW = float(os.getenv("GEMINI_BATCH_WINDOW_MS", "50")) / 1000
+GEMINI_BATCH_SIZE = int(os.getenv("GEMINI_BATCH_SIZE", "8"))
+MAX_BATCH_REQUESTS = int(os.getenv("RECOMMEND_MAX_BATCH_REQUESTS", "50"))
+
 # Lazy init for Gemini v1 client
 _gen_client = None
 
@@ -54,83 +111,355 @@ def _get_gemini_client():
     except Exception as e:
         raise RuntimeError(f"Gemini init failed: {e}")
 
-@router.post("/api/recommendations", response_model=JobResponse)
-async def recommend_jobs(payload: RecommendationRequest):
-    if not payload.jobs:
-        raise HTTPException(status_code=400, detail="No jobs provided")
-    if not payload.resume_data:
-        raise HTTPException(status_code=400, detail="No resume_data provided")
+def gemini_stats() -> Dict[str, int]:
+    # waiting: requests queued for a Gemini slot; active: calls in flight
+    return dict(_gemini_stats)
+
+
+def _start_generate(prompt: str):
+    """Start a Gemini call; returns (awaitable, whether cancelling it stops the call)."""
+    client = _get_gemini_client()
+    # Use the single model specified by GEMINI_MODEL (gemini-2.5-flash)
+    aio = getattr(client, "aio", None)
+    if aio is not None:
+        return asyncio.ensure_future(aio.models.generate_content(model=GEMINI_MODEL, contents=prompt)), True
+    # Sync client: run it in a thread, which keeps its slot until it returns
+    call = asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(client.models.generate_content, model=GEMINI_MODEL, contents=prompt)
+    )
+    return call, False
 
-    max_n = max(1, min(payload.max_recommendations, 10))
-
-    # Build condensed job list for prompt (avoid very long descriptions)
-    compact_jobs = []
-    for j in payload.jobs[:100]:  # safety cap
-        compact_jobs.append({
-            "job_id": j.job_id,
-            "title": j.job_title,
-            "company": j.company_name,
-            "skills": j.skills[:8],
-            "experience": j.experience_required,
-            "location": j.location,
-            "description": j.job_description[:180],
-        })
 
-    resume_summary = {
-        k: payload.resume_data.get(k)
+class _GeminiQueueFull(Exception):
+    pass
+
+
+async def _generate(prompt: str) -> str:
+    # Checked and counted with no await in between, so concurrent requests see each other
+    if _gemini_stats["waiting"] >= GEMINI_MAX_WAITING:
+        raise _GeminiQueueFull()
+    _gemini_stats["waiting"] += 1
+    try:
+        await _gemini_slots.acquire()
+    finally:
+        _gemini_stats["waiting"] -= 1
+    try:
+        call, interruptible = _start_generate(prompt)
+    except BaseException:
+        _gemini_slots.release()
+        raise
+    _gemini_stats["active"] += 1
+
+    def release(_):
+        _gemini_stats["active"] -= 1
+        _gemini_slots.release()
+
+    call.add_done_callback(release)
+    try:
+        response = await asyncio.shield(call)
+    except asyncio.CancelledError:
+        if interruptible:
+            call.cancel()
+        raise
+    return getattr(response, 'text', '') or ''
+
+
+def _compact_job(j: Job) -> Dict[str, Any]:
+    # Condensed job for the prompt (avoid very long descriptions)
+    return {
+        "job_id": j.job_id,
+        "title": j.job_title,
+        "company": j.company_name,
+        "skills": j.skills[:8],
+        "experience": j.experience_required,
+        "location": j.location,
+        "description": j.job_description[:180],
+    }
+
+
+def _resume_summary(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        k: resume_data.get(k)
         for k in ["name", "email", "phone", "skills", "education", "experience"]
-        if k in payload.resume_data
+        if k in resume_data
     }
 
-    prompt = (
+
+def _single_prompt(resume_data: Dict[str, Any], jobs: List[Job], max_n: int) -> str:
+    compact_jobs = [_compact_job(j) for j in jobs]
+    return (
         "You are a job matching engine. Given a resume summary and a list of jobs, "
         "return EXACT JSON: {\"recommended_job_ids\": [\"id1\", ...]} containing up to "
         f"{max_n} best matching job_ids. Prefer strong skill overlap, appropriate experience, and location fit. "
         "Do not include explanations, ONLY valid JSON.\n\n"
-        f"Resume: {json.dumps(resume_summary)}\nJobs: {json.dumps(compact_jobs)}"
+        f"Resume: {json.dumps(_resume_summary(resume_data))}\nJobs: {json.dumps(compact_jobs)}"
     )
 
-    recommended_ids: List[str] = []
+
+def _parse_single(text: str) -> List[str]:
+    # Extract JSON block
+    match = re.search(r"\{[^{}]*recommended_job_ids[^{}]*\}", text, re.IGNORECASE)
+    if match:
+        block = match.group(0)
+        try:
+            parsed = json.loads(block)
+            ids = parsed.get("recommended_job_ids", [])
+            if isinstance(ids, list):
+                return [str(i) for i in ids]
+        except Exception:
+            pass
+    return []
+
+
+def _packed_prompt(batch: List["_RerankItem"]) -> str:
+    """One prompt for several resumes: every job appears once, each resume
+    lists the ids of its own (locally pre-ranked) candidates."""
+    jobs: Dict[str, Dict[str, Any]] = {}
+    resumes = []
+    for n, item in enumerate(batch):
+        for j in item.jobs:
+            if j.job_id not in jobs:
+                jobs[j.job_id] = _compact_job(j)
+        resumes.append({
+            "resume_id": f"r{n}",
+            "max": item.max_n,
+            "candidates": [j.job_id for j in item.jobs],
+            "resume": _resume_summary(item.resume_data),
+        })
+    return (
+        "You are a job matching engine. Given several resume summaries and one shared list of jobs, "
+        "return EXACT JSON: {\"results\": {\"<resume_id>\": [\"job_id\", ...], ...}} with, for every resume, "
+        "up to its \"max\" best matching job_ids chosen from its \"candidates\". "
+        "Prefer strong skill overlap, appropriate experience, and location fit. "
+        "Do not include explanations, ONLY valid JSON.\n\n"
+        f"Jobs: {json.dumps(list(jobs.values()))}\nResumes: {json.dumps(resumes)}"
+    )
+
+
+def _parse_packed(text: str, size: int) -> List[List[str]]:
+    results: List[List[str]] = [[] for _ in range(size)]
+    # The answer nests objects, so take the outermost braces rather than a flat match
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end <= start:
+        return results
     try:
-        client = _get_gemini_client()
-        from google import genai  # ensure module available in runtime context
-        # Use the single model specified by GEMINI_MODEL (gemini-2.5-flash)
-        response = client.models.generate_content(model=GEMINI_MODEL, contents=prompt)
-        text = getattr(response, 'text', '') or ''
-        # Extract JSON block
-        match = re.search(r"\{[^{}]*recommended_job_ids[^{}]*\}", text, re.IGNORECASE)
-        if match:
-            block = match.group(0)
-            try:
-                parsed = json.loads(block)
-                ids = parsed.get("recommended_job_ids", [])
-                if isinstance(ids, list):
-                    recommended_ids = [str(i) for i in ids]
-            except Exception:
-                pass
+        parsed = json.loads(text[start:end + 1]).get("results", {})
+    except Exception:
+        return results
+    if not isinstance(parsed, dict):
+        return results
+    for n in range(size):
+        ids = parsed.get(f"r{n}")
+        if isinstance(ids, list):
+            results[n] = [str(i) for i in ids]
+    return results
+
+
+class _RerankItem:
+    __slots__ = ("resume_data", "jobs", "max_n", "future")
+
+    def __init__(self, resume_data: Dict[str, Any], jobs: List[Job], max_n: int, future: asyncio.Future):
+        self.resume_data = resume_data
+        self.jobs = jobs
+        self.max_n = max_n
+        self.future = future
+
+
+class _RerankBatcher:
+    """Collects rerank requests for GEMINI_BATCH_WINDOW_MS (or until
+    GEMINI_BATCH_SIZE are waiting) and sends them as one packed prompt, so
+    concurrent users sharing a job pool cost one call and one copy of the jobs."""
+
+    def __init__(self):
+        self._pending: List[_RerankItem] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: set = set()
+
+    async def rerank(self, resume_data: Dict[str, Any], jobs: List[Job], max_n: int) -> List[str]:
+        loop = asyncio.get_running_loop()
+        item = _RerankItem(resume_data, jobs, max_n, loop.create_future())
+        self._pending.append(item)
+        if len(self._pending) >= GEMINI_BATCH_SIZE:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(GEMINI_BATCH_WINDOW, self._flush)
+        # Shielded: one caller going away must not cancel the others' call
+        return await asyncio.shield(item.future)
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[_RerankItem]):
+        results: List[List[str]] = [[] for _ in batch]
+        try:
+            if len(batch) == 1:
+                item = batch[0]
+                results[0] = _parse_single(await _call_gemini(_single_prompt(item.resume_data, item.jobs, item.max_n)))
+            else:
+                _gemini_stats["batched"] += len(batch)
+                results = _parse_packed(await _call_gemini(_packed_prompt(batch)), len(batch))
+        except Exception as e:
+            print(f"Gemini batch error: {e}")
+        finally:
+            for item, ids in zip(batch, results):
+                if not item.future.done():
+                    item.future.set_result(ids)
+
+
+async def _call_gemini(prompt: str) -> str:
+    """Prompt text back from Gemini; empty on any failure, on timeout or when
+    too many requests are already queued."""
+    try:
+        text = await asyncio.wait_for(_generate(prompt), GEMINI_TIMEOUT)
+        _gemini_stats["ok"] += 1
+        return text
+    except _GeminiQueueFull:
+        _gemini_stats["rejected"] += 1
+    except asyncio.TimeoutError:
+        _gemini_stats["timeouts"] += 1
+        print(f"Gemini recommendation timed out after {GEMINI_TIMEOUT}s")
     except Exception as e:
+        _gemini_stats["errors"] += 1
         print(f"Gemini recommendation error: {e}")
+    return ""
+
+
+_batcher = _RerankBatcher()
+
+
+async def _gemini_rerank(resume_data: Dict[str, Any], jobs: List[Job], max_n: int) -> List[str]:
+    """Job ids Gemini picks from `jobs`, best first; empty when Gemini is unavailable."""
+    if GEMINI_BATCH_WINDOW <= 0:
+        return _parse_single(await _call_gemini(_single_prompt(resume_data, jobs, max_n)))
+    return await _batcher.rerank(resume_data, jobs, max_n)
+
 
-    # Fallback: simple heuristic if Gemini fails or returns nothing
-    if not recommended_ids:
-        skill_set = set(map(str.lower, payload.resume_data.get("skills", []) or []))
-        scored = []
-        for j in payload.jobs:
-            match_count = sum(1 for s in j.skills if s.lower() in skill_set)
-            scored.append((j, match_count))
-        scored.sort(key=lambda t: t[1], reverse=True)
-        recommended_jobs = [t[0] for t in scored[:max_n]]
+async def _indexed_candidates(request: Request, resume_data: Dict[str, Any]) -> List[Job]:
+    """Stored jobs nearest to the resume in the job vector index."""
+    index = request.app.state.job_index
+    vector = embed_terms(resume_terms(resume_data))
+    hits = await asyncio.get_running_loop().run_in_executor(None, index.search, vector, CANDIDATES)
+    # The index may not have synced the latest unlisting yet
+    return await request.app.state.job_store.get_jobs([job_id for job_id, _ in hits], listed_only=True)
+
+
+async def _recommend(
+    request: Request,
+    resume_data: Dict[str, Any],
+    jobs: List[Job],
+    max_recommendations: int,
+    use_llm: Optional[bool],
+    version: Optional[str] = None,
+    matrix: Optional[JobMatrix] = None,
+) -> JobResponse:
+    """`version` and `matrix` may be precomputed for `jobs` when several
+    resumes are ranked against the same pool."""
+    if not resume_data:
+        raise HTTPException(status_code=400, detail="No resume_data provided")
+
+    max_n = max(1, min(max_recommendations, 10))
+    use_llm = use_llm if use_llm is not None else bool(os.getenv("GEMINI_API_KEY"))
+    loop = asyncio.get_running_loop()
+
+    if jobs:
+        # Hashes every job's content: too slow for the event loop on large pools
+        version = version or f"jobs:{await loop.run_in_executor(None, job_set_version, jobs)}"
+    else:
+        index = getattr(request.app.state, "job_index", None)
+        if index is None or not hasattr(request.app.state, "job_store") or not len(index):
+            raise HTTPException(status_code=400, detail="No jobs provided")
+        version = f"index:{index.version}"
+
+    async def compute():
+        candidates = jobs or await _indexed_candidates(request, resume_data)
+        if not candidates:
+            raise HTTPException(status_code=400, detail="No jobs provided")
+
+        # Score the whole candidate set locally (no cap), best first
+        if matrix is not None:
+            ranked = await loop.run_in_executor(None, matrix.score, resume_data)
+        else:
+            ranked = await loop.run_in_executor(None, rank_jobs, resume_data, candidates)
+        ranked_ids = [candidates[i].job_id for i, _ in ranked]
+
+        recommended_ids: List[str] = []
+        if use_llm:
+            by_id = {j.job_id: j for j in candidates}
+            top = [by_id[job_id] for job_id in ranked_ids[:max(max_n, RERANK_TOP_K)]]
+            recommended_ids = await _gemini_rerank(resume_data, top, max_n)
+            known = set(ranked_ids)
+            recommended_ids = [rid for rid in dict.fromkeys(recommended_ids) if rid in known][:max_n]
+        if recommended_ids:
+            return recommended_ids, "gemini"
+        # Gemini disabled, failed or returned nothing usable: local order
+        return ranked_ids[:max_n], "local"
+
+    cache = getattr(request.app.state, "recommendation_cache", None)
+    if cache is not None:
+        key = cache.key(resume_data, version, max_n=max_n, use_llm=use_llm)
+        # A local result standing in for a failed Gemini call is not worth keeping
+        recommended_ids, source = await cache.get(key, compute, cacheable=lambda value: not use_llm or value[1] == "gemini")
     else:
-        id_set = set(recommended_ids)
-        recommended_jobs = [j for j in payload.jobs if j.job_id in id_set]
-        # Preserve requested order
-        ordering = {rid: idx for idx, rid in enumerate(recommended_ids)}
-        recommended_jobs.sort(key=lambda j: ordering.get(j.job_id, 9999))
-        recommended_jobs = recommended_jobs[:max_n]
+        recommended_ids, source = await compute()
+
+    if jobs:
+        by_id = {j.job_id: j for j in jobs}
+        recommended_jobs = [by_id[job_id] for job_id in recommended_ids if job_id in by_id]
+    else:
+        recommended_jobs = await request.app.state.job_store.get_jobs(recommended_ids, listed_only=True)
 
     return JobResponse(
         jobs=recommended_jobs,
         total_count=len(recommended_jobs),
-        source_breakdown={"gemini": len(recommended_jobs)},
+        source_breakdown={source: len(recommended_jobs)},
         last_updated=datetime.now()
     )
+
+
+@router.post("/api/recommendations", response_model=JobResponse)
+async def recommend_jobs(payload: RecommendationRequest, request: Request):
+    return await _recommend(request, payload.resume_data, payload.jobs, payload.max_recommendations, payload.use_llm)
+
+
+@router.post("/api/recommendations/batch", response_model=BatchRecommendationResponse)
+async def recommend_jobs_batch(payload: BatchRecommendationRequest, request: Request):
+    """Recommendations for several resumes against one job pool. Their Gemini
+    reranks go out together in packed prompts (see _RerankBatcher)."""
+    if not payload.requests:
+        raise HTTPException(status_code=400, detail="No requests provided")
+    if len(payload.requests) > MAX_BATCH_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_REQUESTS} requests per batch")
+    version = matrix = None
+    if payload.jobs:
+        # Shared pool: hash it and build its term matrix once, not per resume
+        loop = asyncio.get_running_loop()
+        digest, matrix = await asyncio.gather(
+            loop.run_in_executor(None, job_set_version, payload.jobs),
+            loop.run_in_executor(None, JobMatrix, payload.jobs),
+        )
+        version = f"jobs:{digest}"
+
+    async def one(item: BatchRecommendationItem) -> UserRecommendations:
+        try:
+            response = await _recommend(
+                request, item.resume_data, payload.jobs, item.max_recommendations, payload.use_llm,
+                version=version, matrix=matrix,
+            )
+            return UserRecommendations(user_id=item.user_id, **response.model_dump())
+        except HTTPException as e:
+            error = str(e.detail)
+        except Exception as e:
+            print(f"Batch recommendation error for user {item.user_id}: {e}")
+            error = "Recommendation failed"
+        return UserRecommendations(
+            user_id=item.user_id, error=error, jobs=[], total_count=0, source_breakdown={}, last_updated=datetime.now()
+        )
+
+    return BatchRecommendationResponse(results=await asyncio.gather(*[one(item) for item in payload.requests]))
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from models.scrape_task import ScrapeTaskCreate, ScrapeTaskPublic, scrape_task_doc_to_public
+from scrapers.registry import SCRAPER_CLASSES
+from utils.task_queue import TaskQueue
+
+router = APIRouter(prefix="/api/scrape-tasks", tags=["scrape-tasks"])
+
+
+def get_task_queue(request: Request) -> TaskQueue:
+    queue = getattr(request.app.state, "task_queue", None)
+    if queue is None:
+        raise HTTPException(status_code=500, detail="Task queue not initialized")
+    return queue
+
+
+@router.post("/", response_model=ScrapeTaskPublic, status_code=202)
+async def create_scrape_task(payload: ScrapeTaskCreate, queue: TaskQueue = Depends(get_task_queue)):
+    """Queue a scrape for the worker processes (python worker.py); poll GET /{id} for the outcome."""
+    sources = payload.sources or list(SCRAPER_CLASSES)
+    unknown = [source for source in sources if source not in SCRAPER_CLASSES]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown sources: {', '.join(unknown)}")
+    doc = await queue.enqueue(payload.search_term, payload.location, payload.pages, sources)
+    return scrape_task_doc_to_public(doc)
+
+
+@router.get("/{task_id}", response_model=ScrapeTaskPublic)
+async def get_scrape_task(task_id: str, queue: TaskQueue = Depends(get_task_queue)):
+    doc = await queue.get(task_id)
+    if not doc:
+        raise HTTPException(status_code=404, detail="Scrape task not found")
+    return scrape_task_doc_to_public(doc)
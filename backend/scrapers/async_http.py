@@ -0,0 +1,93 @@
+# backend/scrapers/async_http.py
+"""Shared aiohttp session for scrapers that do not need a browser.
+
+One ClientSession (and therefore one connection pool) per event loop, with a
+global connection cap and a per-host cap so that fetching many pages of the
+same site at once reuses keep-alive connections instead of opening dozens.
+
+Synchronous scraper code (fan-out threads) runs its fetches through
+`run_async` on one long-lived background loop, so the session and its
+keep-alive connections are shared by every scrape in the process until
+`shutdown_fetch_loop` is called.
+
+Configuration (env):
+    SCRAPER_HTTP_MAX_CONNECTIONS   total pooled connections (32)
+    SCRAPER_HTTP_PER_HOST          connections per host (4)
+"""
+import asyncio
+import os
+import random
+import threading
+import weakref
+from typing import Awaitable, Optional, TypeVar
+
+import aiohttp
+
+T = TypeVar("T")
+
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+# Background loop that owns the scrapers' session (see run_async)
+_fetch_loop: Optional[asyncio.AbstractEventLoop] = None
+_fetch_loop_lock = threading.Lock()
+
+
+def get_async_session() -> aiohttp.ClientSession:
+    """Session bound to the running event loop (created on first use)."""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=int(os.getenv("SCRAPER_HTTP_MAX_CONNECTIONS", "32")),
+            limit_per_host=int(os.getenv("SCRAPER_HTTP_PER_HOST", "4")),
+            ttl_dns_cache=300,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        _sessions[loop] = session
+    return session
+
+
+async def close_async_session():
+    loop = asyncio.get_running_loop()
+    session = _sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 10.0) -> float:
+    """Full-jitter exponential backoff for retry number `attempt` (0-based)."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def _get_fetch_loop() -> asyncio.AbstractEventLoop:
+    global _fetch_loop
+    with _fetch_loop_lock:
+        if _fetch_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="scraper-http", daemon=True).start()
+            _fetch_loop = loop
+        return _fetch_loop
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a fetch coroutine from synchronous scraper code (e.g. an executor thread).
+
+    The coroutine runs on the shared background loop, so its pooled session
+    is reused across scrapes; the calling thread blocks until it finishes.
+    Must not be called from that loop itself.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_fetch_loop()).result()
+
+
+def shutdown_fetch_loop(timeout: float = 10.0):
+    """Close the scrapers' session and stop the background loop (blocking)."""
+    global _fetch_loop
+    with _fetch_loop_lock:
+        loop, _fetch_loop = _fetch_loop, None
+    if loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(close_async_session(), loop).result(timeout)
+    except Exception as e:
+        print(f"Scraper HTTP session close error: {e}")
+    loop.call_soon_threadsafe(loop.stop)
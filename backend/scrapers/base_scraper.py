@@ -1,14 +1,49 @@
 # backend/scrapers/base_scraper.py
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from fake_useragent import UserAgent
 import time
-import random
+import asyncio
+import aiohttp
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from models.job import Job
+from scrapers.page_ready import wait_for_cards, scroll_until_stable
+from scrapers.async_http import get_async_session, backoff_delay
+from scrapers.throttle import domain_bucket, domain_breaker, CircuitOpenError
+from scrapers.driver_pool import DriverUnavailableError
+from utils.skills import find_skills
+from scrapers.incremental import SeenCards, ScrapeDelta, card_fingerprint, _active_delta
+
+# The source cannot be reached at all. Scrapers let these propagate rather than
+# returning [], so the fan-out reports "error" instead of an empty success
+SOURCE_UNAVAILABLE = (CircuitOpenError, DriverUnavailableError)
+
+def class_strainer(name, *classes: str) -> SoupStrainer:
+    """SoupStrainer keeping `name` elements (None: any tag) that carry any of `classes`.
+
+    While parsing, bs4 hands the strainer the raw class attribute ("a b c"), so a
+    plain class_="a" would only keep elements whose class is exactly "a".
+    """
+    wanted = set(classes)
+    return SoupStrainer(name, class_=lambda value: bool(value) and not wanted.isdisjoint(value.split()))
 
 class BaseScraper(ABC):
+    # Scrapers of real sites also define parse_listing(html) -> List[Job]: the
+    # listing page's HTML to jobs, network- and driver-free so it can be run
+    # against saved pages (bench_scrapers.py, bench_parsing.py)
+
+    # Page readiness (Selenium scrapers): CSS selector matching one job card,
+    # how many cards count as "ready", and the longest we wait for them
+    card_selector: str = ""
+    min_cards: int = 10
+    ready_timeout: float = 15.0
+
+    # HTML parsing: lxml, optionally restricted to the card containers so the
+    # rest of the page (nav, footer, scripts, carousels) is never built into a tree
+    html_parser: str = "lxml"
+    card_strainer: Optional[SoupStrainer] = None
+
     def __init__(self):
         self.ua = UserAgent()
         self.session = requests.Session()
@@ -19,21 +54,133 @@ class BaseScraper(ABC):
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
         })
+        # Fingerprints of cards already parsed, for scrape_incremental
+        self.seen = SeenCards()
     
+    @property
+    def breaker(self):
+        """Circuit breaker shared by every fetch / navigation to this scraper's domain."""
+        return domain_breaker(self.base_url)
+
     def get_page(self, url: str, retries: int = 3) -> BeautifulSoup:
         """Fetch and parse a web page with retry logic"""
+        breaker = domain_breaker(url)
         for attempt in range(retries):
+            # Fails fast with CircuitOpenError while the domain is cooling down
+            breaker.before_call()
+            domain_bucket(url).acquire()
             try:
-                time.sleep(random.uniform(1, 3))
                 response = self.session.get(url, timeout=40)
                 response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
+                breaker.record_success()
+                return self.parse_html(response.content)
             except Exception as e:
+                breaker.record_failure()
                 print(f"Attempt {attempt + 1} failed for {url}: {str(e)}")
                 if attempt == retries - 1:
                     raise e
-                time.sleep(random.uniform(2, 5))
-    
+                time.sleep(backoff_delay(attempt))
+
+    async def fetch_html_async(self, url: str, retries: int = 3) -> bytes:
+        """Async counterpart of get_page on the shared aiohttp connection pool.
+
+        Politeness is a per-domain token bucket taken before every attempt;
+        backoff delays only apply after a failed attempt.
+        """
+        session = get_async_session()
+        breaker = domain_breaker(url)
+        for attempt in range(retries):
+            breaker.before_call()
+            await domain_bucket(url).acquire_async()
+            try:
+                async with session.get(url, headers=dict(self.session.headers), timeout=aiohttp.ClientTimeout(total=40)) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+                breaker.record_success()
+                return content
+            except Exception as e:
+                breaker.record_failure()
+                print(f"Attempt {attempt + 1} failed for {url}: {str(e)}")
+                if attempt == retries - 1:
+                    raise e
+                await asyncio.sleep(backoff_delay(attempt))
+
+    async def get_page_async(self, url: str, retries: int = 3) -> BeautifulSoup:
+        return self.parse_html(await self.fetch_html_async(url, retries))
+
+    async def fetch_pages_async(self, urls: List[str], retries: int = 3) -> List[Optional[bytes]]:
+        """Fetch many pages concurrently; failed pages come back as None.
+
+        Raises CircuitOpenError when no page was fetched and the domain's circuit opened.
+        """
+        results = await asyncio.gather(*[self.fetch_html_async(url, retries) for url in urls], return_exceptions=True)
+        if all(isinstance(r, BaseException) for r in results):
+            for r in results:
+                if isinstance(r, CircuitOpenError):
+                    raise r
+        return [None if isinstance(r, BaseException) else r for r in results]
+
+    def parse_html(self, html, strainer: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse with lxml; with a strainer only the matching elements (and their subtrees) are kept."""
+        return BeautifulSoup(html, self.html_parser, parse_only=strainer)
+
+    def parse_card(self, card, parse, *args) -> Optional[Job]:
+        """Run `parse(card, *args)`, unless an incremental scrape already knows this card.
+
+        Scrapers call this from parse_listing for every card; outside
+        scrape_incremental it is a plain call.
+        """
+        delta = _active_delta.get()
+        if delta is None or card is None:
+            return parse(card, *args)
+        fingerprint = card_fingerprint(card)
+        job_id = self.seen.job_id_for(fingerprint)
+        if job_id is not None:
+            delta.unchanged.append(job_id)
+            return None
+        job = parse(card, *args)
+        if job:
+            delta.record(fingerprint, job)
+        return job
+
+    def scrape_incremental(self, *args, **kwargs) -> ScrapeDelta:
+        """scrape_jobs, but only new / changed cards are parsed (see scrapers.incremental)."""
+        delta = ScrapeDelta(self.seen)
+        token = _active_delta.set(delta)
+        try:
+            self.scrape_jobs(*args, **kwargs)
+        finally:
+            _active_delta.reset(token)
+        return delta
+
+    def open_listing(self, driver, url: str) -> int:
+        """Rate-limited, breaker-guarded `driver.get` plus the wait for job cards;
+        returns the card count.
+
+        Success is recorded only once cards actually render, since a blocked page
+        usually loads fine and just has no listings. Anything raised along the
+        way (a crashed Chrome in `find_elements`, say) counts as a failure, so a
+        half-open trial always ends.
+        """
+        breaker = domain_breaker(url)
+        breaker.before_call()
+        try:
+            domain_bucket(url).acquire()
+            driver.get(url)
+            count = wait_for_cards(driver, self.card_selector, self.min_cards, self.ready_timeout)
+        except BaseException:
+            breaker.record_failure()
+            raise
+        if count:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        return count
+
+    def load_lazy_listing(self, driver, max_scrolls: int = 8) -> int:
+        """Scroll a lazy-loaded listing until no new cards appear; returns the card count."""
+        return scroll_until_stable(driver, self.card_selector, max_scrolls)
+
     @abstractmethod
     def scrape_jobs(self, search_term: str, location: str, pages: int = 3) -> List[Job]:
         pass
@@ -44,20 +191,4 @@ class BaseScraper(ABC):
         return ' '.join(text.strip().split())
     
     def extract_skills(self, description: str) -> List[str]:
-        common_skills = [
-            'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'Angular', 'Vue.js',
-            'Flutter', 'Dart', 'Swift', 'Kotlin', 'PHP', 'Laravel', 'Django',
-            'Flask', 'SQL', 'MongoDB', 'PostgreSQL', 'MySQL', 'Redis', 'Docker',
-            'Kubernetes', 'AWS', 'Azure', 'GCP', 'Git', 'HTML', 'CSS', 'Figma',
-            'Adobe XD', 'Photoshop', 'Machine Learning', 'AI', 'TensorFlow',
-            'PyTorch', 'Data Science', 'Analytics', 'Tableau', 'Power BI'
-        ]
-        
-        found_skills = []
-        description_lower = description.lower()
-        
-        for skill in common_skills:
-            if skill.lower() in description_lower:
-                found_skills.append(skill)
-        
-        return found_skills[:5]
\ No newline at end of file
+        return find_skills(description, limit=5)
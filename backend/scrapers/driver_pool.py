@@ -0,0 +1,205 @@
+# backend/scrapers/driver_pool.py
+"""Shared pool of reusable Chrome WebDriver sessions.
+
+Browser startup dominates the cost of a scrape, and one Chrome per request is
+what runs the pods out of memory. All Selenium users lease a driver from this
+pool instead of building their own:
+
+    with get_driver_pool().lease() as driver:
+        driver.get(url)
+
+ - headless by default (SCRAPER_HEADLESS=0 shows the browser for debugging)
+ - at most SCRAPER_MAX_BROWSERS live browsers; extra leases wait for a free slot
+ - SCRAPER_WARM_BROWSERS drivers are started ahead of the first request
+ - a driver is recycled after SCRAPER_DRIVER_MAX_USES leases, or immediately
+   when it crashed (WebDriverException) or no longer responds
+"""
+import os
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Hide navigator.webdriver on every page (previously only done by the Indeed scraper)
+_STEALTH_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes"}
+
+
+def build_chrome_options(headless: bool = True, window_size: str = "1920,1080", user_agent: str = DEFAULT_USER_AGENT) -> Options:
+    """Single Chrome options block shared by every scraper."""
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-extensions")
+    options.add_argument(f"--window-size={window_size}")
+    options.add_argument(f"--user-agent={user_agent}")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    return options
+
+
+class DriverUnavailableError(RuntimeError):
+    """No browser could be leased: the pool stayed full, or Chrome failed to start."""
+
+
+class _PooledDriver:
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool:
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_uses: Optional[int] = None,
+        headless: Optional[bool] = None,
+        acquire_timeout: Optional[float] = None,
+    ):
+        self.max_size = max_size or int(os.getenv("SCRAPER_MAX_BROWSERS", "4"))
+        self.max_uses = max_uses or int(os.getenv("SCRAPER_DRIVER_MAX_USES", "25"))
+        self.headless = headless if headless is not None else _env_flag("SCRAPER_HEADLESS", "1")
+        self.acquire_timeout = acquire_timeout or float(os.getenv("SCRAPER_DRIVER_ACQUIRE_TIMEOUT", "120"))
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._idle: List[_PooledDriver] = []
+        self._lock = threading.Lock()
+        self.created = 0
+        self.recycled = 0
+
+    def _create(self) -> _PooledDriver:
+        driver = webdriver.Chrome(options=build_chrome_options(headless=self.headless))
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _STEALTH_SCRIPT})
+        except Exception:
+            pass
+        with self._lock:
+            self.created += 1
+        return _PooledDriver(driver)
+
+    def _quit(self, entry: _PooledDriver):
+        with self._lock:
+            self.recycled += 1
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_alive(entry: _PooledDriver) -> bool:
+        try:
+            entry.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _release(self, entry: _PooledDriver, broken: bool):
+        if broken or entry.uses >= self.max_uses or not self._is_alive(entry):
+            self._quit(entry)
+            return
+        try:
+            # Reset between leases so the next user starts from a blank page
+            entry.driver.delete_all_cookies()
+            entry.driver.get("about:blank")
+        except Exception:
+            self._quit(entry)
+            return
+        with self._lock:
+            self._idle.append(entry)
+
+    @contextmanager
+    def lease(self, discard: bool = False):
+        """Lease a driver for the duration of the block.
+
+        discard=True quits the browser afterwards instead of returning it to the
+        pool (use for sessions that log in with user credentials).
+        """
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise DriverUnavailableError(
+                f"No browser available within {self.acquire_timeout:.0f}s (pool size {self.max_size})"
+            )
+        entry = None
+        broken = discard
+        try:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                try:
+                    entry = self._create()
+                except WebDriverException as e:
+                    raise DriverUnavailableError(f"Could not start a browser: {e}") from e
+            entry.uses += 1
+            yield entry.driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            if entry is not None:
+                self._release(entry, broken)
+            self._slots.release()
+
+    def warm(self, count: Optional[int] = None) -> int:
+        """Start up to `count` browsers ahead of time so the first scrape skips Chrome startup."""
+        count = min(count if count is not None else int(os.getenv("SCRAPER_WARM_BROWSERS", "1")), self.max_size)
+        started = 0
+        for _ in range(count):
+            with self._lock:
+                if len(self._idle) >= count:
+                    break
+            if not self._slots.acquire(blocking=False):
+                break
+            try:
+                entry = self._create()
+                with self._lock:
+                    self._idle.append(entry)
+                started += 1
+            except Exception as e:
+                print(f"[driver_pool] warm start failed: {e}")
+                break
+            finally:
+                self._slots.release()
+        return started
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            self._quit(entry)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "idle": len(self._idle),
+                "created": self.created,
+                "recycled": self.recycled,
+                "headless": self.headless,
+            }
+
+
+_pool: Optional[DriverPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    global _pool
+    if _pool is not None:
+        return _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool()
+    return _pool
@@ -0,0 +1,112 @@
+# backend/scrapers/incremental.py
+"""Incremental scraping: skip cards we have already parsed.
+
+Every job card's raw HTML is fingerprinted. Each scraper keeps a bounded
+fingerprint -> job_id map (`SeenCards`, warmed from the job store at startup);
+during `BaseScraper.scrape_incremental` a card whose fingerprint is known is
+reported as unchanged without being parsed or turned into a `Job`. Only new
+and changed cards go through the scraper's card parser.
+
+The scrape result is a `ScrapeDelta`. Fingerprints of parsed cards are only
+remembered once the caller has persisted the delta (`delta.commit()`), so a
+failed store write never hides a posting from the next scrape.
+"""
+import contextvars
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from models.job import Job
+
+# Delta collecting results for the scrape running in this thread (None: full scrape)
+_active_delta: contextvars.ContextVar = contextvars.ContextVar("active_scrape_delta", default=None)
+
+
+def card_fingerprint(card) -> str:
+    return hashlib.sha1(str(card).encode("utf-8")).hexdigest()
+
+
+class SeenCards:
+    def __init__(self, max_cards: Optional[int] = None):
+        self.max_cards = max_cards or int(os.getenv("SCRAPER_SEEN_MAX_CARDS", "50000"))
+        self._job_ids: "OrderedDict[str, str]" = OrderedDict()  # fingerprint -> job_id
+        self._fingerprints: Dict[str, str] = {}  # job_id -> fingerprint
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._job_ids)
+
+    def job_id_for(self, fingerprint: str) -> Optional[str]:
+        with self._lock:
+            job_id = self._job_ids.get(fingerprint)
+            if job_id is not None:
+                self._job_ids.move_to_end(fingerprint)
+            return job_id
+
+    def knows_job(self, job_id: str) -> bool:
+        return job_id in self._fingerprints
+
+    def remember(self, fingerprint: str, job_id: str):
+        with self._lock:
+            previous = self._fingerprints.get(job_id)
+            if previous is not None and previous != fingerprint:
+                self._job_ids.pop(previous, None)
+            self._fingerprints[job_id] = fingerprint
+            self._job_ids[fingerprint] = job_id
+            self._job_ids.move_to_end(fingerprint)
+            while len(self._job_ids) > self.max_cards:
+                _, old_id = self._job_ids.popitem(last=False)
+                self._fingerprints.pop(old_id, None)
+
+
+class ScrapeDelta:
+    """Outcome of an incremental scrape.
+
+    added / updated hold fully parsed jobs; unchanged holds the job_ids of
+    cards skipped by fingerprint. `removed` is filled in by the job store,
+    which knows what the previous scrape of the same query returned.
+    """
+
+    def __init__(self, seen: SeenCards):
+        self.seen = seen
+        self.added: List[Job] = []
+        self.updated: List[Job] = []
+        self.unchanged: List[str] = []
+        self.removed = 0
+        self._pending: Dict[str, str] = {}  # job_id -> fingerprint, remembered on commit()
+
+    def __len__(self) -> int:
+        # Postings seen on the listing, parsed or not
+        return len(self.added) + len(self.updated) + len(self.unchanged)
+
+    @property
+    def changed(self) -> List[Job]:
+        return self.added + self.updated
+
+    @property
+    def job_ids(self) -> List[str]:
+        return [job.job_id for job in self.changed] + self.unchanged
+
+    def fingerprint_of(self, job_id: str) -> Optional[str]:
+        return self._pending.get(job_id)
+
+    def record(self, fingerprint: str, job: Job):
+        if job.job_id in self._pending or job.job_id in self.unchanged:
+            return  # same posting listed twice on the page
+        (self.updated if self.seen.knows_job(job.job_id) else self.added).append(job)
+        self._pending[job.job_id] = fingerprint
+
+    def commit(self):
+        for job_id, fingerprint in self._pending.items():
+            self.seen.remember(fingerprint, job_id)
+        self._pending = {}
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "updated": len(self.updated),
+            "unchanged": len(self.unchanged),
+            "removed": self.removed,
+        }
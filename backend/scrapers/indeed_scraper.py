@@ -1,112 +1,68 @@
 # backend/scrapers/indeed_scraper.py
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, SOURCE_UNAVAILABLE
 from models.job import Job
 from typing import List
-import uuid
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from scrapers.driver_pool import get_driver_pool
+from utils.job_ids import make_job_id
 
 class IndeedScraper(BaseScraper):
+    card_selector = "div.job_seen_beacon, [data-jk]"
+    # Called with raw (name, attrs) while parsing: keep only job card elements
+    card_strainer = SoupStrainer(
+        lambda name, attrs: "data-jk" in attrs or "job_seen_beacon" in (attrs.get("class") or "").split()
+    )
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://in.indeed.com"
 
     def scrape_jobs(self, search_term: str = "software developer", location: str = "India", pages: int = 1) -> List[Job]:
         jobs = []
-        chrome_options = Options()
-        # chrome_options.add_argument("--headless")  # Disable headless for debugging
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--window-size=1920,1080")
-        # Add more stealth options
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")  # Speed up loading
-        chrome_options.add_argument("--disable-javascript")  # Wait, don't do this - we need JS
-
-        driver = webdriver.Chrome(options=chrome_options)
-
-        # Make Selenium less detectable
-        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined})
-            """
-        })
-
-        for page in range(pages):
-            start = page * 10
-            url = f"{self.base_url}/jobs?q={search_term}&l={location}&start={start}"
-            print("Scraping URL:", url)
-            driver.get(url)
-
-            # Wait a bit before checking
-            time.sleep(3)
-
-            try:
-                wait = WebDriverWait(driver, 15)
-                # Try multiple selectors for job cards
-                job_selectors = [
-                    (By.ID, "mosaic-provider-jobcards"),
-                    (By.CLASS_NAME, "job_seen_beacon"),
-                    (By.CSS_SELECTOR, "[data-jk]"),
-                ]
-
-                container = None
-                for selector_type, selector_value in job_selectors:
-                    try:
-                        container = wait.until(EC.presence_of_element_located((selector_type, selector_value)))
-                        break
-                    except:
+        with get_driver_pool().lease() as driver:
+            for page in range(pages):
+                start = page * 10
+                url = f"{self.base_url}/jobs?q={search_term}&l={location}&start={start}"
+                print("Scraping URL:", url)
+                try:
+                    # One wait over every known card selector instead of trying them in turn
+                    if not self.open_listing(driver, url):
+                        print(f"No job container found on page {page}")
                         continue
 
-                if not container:
-                    print(f"No job container found on page {page}")
-                    continue
-
-                # Scroll slowly to load all jobs
-                for i in range(3):
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1)
-
-                print("Job cards container HTML preview:\n", container.get_attribute("outerHTML")[:500])
+                    # Scroll to load all jobs, stopping once no new cards appear
+                    self.load_lazy_listing(driver, max_scrolls=3)
 
-            except Exception as e:
-                print(f"Error loading page {page}: {e}")
-                continue
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+                except SOURCE_UNAVAILABLE:
+                    raise
+                except Exception as e:
+                    print(f"Error loading page {page}: {e}")
+                    continue
 
-            # Try multiple ways to find job cards
-            job_card_divs = []
-            job_card_divs.extend(soup.find_all('div', class_='job_seen_beacon'))
-            job_card_divs.extend(soup.find_all('div', {'data-jk': True}))
-            job_card_divs.extend(soup.find_all('a', {'data-jk': True}))
+                page_jobs = self.parse_listing(driver.page_source)
+                if not page_jobs:
+                    print(f"No job cards found in parsed HTML on page {page}")
+                jobs.extend(page_jobs)
 
-            if not job_card_divs:
-                print(f"No job cards found in parsed HTML on page {page}")
-                continue
+        return jobs
 
-            print(f"Found {len(job_card_divs)} job cards on page {page}")
+    def parse_listing(self, html) -> List[Job]:
+        soup = self.parse_html(html, self.card_strainer)
 
-            for card in job_card_divs[:10]:  # Limit to 10 per page
-                job = self._parse_job_card(card)
-                if job:
-                    jobs.append(job)
+        # Try multiple ways to find job cards
+        job_card_divs = []
+        job_card_divs.extend(soup.find_all('div', class_='job_seen_beacon'))
+        job_card_divs.extend(soup.find_all('div', {'data-jk': True}))
+        job_card_divs.extend(soup.find_all('a', {'data-jk': True}))
 
-            time.sleep(3)  # Longer delay between pages
+        if job_card_divs:
+            print(f"Found {len(job_card_divs)} job cards")
 
-        driver.quit()
+        jobs = []
+        for card in job_card_divs[:10]:  # Limit to 10 per page
+            job = self.parse_card(card, self._parse_job_card)
+            if job:
+                jobs.append(job)
         return jobs
 
     def _parse_job_card(self, card) -> Job:
@@ -144,7 +100,7 @@ class IndeedScraper(BaseScraper):
             return None
 
         return Job(
-            job_id=str(uuid.uuid4()),
+            job_id=make_job_id("Indeed", apply_link or "", job_title, company_name, location),
             job_title=job_title,
             company_name=company_name,
             location=location,
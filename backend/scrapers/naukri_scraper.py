@@ -1,77 +1,73 @@
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, class_strainer, SOURCE_UNAVAILABLE
 from models.job import Job
 from typing import List
-import uuid
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from utils.job_ids import make_job_id
+from scrapers.driver_pool import get_driver_pool
 
 class NaukriScraper(BaseScraper):
+    card_selector = "div.jobTuple, div.srp-jobtuple-wrapper, article.jobTuple, div.row1"
+    min_cards = 20  # Naukri renders 20 tuples per results page
+    card_strainer = class_strainer(["div", "article"], "jobTuple", "srp-jobtuple-wrapper", "row1")
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.naukri.com"
 
     def scrape_jobs(self, search_term: str = "software developer", location: str = "bangalore", pages: int = 1) -> List[Job]:
         jobs = []
-        chrome_options = Options()
-        # chrome_options.add_argument("--headless")  # Disable headless for debugging
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-        driver = webdriver.Chrome(options=chrome_options)
 
         try:
             # Simple Naukri URL for software developer jobs in bangalore
             url = f"{self.base_url}/software-developer-jobs-in-bangalore"
             print(f"Scraping: {url}")
-            
-            driver.get(url)
-            time.sleep(5)  # Wait for page to load completely
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-
-            # Try multiple selectors to find job cards
-            job_selectors = [
-                ('div', 'jobTuple'),
-                ('div', 'srp-jobtuple-wrapper'),  
-                ('article', 'jobTuple'),
-                ('div', {'class': 'row1'}),
-            ]
-
-            job_cards = []
-            for tag, selector in job_selectors:
-                if isinstance(selector, dict):
-                    cards = soup.find_all(tag, selector)
-                else:
-                    cards = soup.find_all(tag, class_=selector)
-                
-                if cards:
-                    print(f"Found {len(cards)} job cards with selector {tag}.{selector}")
-                    job_cards = cards
-                    break
-
-            if not job_cards:
-                print("No job cards found with any selector")
-                # Let's see what elements are available
-                print("Available div classes:", [div.get('class') for div in soup.find_all('div')[:20]])
-
-            # Parse all discovered job cards on the page
-            for card in job_cards:
-                job = self._parse_job_card(card)
-                if job:
-                    jobs.append(job)
 
+            with get_driver_pool().lease() as driver:
+                self.open_listing(driver, url)
+                html = driver.page_source
+
+            jobs = self.parse_listing(html)
+
+        except SOURCE_UNAVAILABLE:
+            raise
         except Exception as e:
             print(f"Error scraping: {e}")
             import traceback
             traceback.print_exc()
 
-        finally:
-            driver.quit()
+        return jobs
+
+    def parse_listing(self, html) -> List[Job]:
+        soup = self.parse_html(html, self.card_strainer)
+
+        # Try multiple selectors to find job cards
+        job_selectors = [
+            ('div', 'jobTuple'),
+            ('div', 'srp-jobtuple-wrapper'),
+            ('article', 'jobTuple'),
+            ('div', {'class': 'row1'}),
+        ]
+
+        job_cards = []
+        for tag, selector in job_selectors:
+            if isinstance(selector, dict):
+                cards = soup.find_all(tag, selector)
+            else:
+                cards = soup.find_all(tag, class_=selector)
+
+            if cards:
+                print(f"Found {len(cards)} job cards with selector {tag}.{selector}")
+                job_cards = cards
+                break
 
+        if not job_cards:
+            print("No job cards found with any selector")
+
+        # Parse all discovered job cards on the page
+        jobs = []
+        for card in job_cards:
+            job = self.parse_card(card, self._parse_job_card)
+            if job:
+                jobs.append(job)
         return jobs
 
     def _parse_job_card(self, card) -> Job:
@@ -93,7 +89,7 @@ class NaukriScraper(BaseScraper):
             location = self.clean_text(location_elem.get_text()) if location_elem else "Bangalore"
 
             # Extract apply link from job title link
-            apply_link = title_elem.get('href') if title_elem else f"{self.base_url}/job-{str(uuid.uuid4())[:8]}"
+            apply_link = title_elem.get('href') if title_elem else self.base_url
             if apply_link and not apply_link.startswith('http'):
                 apply_link = f"{self.base_url}{apply_link}"
 
@@ -114,7 +110,7 @@ class NaukriScraper(BaseScraper):
                 skills = ["Software Development", "Programming", "Problem Solving"]
 
             return Job(
-                job_id=str(uuid.uuid4()),
+                job_id=make_job_id("Naukri", apply_link, job_title, company_name, location),
                 job_title=job_title,
                 company_name=company_name,
                 location=location,
@@ -0,0 +1,73 @@
+# backend/scrapers/page_ready.py
+"""Condition-based page readiness for Selenium scrapers.
+
+Instead of sleeping a fixed number of seconds after `driver.get`, scrapers wait
+until enough job cards are present, or until the card count stops growing,
+whichever comes first. Both helpers return the number of cards found so the
+caller can decide whether the page is usable; neither raises on timeout.
+"""
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+def count_cards(driver, selector: str) -> int:
+    return len(driver.find_elements(By.CSS_SELECTOR, selector))
+
+
+class cards_ready:
+    """WebDriverWait condition: truthy once `min_count` cards match `selector`,
+    or once at least one card is present and the count has not changed for
+    `settle` seconds (the DOM stopped growing)."""
+
+    def __init__(self, selector: str, min_count: int = 1, settle: float = 1.0):
+        self.selector = selector
+        self.min_count = min_count
+        self.settle = settle
+        self.last_count = -1
+        self.last_change = time.monotonic()
+
+    def __call__(self, driver):
+        count = count_cards(driver, self.selector)
+        now = time.monotonic()
+        if count != self.last_count:
+            self.last_count = count
+            self.last_change = now
+        if count >= self.min_count:
+            return count
+        if count > 0 and now - self.last_change >= self.settle:
+            return count
+        return False
+
+
+def wait_for_cards(driver, selector: str, min_count: int = 1, timeout: float = 10.0, settle: float = 1.0, poll: float = 0.25) -> int:
+    """Block until the listing is ready; returns the number of matching cards."""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll).until(cards_ready(selector, min_count, settle))
+    except TimeoutException:
+        return count_cards(driver, selector)
+
+
+def scroll_until_stable(driver, selector: str, max_scrolls: int = 8, step_timeout: float = 2.0, poll: float = 0.25) -> int:
+    """Scroll to the bottom until lazy loading stops adding cards.
+
+    After each scroll we wait (at most `step_timeout`) for the card count to grow
+    and stop as soon as it does not, so a fully loaded page costs one short wait
+    instead of `max_scrolls` fixed sleeps.
+    """
+    count = count_cards(driver, selector)
+    for _ in range(max_scrolls):
+        before = count
+
+        def grew(d):
+            n = count_cards(d, selector)
+            return n if n > before else False
+
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            count = WebDriverWait(driver, step_timeout, poll_frequency=poll).until(grew)
+        except TimeoutException:
+            break
+    return count
@@ -16,25 +16,31 @@ Fields inside each card:
     ul.sjci-need li for experience, salary, location
     div.sjci-skils div.sk_list span for skills
 
-Uses requests + BeautifulSoup only (no Selenium) for performance.
+Uses a pooled browser by default; with show_browser=False pages are fetched
+concurrently over aiohttp (BaseScraper.fetch_pages_async). Only the job cards are
+parsed (lxml + SoupStrainer, see BaseScraper.parse_html).
 """
 
 from typing import List, Optional
-from bs4 import BeautifulSoup
-import uuid
-import sys, os, time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+import sys, os
 
 # Allow running as a standalone script: python scrapers/placementindia_scraper.py
 if __name__ == "__main__" and __package__ is None:  # executed directly, not as module
         # Add project root (parent of scrapers/) to sys.path so absolute imports work
         sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from scrapers.base_scraper import BaseScraper  # type: ignore
+from scrapers.base_scraper import BaseScraper, class_strainer  # type: ignore
+from scrapers.throttle import CircuitOpenError  # type: ignore
+from scrapers.driver_pool import get_driver_pool  # type: ignore
+from scrapers.async_http import run_async  # type: ignore
 from models.job import Job  # type: ignore
+from utils.job_ids import make_job_id  # type: ignore
 
 class PlacementIndiaScraper(BaseScraper):
+    card_selector = "div.sjc-iteam"
+    card_strainer = class_strainer("div", "sjc-iteam")
+    ready_timeout = 10.0
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.placementindia.com"
@@ -51,64 +57,60 @@ class PlacementIndiaScraper(BaseScraper):
         return base
 
     def scrape_jobs(self, search_term: str = "software developer", location: str = "India", pages: int = 1, show_browser: bool = True) -> List[Job]:
-        """Scrape PlacementIndia fresher jobs. If show_browser=True a visible Chrome window is used.
-        Falls back to requests if Selenium initialization fails."""
-        jobs: List[Job] = []
-        driver = None
+        """Scrape PlacementIndia fresher jobs. If show_browser=True a pooled Chrome session is used.
+        Falls back to requests if no browser can be leased."""
         if show_browser:
             try:
-                chrome_options = Options()
-                # DO NOT add headless flag so evaluator sees browser
-                chrome_options.add_argument("--window-size=1400,900")
-                chrome_options.add_argument("--disable-gpu")
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-                driver = webdriver.Chrome(options=chrome_options)
+                with get_driver_pool().lease() as driver:
+                    return self._scrape_pages(driver, search_term, location, pages)
+            except CircuitOpenError:
+                # The site itself is unreachable; requests mode would fail the same way
+                raise
             except Exception as e:
                 print(f"Selenium init failed ({e}); falling back to requests mode.")
-                driver = None
-
-        for page in range(1, pages + 1):
-            url = self.build_url(search_term, location, page)
-            print(f"Scraping PlacementIndia page {page}: {url}")
-            if driver:
-                try:
-                    driver.get(url)
-                    time.sleep(4)  # allow dynamic content
-                    html = driver.page_source
-                    soup = BeautifulSoup(html, 'html.parser')
-                except Exception as e:
-                    print(f"Selenium error fetching page {page}: {e}")
-                    continue
-            else:
-                try:
-                    soup = self.get_page(url)
-                except Exception as e:
-                    print(f"Requests error fetching page {page}: {e}")
-                    continue
-
-            listing_container = soup.find('div', class_='sjc-list') or soup
-            cards = listing_container.find_all('div', class_='sjc-iteam')
-            if not cards:
-                print(f"No job cards found on page {page}")
-                continue
+        return self._scrape_pages(None, search_term, location, pages)
 
-            for card in cards:
-                job = self._parse_job_card(card)
-                if job:
-                    jobs.append(job)
+    def _scrape_pages(self, driver, search_term: str, location: str, pages: int) -> List[Job]:
+        urls = [self.build_url(search_term, location, page) for page in range(1, pages + 1)]
+        if driver:
+            pages_html = [self._fetch_with_driver(driver, url, page) for page, url in enumerate(urls, start=1)]
+        else:
+            # Requests mode: fetch every page at once on the shared async connection pool
+            print(f"Scraping PlacementIndia pages 1-{pages} over HTTP")
+            pages_html = run_async(self.fetch_pages_async(urls))
 
-            # Friendly pacing between pages when using requests only
-            if not driver:
-                time.sleep(2)
+        jobs: List[Job] = []
+        for page, html in enumerate(pages_html, start=1):
+            if html is None:
+                continue
+            page_jobs = self.parse_listing(html)
+            if not page_jobs:
+                print(f"No job cards found on page {page}")
+            jobs.extend(page_jobs)
 
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
         return jobs
 
+    def parse_listing(self, html) -> List[Job]:
+        # The strainer keeps only the job cards, so no need to locate div.sjc-list first
+        soup = self.parse_html(html, self.card_strainer)
+        jobs: List[Job] = []
+        for card in soup.find_all('div', class_='sjc-iteam'):
+            job = self.parse_card(card, self._parse_job_card)
+            if job:
+                jobs.append(job)
+        return jobs
+
+    def _fetch_with_driver(self, driver, url: str, page: int) -> Optional[str]:
+        print(f"Scraping PlacementIndia page {page}: {url}")
+        try:
+            self.open_listing(driver, url)  # allow dynamic content
+            return driver.page_source
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            print(f"Selenium error fetching page {page}: {e}")
+            return None
+
     def _parse_job_card(self, card) -> Optional[Job]:
         try:
             data_url = card.get('data-url')
@@ -116,6 +118,9 @@ class PlacementIndiaScraper(BaseScraper):
             heading = inner.find('h2', class_='sjci-heading')
             title_elem = heading.find('a', class_='job-name') if heading else None
             company_elem = heading.find('p', class_='job-cname') if heading else None
+            if company_elem is None:
+                # lxml closes the <h2> before a nested <p>, leaving it as the heading's sibling
+                company_elem = inner.find('p', class_='job-cname')
 
             job_title = self.clean_text(title_elem.get_text()) if title_elem else None
             company_name = self.clean_text(company_elem.get_text()) if company_elem else None
@@ -167,7 +172,7 @@ class PlacementIndiaScraper(BaseScraper):
             job_description = ' | '.join([p for p in desc_parts if p])
 
             return Job(
-                job_id=str(uuid.uuid4()),
+                job_id=make_job_id("PlacementIndia", apply_link, job_title, company_name, location),
                 job_title=job_title,
                 company_name=company_name,
                 location=location or "India",
@@ -0,0 +1,57 @@
+# backend/scrapers/registry.py
+"""The scrapers behind /api/jobs and how each one is called.
+
+Shared by the API process (main.py) and the out-of-process scrape worker
+(worker.py) so both scrape the same sources the same way.
+"""
+from typing import Dict, Iterable, Tuple
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.naukri_scraper import NaukriScraper
+from scrapers.placementindia_scraper import PlacementIndiaScraper
+from scrapers.remoteonly_scraper import RemoteOnlyScraper
+from scrapers.shine_scraper import ShineScraper
+
+
+SCRAPER_CLASSES = {
+    "naukri": NaukriScraper,
+    "remoteonly": RemoteOnlyScraper,
+    "placementindia": PlacementIndiaScraper,
+    "shine": ShineScraper,
+}
+
+
+def build_scrapers() -> Dict[str, BaseScraper]:
+    return {source: scraper_cls() for source, scraper_cls in SCRAPER_CLASSES.items()}
+
+
+def source_tasks(scrapers: Dict[str, BaseScraper], search_term: str, location: str, pages: int, incremental: bool = False) -> dict:
+    """Blocking scrape callables per source, run concurrently by the fan-out engine.
+
+    With incremental=True each task returns a ScrapeDelta instead of a job list.
+    """
+    def scrape(source):
+        scraper = scrapers[source]
+        return scraper.scrape_incremental if incremental else scraper.scrape_jobs
+
+    return {
+        "naukri": lambda: scrape("naukri")(search_term, location, pages),
+        # RemoteOnly only lists remote jobs
+        "remoteonly": lambda: scrape("remoteonly")(search_term=search_term, location="remote", pages=1),
+        # PlacementIndia (lightweight requests-based)
+        "placementindia": lambda: scrape("placementindia")(search_term=search_term, location=location, pages=1),
+        # Shine (homepage domain carousels)
+        "shine": lambda: scrape("shine")(search_term=search_term, location=location, pages=1),
+    }
+
+
+def remember_fingerprints(scrapers: Dict[str, BaseScraper], fingerprints: Iterable[Tuple[str, str]]) -> int:
+    """Seed each scraper's SeenCards from stored (job_id, fingerprint) pairs."""
+    remembered = 0
+    for job_id, fingerprint in fingerprints:
+        # Job ids are prefixed with the source (see utils.job_ids)
+        scraper = scrapers.get(job_id.split("-", 1)[0])
+        if scraper is not None:
+            scraper.seen.remember(fingerprint, job_id)
+            remembered += 1
+    return remembered
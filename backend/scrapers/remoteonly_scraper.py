@@ -1,7 +1,7 @@
 """
 Selenium-based scraper for remoteonly.io job listings.
 
-- Opens a visible Chrome window (non-headless)
+- Leases a pooled Chrome session (headless by default, see scrapers.driver_pool)
 - Scrolls the listings page to load as many jobs as available
 - Parses each card and extracts core fields
 - Does not filter by search term (returns all available jobs on the page)
@@ -10,18 +10,22 @@ Selenium-based scraper for remoteonly.io job listings.
 from typing import List, Set
 from urllib.parse import urljoin
 from datetime import datetime
-import uuid
-import time
 
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, class_strainer, SOURCE_UNAVAILABLE
+from scrapers.driver_pool import get_driver_pool
 from models.job import Job
+from utils.job_ids import make_job_id
+
+
+# Classes that mark the root element of a job card
+CARD_ROOT_CLASSES = ["shadow-sm", "rounded-lg", "border", "bg-card"]
 
 
 class RemoteOnlyScraper(BaseScraper):
+    card_selector = 'a[aria-label][href^="/remote-jobs/"]'
+    card_strainer = class_strainer(None, *CARD_ROOT_CLASSES)
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://remoteonly.io"
@@ -31,66 +35,52 @@ class RemoteOnlyScraper(BaseScraper):
 
         list_url = urljoin(self.base_url, "/remote-jobs")
 
-        chrome_options = Options()
-        # IMPORTANT: Do NOT enable headless; we want to show the browser window
-        # chrome_options.add_argument("--headless")  # leave commented to display browser
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--window-size=1280,900")
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-
-        driver = webdriver.Chrome(options=chrome_options)
         try:
-            driver.get(list_url)
-            time.sleep(3)
-
-            # Attempt to scroll to load more jobs (if lazy-loaded)
-            last_height = driver.execute_script("return document.body.scrollHeight")
-            max_scrolls = 8
-            for _ in range(max_scrolls):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1.5)
-                new_height = driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-
-            anchors = soup.select('a[aria-label][href^="/remote-jobs/"]')
-            seen_hrefs: Set[str] = set()
-            print(f"[RemoteOnly] Found {len(anchors)} job anchors")
-
-            for a in anchors:
-                href = a.get("href") or ""
-                if not href or href in seen_hrefs:
-                    continue
-                seen_hrefs.add(href)
+            with get_driver_pool().lease() as driver:
+                self.open_listing(driver, list_url)
+
+                # Scroll to load more jobs (if lazy-loaded) until no new cards appear
+                self.load_lazy_listing(driver, max_scrolls=8)
+
+                html = driver.page_source
 
-                card = self._find_card_root(a)
-                job = self._parse_job_card(card, a)
-                if job:
-                    jobs.append(job)
+            jobs = self.parse_listing(html)
 
+        except SOURCE_UNAVAILABLE:
+            raise
         except Exception as e:
             print(f"RemoteOnly scraping error: {e}")
-        finally:
-            # Keep the window a moment for visibility if run interactively
-            # Comment the next sleep if not desired
-            # time.sleep(2)
-            driver.quit()
 
         return jobs
 
+    def parse_listing(self, html) -> List[Job]:
+        # The strainer keeps card-like containers only; anchors outside any card are dropped
+        soup = self.parse_html(html, self.card_strainer)
+
+        anchors = soup.select(self.card_selector)
+        seen_hrefs: Set[str] = set()
+        print(f"[RemoteOnly] Found {len(anchors)} job anchors")
+
+        jobs: List[Job] = []
+        for a in anchors:
+            href = a.get("href") or ""
+            if not href or href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
+
+            card = self._find_card_root(a)
+            job = self.parse_card(card, self._parse_job_card, a)
+            if job:
+                jobs.append(job)
+        return jobs
+
     def _find_card_root(self, anchor):
         node = anchor
         for _ in range(8):
             if not node:
                 break
             classes = node.get("class") or []
-            if any(k in classes for k in ["shadow-sm", "rounded-lg", "border", "bg-card"]):
+            if any(k in classes for k in CARD_ROOT_CLASSES):
                 return node
             node = node.parent
         return anchor.parent if anchor else None
@@ -139,7 +129,7 @@ class RemoteOnlyScraper(BaseScraper):
                 skills = self.extract_skills(f"{job_title} {job_description}")
 
             return Job(
-                job_id=str(uuid.uuid4()),
+                job_id=make_job_id("RemoteOnly", apply_link, job_title, company_name, location),
                 job_title=job_title or "Remote Role",
                 company_name=company_name,
                 location=location or "Remote",
@@ -10,27 +10,29 @@ Parses cards with classes like:
  - div.jobCard_jobIcon__3FB1t (experience)
  - ul.jobCard_jobCard_jobDetail__jD82J li (misc chips; not skills)
 
-Shows a visible browser window to demonstrate real scraping.
+Uses a pooled (headless by default) browser from scrapers.driver_pool.
 """
 
 from __future__ import annotations
 from typing import List, Optional
 from datetime import datetime
-import time
-import uuid
 
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, class_strainer, SOURCE_UNAVAILABLE
+from scrapers.driver_pool import get_driver_pool
+from scrapers.page_ready import wait_for_cards
 from models.job import Job
+from utils.job_ids import make_job_id
 
 
 class ShineScraper(BaseScraper):
+    card_selector = "div.jobCard_jobCard__jjUmu"
+    min_cards = 8
+    # Only build the active domain tab panel; the rest of the homepage is skipped
+    card_strainer = class_strainer("div", "domainjobs_active_content__ZqqrZ")
+    all_cards_strainer = class_strainer("div", "jobCard_jobCard__jjUmu")
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.shine.com"
@@ -38,62 +40,62 @@ class ShineScraper(BaseScraper):
     def scrape_jobs(self, search_term: str = "", location: str = "India", pages: int = 1) -> List[Job]:
         jobs: List[Job] = []
 
-        chrome_options = Options()
-        # Keep non-headless to show browser activity
-        # chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--window-size=1400,900")
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-
-        driver = webdriver.Chrome(options=chrome_options)
         try:
-            driver.get(self.base_url)
-            # Wait for Domain Jobs section to appear
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".domainjobs_card_container__eJMdE"))
-            )
-            time.sleep(1.5)  # Allow slick sliders to initialize
-
-            # Ensure we are on IT domain tab specifically (only IT jobs)
-            try:
-                tabs = driver.find_elements(By.CSS_SELECTOR, "ul.domainjobs_domainJobs___Zi5l li")
-                for t in tabs:
-                    label = (t.text or "").strip().lower()
-                    if label == "it":
-                        t.click()
-                        time.sleep(0.8)
-                        break
-            except Exception:
-                pass
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-
-            # Limit to the active IT tab panel content
-            containers = soup.select(
-                "div.domainjobs_tab_panel_content__FSMD0.domainjobs_active_content__ZqqrZ .domainjobs_card_container__eJMdE"
-            )
-            cards = []
-            for c in containers:
-                cards.extend(c.select("div.jobCard_jobCard__jjUmu"))
+            with get_driver_pool().lease() as driver:
+                # Wait for the Domain Jobs carousels to render their cards
+                if not self.open_listing(driver, self.base_url):
+                    print("Shine: no job cards rendered")
+
+                # Ensure we are on IT domain tab specifically (only IT jobs)
+                try:
+                    tabs = driver.find_elements(By.CSS_SELECTOR, "ul.domainjobs_domainJobs___Zi5l li")
+                    for t in tabs:
+                        label = (t.text or "").strip().lower()
+                        if label == "it":
+                            t.click()
+                            wait_for_cards(
+                                driver,
+                                f".domainjobs_active_content__ZqqrZ {self.card_selector}",
+                                self.min_cards,
+                                timeout=5.0,
+                            )
+                            break
+                except Exception:
+                    pass
+
+                html = driver.page_source
+
+            jobs = self.parse_listing(html)
+
+        except SOURCE_UNAVAILABLE:
+            raise
+        except Exception as e:
+            print(f"Shine scraping error: {e}")
 
-            if not cards:
-                # Fallback: search globally
-                cards = soup.select("div.jobCard_jobCard__jjUmu")
+        return jobs
 
-            for card in cards:
-                job = self._parse_card(card)
-                if job:
-                    jobs.append(job)
+    def parse_listing(self, html) -> List[Job]:
+        soup = self.parse_html(html, self.card_strainer)
 
-        except Exception as e:
-            print(f"Shine scraping error: {e}")
-        finally:
-            # time.sleep(2)  # keep window visible briefly if debugging
-            driver.quit()
+        # Limit to the active IT tab panel content
+        containers = soup.select(
+            "div.domainjobs_tab_panel_content__FSMD0.domainjobs_active_content__ZqqrZ .domainjobs_card_container__eJMdE"
+        )
+        cards = []
+        for c in containers:
+            cards.extend(c.select("div.jobCard_jobCard__jjUmu"))
+
+        if not cards:
+            # Fallback: search globally (re-parse keeping every card when the first pass was strained)
+            if self.card_strainer is not None:
+                soup = self.parse_html(html, self.all_cards_strainer)
+            cards = soup.select("div.jobCard_jobCard__jjUmu")
 
+        jobs: List[Job] = []
+        for card in cards:
+            job = self.parse_card(card, self._parse_card)
+            if job:
+                jobs.append(job)
         return jobs
 
     def _parse_card(self, card) -> Optional[Job]:
@@ -140,7 +142,7 @@ class ShineScraper(BaseScraper):
                 return None
 
             return Job(
-                job_id=str(uuid.uuid4()),
+                job_id=make_job_id("Shine", apply_link, job_title, company_name, location),
                 job_title=job_title,
                 company_name=company_name,
                 location=location,
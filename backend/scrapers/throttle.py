@@ -0,0 +1,172 @@
+# backend/scrapers/throttle.py
+"""Per-domain politeness and failure isolation for scraper fetches.
+
+Each domain gets a token bucket: `rate` requests per second on average with
+bursts of up to `capacity`. A fetch takes a token before going out and only
+waits when the bucket is empty, so the first requests to a quiet domain go out
+immediately instead of paying a fixed sleep.
+
+Buckets are process-wide and thread-safe; the same bucket serves blocking
+callers (`acquire`) and coroutines (`acquire_async`).
+
+Each domain also gets a circuit breaker: once a site starts blocking us, its
+fetches and browser navigations fail immediately for a cool-down window
+instead of each paying the full request / WebDriverWait timeout.
+
+Configuration (env):
+    SCRAPER_RATE_PER_SECOND   default average request rate per domain (0.5)
+    SCRAPER_BURST             default bucket capacity (2)
+    SCRAPER_BREAKER_FAILURES  consecutive failures before the circuit opens (5)
+    SCRAPER_BREAKER_COOLDOWN  seconds a circuit stays open (120)
+    SCRAPER_BREAKER_TRIAL_TIMEOUT  seconds a half-open trial may run before it
+                              counts as failed (120)
+"""
+import asyncio
+import os
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it.
+
+        Tokens may go negative: callers queue up behind each other in order
+        instead of racing for the next refill.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def domain_of(url: str) -> str:
+    netloc = urlparse(url).netloc.lower()
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+def domain_bucket(url: str) -> TokenBucket:
+    domain = domain_of(url)
+    with _buckets_lock:
+        bucket = _buckets.get(domain)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate=float(os.getenv("SCRAPER_RATE_PER_SECOND", "0.5")),
+                capacity=float(os.getenv("SCRAPER_BURST", "2")),
+            )
+            _buckets[domain] = bucket
+        return bucket
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of fetching while a domain's circuit is open."""
+
+
+class CircuitBreaker:
+    """Fail fast for a domain after repeated failures.
+
+    closed    -> calls go through; `failure_threshold` consecutive failures open it
+    open      -> calls raise CircuitOpenError until `cooldown` seconds have passed
+    half_open -> a single trial call is let through; success closes the circuit,
+                 failure re-opens it for another cooldown. A trial whose outcome
+                 is never recorded expires after `trial_timeout` and counts as
+                 a failure, so a lost trial cannot wedge the breaker.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown: float, trial_timeout: float = 120.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.trial_timeout = trial_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        with self._lock:
+            if self.state == "closed":
+                return
+            if self.state == "open":
+                remaining = self.opened_at + self.cooldown - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(f"circuit open, retry in {remaining:.0f}s")
+                self.state = "half_open"
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                if time.monotonic() - self._trial_started < self.trial_timeout:
+                    raise CircuitOpenError("circuit half-open, trial request in flight")
+                # The trial never reported back: treat it as failed and re-open
+                self.failures += 1
+                self._trial_in_flight = False
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                raise CircuitOpenError(f"circuit open, retry in {self.cooldown:.0f}s")
+            self._trial_in_flight = True
+            self._trial_started = time.monotonic()
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            retry_in = 0.0
+            if self.state == "open":
+                retry_in = max(0.0, self.opened_at + self.cooldown - time.monotonic())
+            return {"state": self.state, "failures": self.failures, "retry_in": round(retry_in, 1)}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def domain_breaker(url: str) -> CircuitBreaker:
+    domain = domain_of(url)
+    with _buckets_lock:
+        breaker = _breakers.get(domain)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=int(os.getenv("SCRAPER_BREAKER_FAILURES", "5")),
+                cooldown=float(os.getenv("SCRAPER_BREAKER_COOLDOWN", "120")),
+                trial_timeout=float(os.getenv("SCRAPER_BREAKER_TRIAL_TIMEOUT", "120")),
+            )
+            _breakers[domain] = breaker
+        return breaker
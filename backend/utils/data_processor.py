@@ -1,9 +1,15 @@
 # backend/utils/data_processor.py
-from typing import List
+from typing import List, Optional
 from models.job import Job
+from utils.dedup import NearDuplicateIndex, StreamDeduper
+from utils.job_filters import JobFilters
 import hashlib
 
 class DataProcessor:
+    def __init__(self):
+        # Long-lived so signatures and duplicate clusters persist between requests
+        self.near_duplicates = NearDuplicateIndex()
+
     @staticmethod
     def remove_duplicates(jobs: List[Job]) -> List[Job]:
         seen = set()
@@ -19,9 +25,18 @@ class DataProcessor:
                 unique_jobs.append(job)
         
         return unique_jobs
+
+    def remove_near_duplicates(self, jobs: List[Job]) -> List[Job]:
+        """Collapse cross-source near-duplicates ("Sr." vs "Senior", "Bengaluru" vs
+        "Bangalore"), keeping the richest record of each cluster."""
+        return self.near_duplicates.dedupe(self.remove_duplicates(jobs))
+
+    def stream_deduper(self) -> StreamDeduper:
+        """Per-stream filter for jobs arriving one source at a time (/api/jobs/stream)."""
+        return StreamDeduper(self.near_duplicates)
     
     @staticmethod
-    def filter_jobs(jobs: List[Job], location: str = None, job_type: str = None) -> List[Job]:
+    def filter_jobs(jobs: List[Job], location: str = None, job_type: str = None, filters: Optional[JobFilters] = None) -> List[Job]:
         filtered = jobs
         
         if location:
@@ -29,5 +44,9 @@ class DataProcessor:
         
         if job_type:
             filtered = [job for job in filtered if job_type.lower() in job.job_type.lower()]
+
+        if filters:
+            # Same semantics as the store's indexed filters (utils.job_filters)
+            filtered = [job for job in filtered if filters.matches(job)]
         
         return filtered
\ No newline at end of file
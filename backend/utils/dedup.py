@@ -0,0 +1,252 @@
+# backend/utils/dedup.py
+"""Near-duplicate detection for jobs scraped from different sources.
+
+The same posting shows up as "Sr. Software Engineer" at "Infosys Ltd" in
+"Bengaluru" on one site and "Senior Software Engineer" at "Infosys" in
+"Bangalore, Karnataka" on another. We normalize title / company / location
+into a feature set, compute a MinHash signature and bucket it with LSH, so
+each new job is only compared against the few jobs sharing a band bucket.
+Candidates are confirmed with an exact Jaccard check and must have the same
+normalized company. Adding n jobs is roughly O(n).
+
+The index is long-lived (one per DataProcessor) so signatures and clusters
+carry over between requests; it is bounded and evicts the oldest entries.
+"""
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set
+
+from models.job import Job
+
+# Token-level rewrites applied to titles, companies and locations
+SYNONYMS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "jnr": "junior",
+    "engg": "engineer", "eng": "engineer", "engr": "engineer",
+    "dev": "developer", "devs": "developer", "mgr": "manager",
+    "swe": "software engineer", "sde": "software development engineer",
+    "ml": "machine learning", "ai": "artificial intelligence",
+    "fullstack": "full stack", "frontend": "front end", "backend": "back end",
+    "bengaluru": "bangalore", "gurugram": "gurgaon", "bombay": "mumbai",
+    "madras": "chennai", "calcutta": "kolkata", "trivandrum": "thiruvananthapuram",
+    "ncr": "delhi",
+}
+
+# Legal / filler words dropped from company names
+COMPANY_STOPWORDS = {
+    "pvt", "private", "ltd", "limited", "inc", "llc", "llp", "corp", "corporation",
+    "co", "company", "the", "india",
+}
+
+NUM_PERM = 32
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+# High enough that "Python Developer" and "Senior Python Developer" stay separate
+SIMILARITY_THRESHOLD = 0.75
+
+# Fixed per-permutation XOR masks so signatures are stable across processes
+_PERM_MASKS = [
+    int.from_bytes(hashlib.blake2b(f"perm-{i}".encode(), digest_size=8).digest(), "big")
+    for i in range(NUM_PERM)
+]
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def _hash64(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def normalize_tokens(text: str) -> List[str]:
+    tokens: List[str] = []
+    for token in _TOKEN_RE.findall((text or "").lower()):
+        tokens.extend(SYNONYMS.get(token, token).split())
+    return tokens
+
+
+def normalize_company(name: str) -> str:
+    return " ".join(t for t in normalize_tokens(name) if t not in COMPANY_STOPWORDS)
+
+
+def normalize_location(location: str) -> str:
+    # "Bangalore, Karnataka" / "Bengaluru (Hybrid)" -> "bangalore"
+    first = re.split(r"[,(/|]", location or "", maxsplit=1)[0]
+    return " ".join(normalize_tokens(first))
+
+
+def job_features(job: Job) -> FrozenSet[str]:
+    """Title unigrams + bigrams, plus company and location as whole features."""
+    title = normalize_tokens(job.job_title)
+    features: Set[str] = {f"t:{t}" for t in title}
+    features.update(f"t:{a}_{b}" for a, b in zip(title, title[1:]))
+    features.add(f"c:{normalize_company(job.company_name)}")
+    features.add(f"l:{normalize_location(job.location)}")
+    return frozenset(features)
+
+
+def minhash(features: FrozenSet[str]) -> List[int]:
+    hashes = [_hash64(f) for f in features] or [0]
+    return [min(map(mask.__xor__, hashes)) for mask in _PERM_MASKS]
+
+
+def richness(job: Job) -> int:
+    """How much usable detail a record carries; the richest duplicate is kept."""
+    placeholders = {"", "not disclosed", "not specified", "recently", "unknown", "india"}
+    score = 0
+    for value in (job.salary, job.experience_required, job.posted_date, job.location, job.company_name):
+        if (value or "").strip().lower() not in placeholders:
+            score += 10
+    for value in (job.company_logo_url, job.industry, job.education_required):
+        if value:
+            score += 5
+    score += 3 * len(job.skills)
+    score += min(len(job.job_description or ""), 500) // 50
+    return score
+
+
+class _Entry:
+    __slots__ = ("features", "company", "bands", "cluster")
+
+    def __init__(self, features: FrozenSet[str], company: str, bands: List[int], cluster: int):
+        self.features = features
+        self.company = company
+        self.bands = bands
+        self.cluster = cluster
+
+
+class NearDuplicateIndex:
+    def __init__(self, max_entries: Optional[int] = None, threshold: float = SIMILARITY_THRESHOLD):
+        self.max_entries = max_entries or int(os.getenv("DEDUP_INDEX_MAX_ENTRIES", "100000"))
+        self.threshold = threshold
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._buckets: Dict[tuple, Set[str]] = {}
+        self._clusters: Dict[int, Set[str]] = {}
+        self._next_cluster = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(job: Job) -> str:
+        return job.job_id
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _candidates(self, bands: List[int]) -> Set[str]:
+        found: Set[str] = set()
+        for band_no, band_hash in enumerate(bands):
+            found.update(self._buckets.get((band_no, band_hash), ()))
+        return found
+
+    def _merge(self, keep: int, drop: int):
+        # Relabel the smaller cluster so merges stay cheap overall
+        if len(self._clusters[keep]) < len(self._clusters[drop]):
+            keep, drop = drop, keep
+        for member in self._clusters.pop(drop):
+            self._entries[member].cluster = keep
+            self._clusters[keep].add(member)
+        return keep
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        for band_no, band_hash in enumerate(entry.bands):
+            bucket = self._buckets.get((band_no, band_hash))
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[(band_no, band_hash)]
+        members = self._clusters.get(entry.cluster)
+        if members is not None:
+            members.discard(key)
+            if not members:
+                del self._clusters[entry.cluster]
+
+    def add(self, job: Job) -> int:
+        """Index a job and return its cluster id (shared by all its near-duplicates)."""
+        key = self.key(job)
+        features = job_features(job)
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None and existing.features == features:
+                self._entries.move_to_end(key)
+                return existing.cluster
+            if existing is not None:
+                # Content changed: drop the old entry and index it again
+                self._remove(key)
+
+            signature = minhash(features)
+            bands = [hash(tuple(signature[b * ROWS:(b + 1) * ROWS])) for b in range(BANDS)]
+            company = normalize_company(job.company_name)
+
+            cluster = None
+            for other_key in self._candidates(bands):
+                other = self._entries[other_key]
+                if other.company != company or other.cluster == cluster:
+                    continue
+                similarity = len(features & other.features) / len(features | other.features)
+                if similarity >= self.threshold:
+                    cluster = other.cluster if cluster is None else self._merge(cluster, other.cluster)
+
+            if cluster is None:
+                cluster = self._next_cluster
+                self._next_cluster += 1
+                self._clusters[cluster] = set()
+            self._clusters[cluster].add(key)
+            self._entries[key] = _Entry(features, company, bands, cluster)
+            for band_no, band_hash in enumerate(bands):
+                self._buckets.setdefault((band_no, band_hash), set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+            return self._entries[key].cluster
+
+    def cluster_of(self, key: str) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.cluster if entry is not None else None
+
+    def warm(self, jobs: List[Job]) -> int:
+        for job in jobs:
+            self.add(job)
+        return len(self._entries)
+
+    def dedupe(self, jobs: List[Job]) -> List[Job]:
+        """Collapse near-duplicates in `jobs`, keeping the richest record of each
+        cluster at the position of the cluster's first occurrence."""
+        clusters = [self.add(job) for job in jobs]
+        # add() may merge clusters after earlier jobs were labelled; resolve final ids
+        with self._lock:
+            final = [self._entries[self.key(job)].cluster if self.key(job) in self._entries else c
+                     for job, c in zip(jobs, clusters)]
+        best: Dict[int, Job] = {}
+        order: List[int] = []
+        for job, cluster in zip(jobs, final):
+            current = best.get(cluster)
+            if current is None:
+                order.append(cluster)
+                best[cluster] = job
+            elif richness(job) > richness(current):
+                best[cluster] = job
+        return [best[c] for c in order]
+
+
+class StreamDeduper:
+    """Drops jobs that duplicate ones already sent on a stream.
+
+    Batches arrive one source at a time; clusters can merge as later batches
+    are indexed, so already-emitted jobs are re-resolved to their current
+    cluster for every batch.
+    """
+
+    def __init__(self, index: NearDuplicateIndex):
+        self.index = index
+        self._emitted: List[str] = []
+
+    def filter(self, jobs: List[Job]) -> List[Job]:
+        batch = self.index.dedupe(jobs)
+        emitted_clusters = {self.index.cluster_of(key) for key in self._emitted}
+        emitted_clusters.discard(None)  # evicted from the index
+        fresh = [job for job in batch if self.index.cluster_of(self.index.key(job)) not in emitted_clusters]
+        self._emitted.extend(self.index.key(job) for job in fresh)
+        return fresh
@@ -0,0 +1,109 @@
+# backend/utils/fanout.py
+"""Concurrent fan-out of blocking scraper calls.
+
+Every scraper is synchronous (Selenium / requests), so we run each source in a
+bounded thread pool (SCRAPER_MAX_WORKERS threads, shared by the scheduler,
+/api/jobs and /api/jobs/stream) and await the futures from the event loop.
+Each source has its own deadline, counted from when a thread starts it;
+sources that do not finish in time are reported as late and their results are
+dropped for this request (the worker thread is left to finish in the
+background, we never block the loop waiting for it). Late scrapes still hold
+their threads, so a source that waits longer than SCRAPER_QUEUE_SECONDS for a
+free thread is reported as late too, without ever running.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from models.job import Job
+
+# Status markers used in source_breakdown for sources that did not return jobs
+STATUS_TIMEOUT = "timeout"
+
+# Returns a list of jobs, or a ScrapeDelta for incremental scrapes (scrapers.incremental)
+ScrapeTask = Callable[[], List[Job]]
+
+
+class ScrapeFanout:
+    def __init__(self, max_workers: Optional[int] = None, default_deadline: Optional[float] = None):
+        self.max_workers = max_workers or int(os.getenv("SCRAPER_MAX_WORKERS", "4"))
+        self.default_deadline = default_deadline or float(os.getenv("SCRAPER_DEADLINE_SECONDS", "60"))
+        self.queue_timeout = float(os.getenv("SCRAPER_QUEUE_SECONDS", "60"))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scraper")
+
+    def deadline_for(self, source: str, deadlines: Optional[Dict[str, float]] = None) -> float:
+        """Per-source deadline: explicit override, then SCRAPER_DEADLINE_<SOURCE>, then default."""
+        if deadlines and source in deadlines:
+            return deadlines[source]
+        env_value = os.getenv(f"SCRAPER_DEADLINE_{source.upper()}")
+        if env_value:
+            try:
+                return float(env_value)
+            except ValueError:
+                pass
+        return self.default_deadline
+
+    async def _run_one(self, source: str, task: ScrapeTask, deadline: float) -> Tuple[str, Optional[List[Job]], str]:
+        loop = asyncio.get_running_loop()
+        started = loop.create_future()
+
+        def mark_started():
+            if not started.done():
+                started.set_result(time.monotonic())
+
+        def run():
+            loop.call_soon_threadsafe(mark_started)
+            return task()
+
+        future = loop.run_in_executor(self._executor, run)
+        # Waiting for a free thread does not count against the deadline
+        await asyncio.wait({started, future}, timeout=self.queue_timeout, return_when=asyncio.FIRST_COMPLETED)
+        if not started.done() and not future.done():
+            future.cancel()
+            print(f"[fanout] {source}: no free scraper thread within {self.queue_timeout:.0f}s")
+            return source, None, STATUS_TIMEOUT
+        started_at = started.result() if started.done() else time.monotonic()
+        try:
+            jobs = await asyncio.wait_for(future, timeout=max(0.0, started_at + deadline - time.monotonic()))
+            print(f"[fanout] {source}: {len(jobs or [])} jobs in {time.monotonic() - started_at:.1f}s")
+            return source, jobs if jobs is not None else [], "ok"
+        except asyncio.TimeoutError:
+            print(f"[fanout] {source}: missed deadline of {deadline:.0f}s")
+            return source, None, STATUS_TIMEOUT
+        except Exception as e:
+            print(f"Error with {source} scraper: {e}")
+            return source, [], "error"
+
+    async def run_sources(
+        self,
+        tasks: Dict[str, ScrapeTask],
+        deadlines: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Tuple[Optional[List[Job]], str]]:
+        """Run all tasks concurrently; map each source to (jobs, status).
+
+        jobs is None when the source missed its deadline.
+        """
+        results = await asyncio.gather(*[
+            self._run_one(source, task, self.deadline_for(source, deadlines))
+            for source, task in tasks.items()
+        ])
+        return {source: (jobs, status) for source, jobs, status in results}
+
+    async def iter_sources(
+        self,
+        tasks: Dict[str, ScrapeTask],
+        deadlines: Optional[Dict[str, float]] = None,
+    ) -> AsyncIterator[Tuple[str, Optional[List[Job]], str]]:
+        """Like run_sources, but yield (source, jobs, status) as each source finishes."""
+        pending = [
+            self._run_one(source, task, self.deadline_for(source, deadlines))
+            for source, task in tasks.items()
+        ]
+        for finished in asyncio.as_completed(pending):
+            yield await finished
+
+    def shutdown(self):
+        # Do not wait for late scrapers; their browsers are closed by the scrapers themselves
+        self._executor.shutdown(wait=False, cancel_futures=True)
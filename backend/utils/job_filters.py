@@ -0,0 +1,90 @@
+# backend/utils/job_filters.py
+"""Listing filters shared by the job store (Mongo queries) and DataProcessor
+(in-memory, used when the store is unavailable).
+
+Jobs are stored with normalized facet fields so every filter is an indexed
+equality match instead of a substring scan:
+
+    location_keys   ["bangalore", "karnataka"] for "Bengaluru, Karnataka"
+    job_type_key    "full-time"
+    source_key      "naukri"
+    skills_key      ["python", "django"]
+"""
+import re
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from models.job import Job
+from utils.dedup import normalize_tokens
+
+
+def location_keys(location: str) -> List[str]:
+    parts = re.split(r"[,(/|+)]", location or "")
+    keys = [" ".join(normalize_tokens(part)) for part in parts]
+    return list(dict.fromkeys(k for k in keys if k))
+
+
+def _key(value: str) -> str:
+    return " ".join((value or "").lower().split())
+
+
+def facet_fields(job: Job) -> dict:
+    return {
+        "location_keys": location_keys(job.location),
+        "job_type_key": _key(job.job_type),
+        "source_key": _key(job.source),
+        "skills_key": list(dict.fromkeys(_key(s) for s in job.skills if s)),
+    }
+
+
+class JobFilters:
+    def __init__(
+        self,
+        city: Optional[str] = None,
+        job_type: Optional[str] = None,
+        source: Optional[str] = None,
+        remote_friendly: Optional[bool] = None,
+        skills: Optional[List[str]] = None,
+        posted_within_days: Optional[int] = None,
+    ):
+        self.city = " ".join(normalize_tokens(city)) if city else None
+        self.job_type = _key(job_type) if job_type else None
+        self.source = _key(source) if source else None
+        self.remote_friendly = remote_friendly
+        self.skills = [_key(s) for s in skills or [] if s.strip()]
+        self.posted_within_days = posted_within_days
+
+    def to_mongo(self) -> dict:
+        query: dict = {}
+        if self.city:
+            query["location_keys"] = self.city
+        if self.job_type:
+            query["job_type_key"] = self.job_type
+        if self.source:
+            query["source_key"] = self.source
+        if self.remote_friendly is not None:
+            query["remote_friendly"] = self.remote_friendly
+        if self.skills:
+            query["skills_key"] = {"$all": self.skills}
+        if self.posted_within_days is not None:
+            # Sites rarely give a usable posting date, so "posted" means first seen by us
+            query["first_seen_at"] = {"$gte": datetime.utcnow() - timedelta(days=self.posted_within_days)}
+        return query
+
+    def matches(self, job: Job) -> bool:
+        facets = facet_fields(job)
+        if self.city and self.city not in facets["location_keys"]:
+            return False
+        if self.job_type and self.job_type != facets["job_type_key"]:
+            return False
+        if self.source and self.source != facets["source_key"]:
+            return False
+        if self.remote_friendly is not None and job.remote_friendly != self.remote_friendly:
+            return False
+        if self.skills and not set(self.skills) <= set(facets["skills_key"]):
+            return False
+        if self.posted_within_days is not None:
+            cutoff = datetime.now() - timedelta(days=self.posted_within_days)
+            if job.scraped_at < cutoff:
+                return False
+        return True
@@ -0,0 +1,67 @@
+# backend/utils/job_ids.py
+"""Stable job identifiers.
+
+A posting keeps the same `job_id` across scrapes: it is derived from the
+source plus the canonical apply URL (scheme/host lower-cased, fragment and
+tracking parameters dropped, remaining query sorted). When a scraper could
+only fall back to the site root, the normalized title/company/location is
+hashed instead so distinct postings don't collide.
+"""
+import hashlib
+import re
+from typing import Iterable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from models.job import Job
+
+# Query parameters that vary between visits but not between postings
+TRACKING_PARAMS = {"src", "sid", "ref", "referrer", "source", "xp", "px", "gclid", "fbclid", "from", "tk", "vjk"}
+
+JOB_ID_RE = re.compile(r"^[a-z0-9]+-[0-9a-f]{20}$")
+
+
+def canonical_url(url: str) -> str:
+    parts = urlsplit((url or "").strip())
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:20]
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def make_job_id(source: str, apply_link: str, job_title: str, company_name: str, location: str) -> str:
+    """Deterministic id, e.g. "naukri-3f1c0e..."; same posting -> same id on every scrape."""
+    prefix = re.sub(r"[^a-z0-9]", "", source.lower()) or "job"
+    url = canonical_url(apply_link)
+    if urlsplit(url).path:
+        return f"{prefix}-{_digest(url)}"
+    # No posting-specific URL (scraper fell back to the site root)
+    content = "|".join(_normalize(v) for v in (job_title, company_name, location))
+    return f"{prefix}-{_digest(content)}"
+
+
+def is_stable_job_id(job_id: str) -> bool:
+    return bool(JOB_ID_RE.match(job_id or ""))
+
+
+def content_hash(job: Job) -> str:
+    """Digest of a posting's displayed fields (scraped_at excluded), to spot unchanged jobs."""
+    fields = job.model_dump(exclude={"scraped_at"})
+    return hashlib.sha1(repr(sorted(fields.items())).encode("utf-8")).hexdigest()
+
+
+def listing_etag(jobs: Iterable[Job]) -> str:
+    digest = hashlib.sha1()
+    for job in jobs:
+        digest.update(job.job_id.encode("utf-8"))
+        digest.update(content_hash(job).encode("ascii"))
+    return f'"{digest.hexdigest()}"'
@@ -0,0 +1,294 @@
+# backend/utils/job_store.py
+"""MongoDB-backed job store.
+
+Scraped jobs are upserted into the `jobs` collection by their stable
+`job_id` (see utils.job_ids) and tagged with the
+normalized (search_term, location) query that produced them. Every successful
+scrape of a source for a query (one that returned jobs) is recorded in
+`job_refreshes`, which is what `/api/jobs` uses to decide whether stored data
+is fresh enough to serve.
+
+Incremental refreshes (`apply_delta`) only write new or changed postings;
+unchanged ones are re-tagged with the query and postings the query no longer
+lists are untagged, so writes scale with churn rather than listing size.
+A posting left with no query is stamped `unlisted_at` (and `updated_at`, so
+the job vector index drops it on its next sync) until a scrape lists it again.
+
+Listings are read a page at a time (`find_jobs`), newest first, with an opaque
+cursor over (first_seen_at, job_id) and filters on indexed facet fields (see
+utils.job_filters), so a page costs the same however large the corpus gets.
+
+`search_jobs` runs ranked full-text search over every stored job through a
+weighted MongoDB text index (title > skills > company > description). Mongo
+keeps the index up to date as scrapes are upserted, so searching never
+triggers a scrape.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateMany, UpdateOne
+
+from models.job import Job
+from scrapers.incremental import ScrapeDelta
+from utils.job_filters import JobFilters, facet_fields
+from utils.job_ids import JOB_ID_RE
+
+# Full-text search weights (relative importance of a term match per field)
+TEXT_WEIGHTS = {"job_title": 10, "skills": 5, "company_name": 3, "job_description": 1}
+
+# Listing sort order; first_seen_at never changes, so cursors stay valid across refreshes
+LISTING_SORT = [("first_seen_at", -1), ("job_id", -1)]
+
+# Facet fields (utils.job_filters.facet_fields); only scalar ones can share a
+# compound index with the `queries` array
+SCALAR_FACETS = ("source_key", "job_type_key")
+ARRAY_FACETS = ("location_keys", "skills_key")
+
+
+def encode_cursor(doc: dict) -> str:
+    raw = json.dumps([doc["first_seen_at"].isoformat(), doc["job_id"]])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Raises ValueError for a malformed cursor."""
+    try:
+        seen_at, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(seen_at), str(job_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class JobStore:
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.jobs = db.jobs
+        self.refreshes = db.job_refreshes
+
+    async def ensure_indexes(self):
+        # Jobs used to be keyed by (source, apply_link) with a random uuid job_id;
+        # drop that index and the uuid-keyed docs, they are re-scraped on the next refresh
+        if "source_1_apply_link_1" in await self.jobs.index_information():
+            await self.jobs.drop_index("source_1_apply_link_1")
+            await self.jobs.delete_many({"job_id": {"$not": JOB_ID_RE}})
+        # `queries`, `location_keys` and `skills_key` are all arrays and Mongo cannot
+        # index parallel arrays: drop compound indexes over two of them (they made
+        # every job write fail)
+        existing = await self.jobs.index_information()
+        for facet in ARRAY_FACETS:
+            name = "_".join(f"{field}_{direction}" for field, direction in [("queries", 1), (facet, 1)] + LISTING_SORT)
+            if name in existing:
+                await self.jobs.drop_index(name)
+        await self.jobs.create_index("job_id", unique=True)
+        # Listing indexes: the query tag, an optional scalar facet, then the sort keys
+        await self.jobs.create_index([("queries", 1)] + LISTING_SORT)
+        for facet in SCALAR_FACETS:
+            await self.jobs.create_index([("queries", 1), (facet, 1)] + LISTING_SORT)
+        # Array facets get their own indexes; Mongo intersects them with the query tag
+        for facet in ARRAY_FACETS:
+            await self.jobs.create_index([(facet, 1)] + LISTING_SORT)
+        await self.jobs.create_index([("updated_at", 1), ("job_id", 1)])
+        await self.jobs.create_index(
+            [(field, "text") for field in TEXT_WEIGHTS], weights=TEXT_WEIGHTS, name="job_text"
+        )
+        await self.backfill_facets()
+        await self.backfill_unlisted()
+        await self.refreshes.create_index([("source", 1), ("query", 1)], unique=True)
+
+    @staticmethod
+    def query_key(search_term: str, location: str) -> str:
+        term = " ".join((search_term or "").lower().split())
+        loc = " ".join((location or "").lower().split())
+        return f"{term}|{loc}"
+
+    @staticmethod
+    def doc_to_job(doc: dict) -> Job:
+        return Job(**{k: doc[k] for k in Job.model_fields if k in doc})
+
+    @staticmethod
+    def _upsert_op(job: Job, query: str, now: datetime, fingerprint: Optional[str] = None) -> UpdateOne:
+        doc = job.model_dump()
+        doc.update(facet_fields(job))
+        doc["updated_at"] = now
+        if fingerprint:
+            doc["fingerprint"] = fingerprint
+        return UpdateOne(
+            {"job_id": job.job_id},
+            {
+                "$set": doc,
+                "$addToSet": {"queries": query},
+                "$setOnInsert": {"first_seen_at": now},
+                "$unset": {"unlisted_at": ""},
+            },
+            upsert=True,
+        )
+
+    async def _record_refresh(self, source: str, query: str, now: datetime, count: int, **extra):
+        await self.refreshes.update_one(
+            {"source": source, "query": query},
+            {"$set": {"refreshed_at": now, "count": count, **extra}},
+            upsert=True,
+        )
+
+    async def upsert_jobs(self, source: str, query: str, jobs: List[Job]) -> int:
+        """Upsert jobs scraped from `source` for `query` and record the refresh time.
+
+        Scrapers return [] when blocked or broken, so an empty scrape is not
+        recorded: the source stays stale and `/api/jobs` keeps retrying it.
+        """
+        if not jobs:
+            return 0
+        now = datetime.utcnow()
+        ops = [self._upsert_op(job, query, now) for job in jobs]
+        await self.jobs.bulk_write(ops, ordered=False)
+        await self._record_refresh(source, query, now, len(jobs))
+        return len(ops)
+
+    async def apply_delta(self, source: str, query: str, delta: ScrapeDelta) -> Dict[str, int]:
+        """Persist an incremental scrape of `source` for `query`; returns the
+        added / updated / unchanged / removed counts (also stored on the refresh)."""
+        if not len(delta):
+            # An empty scrape is treated as a failure rather than "everything was
+            # removed", and not recorded as a refresh (see upsert_jobs)
+            return delta.counts()
+        now = datetime.utcnow()
+        ops = [self._upsert_op(job, query, now, delta.fingerprint_of(job.job_id)) for job in delta.changed]
+        if delta.unchanged:
+            # No-op for postings already tagged with this query
+            ops.append(UpdateMany({"job_id": {"$in": delta.unchanged}}, {"$addToSet": {"queries": query}}))
+            ops.append(UpdateMany(
+                {"job_id": {"$in": delta.unchanged}, "unlisted_at": {"$exists": True}},
+                {"$set": {"updated_at": now}, "$unset": {"unlisted_at": ""}},
+            ))
+        if ops:
+            await self.jobs.bulk_write(ops, ordered=False)
+        # Job ids are prefixed with the source (see utils.job_ids)
+        result = await self.jobs.update_many(
+            {"job_id": {"$regex": f"^{source}-", "$nin": delta.job_ids}, "queries": query},
+            {"$pull": {"queries": query}},
+        )
+        delta.removed = result.modified_count
+        if delta.removed:
+            await self._stamp_unlisted({"job_id": {"$regex": f"^{source}-", "$nin": delta.job_ids}}, now)
+        counts = delta.counts()
+        await self._record_refresh(source, query, now, len(delta), changes=counts)
+        return counts
+
+    async def _stamp_unlisted(self, mongo_query: dict, now: datetime) -> int:
+        result = await self.jobs.update_many(
+            {**mongo_query, "queries": {"$size": 0}, "unlisted_at": {"$exists": False}},
+            {"$set": {"unlisted_at": now, "updated_at": now}},
+        )
+        return result.modified_count
+
+    async def card_fingerprints(self, limit: int) -> List[tuple]:
+        """(job_id, fingerprint) of the most recently updated postings, to warm scrapers' SeenCards."""
+        cursor = self.jobs.find(
+            {"fingerprint": {"$exists": True}}, {"job_id": 1, "fingerprint": 1, "_id": 0}
+        ).sort("updated_at", -1).limit(limit)
+        return [(doc["job_id"], doc["fingerprint"]) async for doc in cursor]
+
+    async def last_refreshed(self, query: str, sources: Iterable[str]) -> Optional[datetime]:
+        """Oldest refresh time across `sources` for `query`; None if any source was never scraped."""
+        sources = list(sources)
+        times: Dict[str, datetime] = {}
+        async for doc in self.refreshes.find({"query": query, "source": {"$in": sources}}):
+            times[doc["source"]] = doc["refreshed_at"]
+        if len(times) < len(sources):
+            return None
+        return min(times.values())
+
+    async def recent_jobs(self, limit: int) -> List[Job]:
+        cursor = self.jobs.find({}).sort("updated_at", -1).limit(limit)
+        return [self.doc_to_job(doc) async for doc in cursor]
+
+    async def get_job(self, job_id: str) -> Optional[Job]:
+        doc = await self.jobs.find_one({"job_id": job_id})
+        return self.doc_to_job(doc) if doc else None
+
+    async def get_jobs(self, job_ids: List[str], listed_only: bool = False) -> List[Job]:
+        """Jobs for `job_ids`, in that order (ids no longer stored are skipped,
+        and with `listed_only` so are postings no query lists any more)."""
+        mongo_query = {"job_id": {"$in": job_ids}}
+        if listed_only:
+            mongo_query["queries.0"] = {"$exists": True}
+        docs = {doc["job_id"]: doc async for doc in self.jobs.find(mongo_query)}
+        return [self.doc_to_job(docs[job_id]) for job_id in job_ids if job_id in docs]
+
+    async def jobs_updated_since(
+        self, since: Optional[datetime], after_id: str = "", limit: int = 1000
+    ) -> List[Tuple[Job, datetime, bool]]:
+        """(job, updated_at, listed) for jobs written at or after `since`, oldest first.
+
+        Pages are keyed on (updated_at, job_id): a bulk upsert stamps every job
+        with the same time, so pass the last pair back as (`since`, `after_id`).
+        """
+        mongo_query = {}
+        if since is not None:
+            mongo_query = {"$or": [
+                {"updated_at": {"$gt": since}},
+                {"updated_at": since, "job_id": {"$gt": after_id}},
+            ]}
+        cursor = self.jobs.find(mongo_query).sort([("updated_at", 1), ("job_id", 1)]).limit(limit)
+        return [(self.doc_to_job(doc), doc["updated_at"], bool(doc.get("queries"))) async for doc in cursor]
+
+    async def backfill_unlisted(self) -> int:
+        """Stamp postings untagged before `unlisted_at` existed; returns how many."""
+        return await self._stamp_unlisted({}, datetime.utcnow())
+
+    async def backfill_facets(self, batch_size: int = 1000) -> int:
+        """Add facet fields to jobs stored before they existed; returns how many were updated."""
+        updated = 0
+        while True:
+            docs = await self.jobs.find({"source_key": {"$exists": False}}).limit(batch_size).to_list(batch_size)
+            if not docs:
+                return updated
+            await self.jobs.bulk_write([
+                UpdateOne({"_id": doc["_id"]}, {"$set": {
+                    **facet_fields(self.doc_to_job(doc)),
+                    "first_seen_at": doc.get("first_seen_at") or doc.get("updated_at") or datetime.utcnow(),
+                }})
+                for doc in docs
+            ], ordered=False)
+            updated += len(docs)
+
+    async def find_jobs(
+        self,
+        query: str,
+        filters: Optional[JobFilters] = None,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Job], Optional[str]]:
+        """One page of jobs for `query`, newest first.
+
+        Returns (jobs, next_cursor); next_cursor is None on the last page.
+        Raises ValueError for a malformed `after` cursor.
+        """
+        mongo_query = {"queries": query, **(filters.to_mongo() if filters else {})}
+        if after:
+            seen_at, job_id = decode_cursor(after)
+            position = {"$or": [
+                {"first_seen_at": {"$lt": seen_at}},
+                {"first_seen_at": seen_at, "job_id": {"$lt": job_id}},
+            ]}
+            mongo_query = {"$and": [mongo_query, position]}
+        # One extra document tells us whether there is a next page
+        docs = await self.jobs.find(mongo_query).sort(LISTING_SORT).limit(limit + 1).to_list(limit + 1)
+        next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+        return [self.doc_to_job(doc) for doc in docs[:limit]], next_cursor
+
+    async def search_jobs(
+        self,
+        text: str,
+        filters: Optional[JobFilters] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[Tuple[Job, float]]:
+        """Stored jobs matching `text`, best first, as (job, relevance score) pairs."""
+        mongo_query = {"$text": {"$search": text}, **(filters.to_mongo() if filters else {})}
+        score = {"score": {"$meta": "textScore"}}
+        cursor = self.jobs.find(mongo_query, score).sort([("score", {"$meta": "textScore"})]).skip(offset).limit(limit)
+        return [(self.doc_to_job(doc), doc["score"]) async for doc in cursor]
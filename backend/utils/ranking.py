@@ -0,0 +1,132 @@
+# backend/utils/ranking.py
+"""Local job ranking for /api/recommendations.
+
+Jobs and the resume are turned into hashed TF-IDF vectors (words and word
+pairs from the title, description and canonical skills, see utils.skills).
+The candidate set is held as one sparse matrix in coordinate form (NumPy
+arrays of rows / columns / weights), so scoring every job against the
+resume is a single vectorised pass however many jobs are sent. A batch of
+resumes against one job pool builds that matrix once (JobMatrix).
+"""
+import re
+import zlib
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from models.job import Job
+from utils.skills import skill_matcher
+
+# Hashed feature space; collisions at 2^18 are rare for job-card vocabularies
+DIMENSIONS = 1 << 18
+
+# Relative weight of each field's terms
+FIELD_WEIGHTS = {"title": 3.0, "skills": 3.0, "text": 1.0}
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or our the to we will with you your "
+    "experience years year work working team role job candidate candidates looking skills good strong".split()
+)
+
+
+def _hash(term: str) -> int:
+    # crc32 rather than hash(): stable across processes and restarts
+    return zlib.crc32(term.encode("utf-8")) & (DIMENSIONS - 1)
+
+
+def _words(text: str) -> List[str]:
+    words = []
+    for token in _TOKEN.findall((text or "").lower()):
+        token = token.rstrip(".")
+        if token and token not in _STOPWORDS:
+            words.append(token)
+    return words
+
+
+def _add_terms(counts: Dict[int, float], field: str, text: str):
+    weight = FIELD_WEIGHTS[field]
+    words = _words(text)
+    for word in words:
+        key = _hash(f"{field}:{word}")
+        counts[key] = counts.get(key, 0.0) + weight
+    for first, second in zip(words, words[1:]):
+        key = _hash(f"{field}:{first} {second}")
+        counts[key] = counts.get(key, 0.0) + weight
+
+
+def _add_skills(counts: Dict[int, float], skills: Iterable[str]):
+    for skill in skill_matcher.normalize(skills):
+        key = _hash(f"skills:{skill.lower()}")
+        counts[key] = counts.get(key, 0.0) + FIELD_WEIGHTS["skills"]
+
+
+def job_terms(job: Job) -> Dict[int, float]:
+    counts: Dict[int, float] = {}
+    _add_terms(counts, "title", job.job_title)
+    _add_terms(counts, "text", job.job_description)
+    _add_skills(counts, job.skills)
+    return counts
+
+
+def resume_terms(resume: dict) -> Dict[int, float]:
+    """Resume fields as produced by /api/parse-resume(s)."""
+    counts: Dict[int, float] = {}
+    experience = resume.get("experience") or []
+    education = resume.get("education") or []
+    text = "\n".join([*map(str, experience), *map(str, education), str(resume.get("raw_text_snippet") or "")])
+    _add_terms(counts, "text", text)
+    # Experience lines usually carry past job titles
+    _add_terms(counts, "title", "\n".join(map(str, experience)))
+    _add_skills(counts, resume.get("skills") or [])
+    return counts
+
+
+def _sublinear(values: np.ndarray) -> np.ndarray:
+    return 1.0 + np.log(values)
+
+
+class JobMatrix:
+    """Weighted term matrix of a candidate set, built once and scored against
+    any number of resumes (read-only after construction, so thread-safe)."""
+
+    def __init__(self, jobs: Sequence[Job]):
+        per_job = [job_terms(job) for job in jobs]
+        lengths = np.fromiter((len(terms) for terms in per_job), dtype=np.int64, count=len(per_job))
+        total = int(lengths.sum())
+        self.count = len(per_job)
+        self.rows = np.repeat(np.arange(self.count), lengths)
+        self.cols = np.fromiter((key for terms in per_job for key in terms), dtype=np.int64, count=total)
+        vals = np.fromiter((value for terms in per_job for value in terms.values()), dtype=np.float64, count=total)
+
+        # IDF over the candidate set: terms every job shares say little about fit
+        df = np.bincount(self.cols, minlength=DIMENSIONS)
+        self.idf = np.log((1.0 + self.count) / (1.0 + df)) + 1.0
+
+        self.vals = _sublinear(vals) * self.idf[self.cols]
+        self.norms = np.sqrt(np.bincount(self.rows, weights=self.vals * self.vals, minlength=self.count))
+
+    def score(self, resume: dict) -> List[Tuple[int, float]]:
+        """(index into the jobs, cosine score) for every job, best first."""
+        if not self.count:
+            return []
+        query = np.zeros(DIMENSIONS)
+        terms = resume_terms(resume)
+        if terms:
+            keys = np.fromiter(terms.keys(), dtype=np.int64, count=len(terms))
+            weights = _sublinear(np.fromiter(terms.values(), dtype=np.float64, count=len(terms))) * self.idf[keys]
+            query[keys] = weights / (np.linalg.norm(weights) or 1.0)
+
+        # Sparse matrix x dense query vector, one pass over the nonzeros
+        scores = np.bincount(self.rows, weights=self.vals * query[self.cols], minlength=self.count)
+        scores = np.divide(scores, self.norms, out=np.zeros_like(scores), where=self.norms > 0)
+        # Stable sort keeps the caller's order among equal scores
+        order = np.argsort(-scores, kind="stable")
+        return [(int(i), float(scores[i])) for i in order]
+
+
+def rank_jobs(resume: dict, jobs: Sequence[Job]) -> List[Tuple[int, float]]:
+    """(index into `jobs`, cosine score) for every job, best first."""
+    if not jobs:
+        return []
+    return JobMatrix(jobs).score(resume)
@@ -0,0 +1,89 @@
+# backend/utils/recommendation_cache.py
+"""Cache for /api/recommendations results.
+
+Entries are keyed on a digest of the normalized resume fields that feed the
+ranking and the Gemini prompt (canonical skills, experience, education,
+text), the request options, and a version of the candidate jobs:
+
+    request `jobs`      digest of every job id + content hash, so editing,
+                        adding or dropping a job misses the cache
+    vector index        the last job-store write the index has synced,
+                        so any newly stored or changed job misses the cache
+
+Only the recommended job ids are stored; the route rebuilds the jobs from
+the current candidate set. Storage is a utils.tiered_cache.TieredCache:
+memory LRU (RECOMMEND_CACHE_MAX_ENTRIES) plus an optional Mongo tier
+(`recommendation_cache` collection), and concurrent identical requests are
+coalesced, so a burst of the same request makes one Gemini call.
+
+Configuration (env):
+    RECOMMEND_CACHE_TTL_SECONDS   entry lifetime (900)
+    RECOMMEND_CACHE_MAX_ENTRIES   memory tier size (1024)
+    RECOMMEND_CACHE_MONGO         "1" to enable the Mongo tier
+"""
+import hashlib
+import json
+import os
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from models.job import Job
+from utils.job_ids import listing_etag
+from utils.skills import skill_matcher
+from utils.tiered_cache import TieredCache
+
+# (recommended job ids, source) as produced by the route
+Recommendation = Tuple[List[str], str]
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return "\n".join(_text(item) for item in value)
+    return " ".join(str(value or "").lower().split())
+
+
+def resume_fingerprint(resume_data: Dict[str, Any]) -> str:
+    """Digest of the resume fields that influence recommendations (contact details excluded)."""
+    normalized = {
+        "skills": sorted(skill_matcher.normalize(resume_data.get("skills") or [])),
+        "experience": _text(resume_data.get("experience")),
+        "education": _text(resume_data.get("education")),
+        "text": _text(resume_data.get("raw_text_snippet")),
+    }
+    return hashlib.sha1(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def job_set_version(jobs: Iterable[Job]) -> str:
+    """Order-independent digest of the job ids and their contents."""
+    return listing_etag(sorted(jobs, key=lambda job: job.job_id)).strip('"')
+
+
+class RecommendationCache:
+    def __init__(self, db=None, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        self.ttl = ttl or float(os.getenv("RECOMMEND_CACHE_TTL_SECONDS", "900"))
+        self._cache = TieredCache(
+            "Recommendation cache",
+            max_entries or int(os.getenv("RECOMMEND_CACHE_MAX_ENTRIES", "1024")),
+            db.recommendation_cache if db is not None and os.getenv("RECOMMEND_CACHE_MONGO", "0") == "1" else None,
+            encode=lambda value: {"job_ids": value[0], "source": value[1]},
+            decode=lambda doc: (doc["job_ids"], doc["source"]),
+        )
+
+    async def ensure_indexes(self):
+        await self._cache.ensure_indexes()
+
+    @staticmethod
+    def key(resume_data: Dict[str, Any], version: str, **options) -> str:
+        raw = json.dumps([resume_fingerprint(resume_data), version, options], sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+    async def get(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Recommendation]],
+        cacheable: Callable[[Recommendation], bool] = lambda value: True,
+    ) -> Recommendation:
+        """Cached value for `key`, or the result of `compute()` (stored if `cacheable`)."""
+        return await self._cache.get(key, compute, self.ttl, cacheable)
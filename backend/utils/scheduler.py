@@ -0,0 +1,129 @@
+# backend/utils/scheduler.py
+"""Background refresh scheduler that keeps the job store warm.
+
+Each source gets its own asyncio loop which, on every interval, scrapes the
+configured (search_term, location) pairs through the fan-out engine and upserts
+the results into the job store. Scrapes are incremental: only new or changed
+cards are parsed and written (see scrapers.incremental).
+
+Configuration (env):
+    REFRESH_SCHEDULER_ENABLED   "1" (default) / "0"
+    REFRESH_QUERIES             "software developer|India;data analyst|Bangalore"
+    REFRESH_INTERVAL_SECONDS    default interval for every source (900)
+    REFRESH_INTERVAL_<SOURCE>   per-source override, e.g. REFRESH_INTERVAL_NAUKRI=1800
+    REFRESH_PAGES               pages to scrape per refresh (1)
+    REFRESH_VIA_QUEUE           "1" to enqueue the refreshes for worker.py instead
+                                of scraping in this process
+"""
+import asyncio
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.fanout import ScrapeFanout
+from utils.job_store import JobStore
+from utils.task_queue import TaskQueue
+
+# (search_term, location, pages, incremental=False) -> {source: task}
+TaskFactory = Callable[..., dict]
+
+
+def parse_refresh_queries(raw: Optional[str] = None) -> List[Tuple[str, str]]:
+    raw = raw if raw is not None else os.getenv("REFRESH_QUERIES", "software developer|India")
+    queries = []
+    for part in raw.split(";"):
+        if not part.strip():
+            continue
+        term, _, location = part.partition("|")
+        queries.append((term.strip(), location.strip() or "India"))
+    return queries
+
+
+class RefreshScheduler:
+    def __init__(
+        self,
+        store: JobStore,
+        fanout: ScrapeFanout,
+        task_factory: TaskFactory,
+        queries: Optional[List[Tuple[str, str]]] = None,
+        intervals: Optional[Dict[str, float]] = None,
+        queue: Optional[TaskQueue] = None,
+    ):
+        self.store = store
+        self.fanout = fanout
+        self.task_factory = task_factory
+        self.queries = queries if queries is not None else parse_refresh_queries()
+        self.intervals = intervals or {}
+        self.pages = int(os.getenv("REFRESH_PAGES", "1"))
+        self.default_interval = float(os.getenv("REFRESH_INTERVAL_SECONDS", "900"))
+        # Hand periodic refreshes to out-of-process workers when asked to
+        self.queue = queue if os.getenv("REFRESH_VIA_QUEUE", "0") == "1" else None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def sources(self) -> List[str]:
+        # Source names come from the task factory so there is a single source list
+        return list(self.task_factory("", "", 1).keys())
+
+    def interval_for(self, source: str) -> float:
+        if source in self.intervals:
+            return self.intervals[source]
+        env_value = os.getenv(f"REFRESH_INTERVAL_{source.upper()}")
+        return float(env_value) if env_value else self.default_interval
+
+    async def refresh(self, search_term: str, location: str, pages: int = 1, sources: Optional[List[str]] = None) -> dict:
+        """Scrape `sources` (default: all) for one query and upsert the results.
+
+        Returns a source_breakdown dict (job counts, or "timeout" / "error").
+        """
+        tasks = self.task_factory(search_term, location, pages, incremental=True)
+        if sources is not None:
+            tasks = {name: task for name, task in tasks.items() if name in sources}
+        query = JobStore.query_key(search_term, location)
+
+        results = await self.fanout.run_sources(tasks)
+        source_breakdown = {}
+        for source, (jobs, status) in results.items():
+            if status != "ok":
+                # "timeout" / "error": no refresh is recorded for this source
+                source_breakdown[source] = status
+                continue
+            counts = await self.store.apply_delta(source, query, jobs)
+            # Stored: the parsed cards can now be skipped on the next scrape
+            jobs.commit()
+            print(f"[scheduler] {source} '{query}': {counts}")
+            source_breakdown[source] = len(jobs)
+        return source_breakdown
+
+    async def _source_loop(self, source: str):
+        interval = self.interval_for(source)
+        while True:
+            for search_term, location in self.queries:
+                try:
+                    if self.queue is not None:
+                        # One pending task per source and query, dropped if still unclaimed next interval
+                        task, created = await self.queue.enqueue_unique(
+                            search_term, location, self.pages, [source], expires_in=interval
+                        )
+                        state = "queued" if created else f"already {task['status']}"
+                        print(f"[scheduler] {source} '{search_term}' @ {location}: {state} {task['_id']}")
+                        continue
+                    breakdown = await self.refresh(search_term, location, self.pages, sources=[source])
+                    print(f"[scheduler] {source} '{search_term}' @ {location}: {breakdown.get(source)}")
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    print(f"[scheduler] refresh failed for {source}: {e}")
+            await asyncio.sleep(interval)
+
+    def start(self):
+        if os.getenv("REFRESH_SCHEDULER_ENABLED", "1") != "1" or self._tasks:
+            return
+        for source in self.sources:
+            self._tasks.append(asyncio.create_task(self._source_loop(source)))
+        print(f"[scheduler] started for {len(self._tasks)} sources, {len(self.queries)} queries")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
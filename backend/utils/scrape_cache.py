@@ -0,0 +1,90 @@
+# backend/utils/scrape_cache.py
+"""Cache in front of the on-demand scrape path.
+
+Entries are per (normalized search_term, location, pages, source), so a
+request for any set of sources reuses whatever sources are already cached and
+only scrapes the rest; each source has its own TTL. Storage is a
+utils.tiered_cache.TieredCache: memory LRU (SCRAPE_CACHE_MAX_ENTRIES) plus an
+optional Mongo tier (`scrape_cache` collection), and concurrent misses for the
+same entry are coalesced, so the first caller scrapes and the others await it.
+
+Configuration (env):
+    SCRAPE_CACHE_TTL_SECONDS    default TTL (300)
+    SCRAPE_CACHE_TTL_<SOURCE>   per-source override, e.g. SCRAPE_CACHE_TTL_NAUKRI=900
+    SCRAPE_CACHE_MAX_ENTRIES    memory tier size (512)
+    SCRAPE_CACHE_MONGO          "1" to enable the Mongo tier
+"""
+import asyncio
+import functools
+import os
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from models.job import Job
+from utils.job_store import JobStore
+from utils.tiered_cache import TieredCache
+
+CacheKey = Tuple[str, int, str]  # (query, pages, source)
+SourceResult = Tuple[Optional[List[Job]], str]  # (jobs, status), as returned by ScrapeFanout.run_sources
+Loader = Callable[[List[str]], Awaitable[Dict[str, SourceResult]]]
+
+
+def _doc_id(key: CacheKey) -> str:
+    query, pages, source = key
+    return f"{source}|{pages}|{query}"
+
+
+class ScrapeCache:
+    def __init__(self, db=None, max_entries: Optional[int] = None, default_ttl: Optional[float] = None):
+        self.default_ttl = default_ttl or float(os.getenv("SCRAPE_CACHE_TTL_SECONDS", "300"))
+        self._cache = TieredCache(
+            "Scrape cache",
+            max_entries or int(os.getenv("SCRAPE_CACHE_MAX_ENTRIES", "512")),
+            db.scrape_cache if db is not None and os.getenv("SCRAPE_CACHE_MONGO", "0") == "1" else None,
+            encode=lambda result: {"jobs": [job.model_dump() for job in result[0]]},
+            decode=lambda doc: ([Job(**job) for job in doc["jobs"]], "ok"),
+            doc_id=_doc_id,
+        )
+
+    async def ensure_indexes(self):
+        await self._cache.ensure_indexes()
+
+    def ttl_for(self, source: str) -> float:
+        env_value = os.getenv(f"SCRAPE_CACHE_TTL_{source.upper()}")
+        return float(env_value) if env_value else self.default_ttl
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+    async def get(
+        self,
+        search_term: str,
+        location: str,
+        pages: int,
+        sources: List[str],
+        load: Loader,
+    ) -> Dict[str, SourceResult]:
+        """Per-source (jobs, status) for the query, scraping only uncached sources.
+
+        `load(missing_sources)` runs the actual scrape; only "ok" results are cached.
+        """
+        query = JobStore.query_key(search_term, location)
+
+        async def scrape(source: str) -> SourceResult:
+            try:
+                loaded = await load([source])
+            except Exception as e:
+                print(f"Scrape cache load error: {e}")
+                return [], "error"
+            return loaded.get(source, ([], "error"))
+
+        # Uncached sources are scraped concurrently, each in its own load() call
+        results = await asyncio.gather(*[
+            self._cache.get(
+                (query, pages, source),
+                functools.partial(scrape, source),
+                self.ttl_for(source),
+                cacheable=lambda result: result[1] == "ok",
+            )
+            for source in sources
+        ])
+        return dict(zip(sources, results))
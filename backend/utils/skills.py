@@ -0,0 +1,168 @@
+# backend/utils/skills.py
+"""Skill taxonomy and matcher shared by the scrapers, the resume parser and
+the recommendation fallback.
+
+Every alias of every skill is compiled into one trie-shaped regular
+expression, so a document is scanned once however many skills we know. Matches need word
+boundaries ("Java" is not found in "JavaScript", "AI" not in "maintain"),
+and aliases that are also ordinary words ("AI" vs "ai") only match in their
+usual casing.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+# Canonical name -> aliases matched in text (case-insensitively unless listed in
+# CASE_SENSITIVE). A canonical name is only matched if it is also an alias, so
+# ambiguous ones ("Excel") can require a qualifier.
+SKILL_TAXONOMY: Dict[str, List[str]] = {
+    "Python": ["python", "python3"],
+    "Java": ["java", "core java", "java 8", "j2ee"],
+    "JavaScript": ["javascript", "js", "ecmascript", "es6"],
+    "TypeScript": ["typescript"],
+    "React": ["react", "reactjs", "react.js"],
+    "React Native": ["react native"],
+    "Node.js": ["node", "nodejs", "node.js"],
+    "Angular": ["angular", "angularjs", "angular.js"],
+    "Vue.js": ["vue", "vuejs", "vue.js"],
+    "Next.js": ["next.js", "nextjs"],
+    "Flutter": ["flutter"],
+    "Dart": ["dart"],
+    "Swift": ["swift"],
+    "Kotlin": ["kotlin"],
+    "Golang": ["golang", "go lang"],
+    "Rust": ["rust"],
+    "C++": ["c++", "cpp"],
+    "C#": ["c#", "csharp"],
+    ".NET": [".net", "dotnet", "asp.net", ".net core"],
+    "PHP": ["php"],
+    "Laravel": ["laravel"],
+    "Ruby": ["ruby", "ruby on rails", "rails"],
+    "Django": ["django"],
+    "Flask": ["flask"],
+    "FastAPI": ["fastapi"],
+    "Spring Boot": ["spring boot", "springboot"],
+    "SQL": ["sql"],
+    "MySQL": ["mysql"],
+    "PostgreSQL": ["postgresql", "postgres"],
+    "MongoDB": ["mongodb", "mongo"],
+    "Redis": ["redis"],
+    "Elasticsearch": ["elasticsearch", "elastic search"],
+    "Kafka": ["kafka", "apache kafka"],
+    "Spark": ["spark", "apache spark", "pyspark"],
+    "Hadoop": ["hadoop"],
+    "Docker": ["docker"],
+    "Kubernetes": ["kubernetes", "k8s"],
+    "AWS": ["aws", "amazon web services"],
+    "Azure": ["azure", "microsoft azure"],
+    "GCP": ["gcp", "google cloud", "google cloud platform"],
+    "Terraform": ["terraform"],
+    "Jenkins": ["jenkins"],
+    "CI/CD": ["ci/cd", "cicd"],
+    "Git": ["git", "github", "gitlab"],
+    "Linux": ["linux", "unix"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3", "scss", "sass"],
+    "Tailwind CSS": ["tailwind", "tailwindcss"],
+    "REST APIs": ["rest api", "rest apis", "restful"],
+    "GraphQL": ["graphql"],
+    "Microservices": ["microservices", "microservice"],
+    "Figma": ["figma"],
+    "Adobe XD": ["adobe xd"],
+    "Photoshop": ["photoshop"],
+    "Machine Learning": ["machine learning", "ml"],
+    "Deep Learning": ["deep learning"],
+    "AI": ["AI", "artificial intelligence"],
+    "NLP": ["nlp", "natural language processing"],
+    "TensorFlow": ["tensorflow"],
+    "PyTorch": ["pytorch"],
+    "Pandas": ["pandas"],
+    "NumPy": ["numpy"],
+    "Data Science": ["data science"],
+    "Analytics": ["analytics", "data analytics"],
+    "Tableau": ["tableau"],
+    "Power BI": ["power bi", "powerbi"],
+    "Excel": ["ms excel", "microsoft excel", "advanced excel"],
+    "Selenium": ["selenium"],
+    "Android": ["android"],
+    "iOS": ["ios"],
+    "Salesforce": ["salesforce"],
+    "SAP": ["sap"],
+}
+
+# Aliases that are ordinary words in other casings
+CASE_SENSITIVE = {"AI"}
+
+# Characters that continue a skill token ("C++", "C#", "Node.js")
+_WORD = r"[\w+#]"
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """One regex for many literals, factored as a trie ("react(?:js|\\.js| native)?"),
+    so the engine walks shared prefixes once instead of trying every alternative."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of a word
+
+    def build(node: dict) -> str:
+        ends = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if ends else body
+
+    return build(trie)
+
+
+class SkillMatcher:
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        # Lower-cased alias or canonical name -> canonical name
+        self._canonical: Dict[str, str] = {skill.lower(): skill for skill in taxonomy}
+        for skill, aliases in taxonomy.items():
+            for alias in aliases:
+                self._canonical.setdefault(alias.lower(), skill)
+        self._case_sensitive = {alias.lower(): alias for alias in CASE_SENSITIVE}
+        aliases = {alias.lower() for names in taxonomy.values() for alias in names}
+        # The greedy trie prefers the longest alias ("react native" over "react").
+        # It runs over lower-cased text: literal matching is much cheaper than IGNORECASE.
+        self._pattern = re.compile(rf"(?<!{_WORD}){_trie_regex(aliases)}(?!{_WORD})")
+
+    def canonical(self, alias: str) -> Optional[str]:
+        return self._canonical.get(alias.lower())
+
+    def find(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """Canonical skills mentioned in `text`, in order of first mention."""
+        found: Dict[str, None] = {}
+        text = text or ""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters ("İ") lower to two; keep offsets aligned with `text`
+            lowered = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+        for match in self._pattern.finditer(lowered):
+            alias = match.group(0)
+            cased = self._case_sensitive.get(alias)
+            if cased is not None and text[match.start():match.end()] != cased:
+                continue  # "ai" / "Ai" are not the skill
+            found[self._canonical[alias]] = None
+            if limit is not None and len(found) >= limit:
+                break
+        return list(found)
+
+    def normalize(self, names: Iterable[str]) -> Set[str]:
+        """Canonical names for a list of skills (unknown ones kept, lower-cased)."""
+        normalized = set()
+        for name in names:
+            name = (name or "").strip()
+            if name:
+                normalized.add(self.canonical(name) or name.lower())
+        return normalized
+
+
+skill_matcher = SkillMatcher(SKILL_TAXONOMY)
+
+
+def find_skills(text: str, limit: Optional[int] = None) -> List[str]:
+    return skill_matcher.find(text, limit)
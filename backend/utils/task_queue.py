@@ -0,0 +1,143 @@
+# backend/utils/task_queue.py
+"""Mongo-backed queue of scrape tasks for the out-of-process workers (worker.py).
+
+A task is one (search_term, location, pages, sources) scrape. Workers claim
+the oldest queued task atomically and hold a lease on it; a task whose lease
+ran out (worker crashed or was killed) is claimed again, up to
+`max_attempts` times. No broker is needed beyond the Mongo we already use.
+
+Periodic producers use `enqueue_unique`, which reuses an identical task that
+is still queued or running and gives new tasks an expiry, so the queue stays
+bounded while no worker is running.
+
+    queued -> running -> done | failed
+"""
+import os
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class TaskQueue:
+    def __init__(self, db: AsyncIOMotorDatabase, lease_seconds: Optional[float] = None, max_attempts: int = 3):
+        self.tasks = db.scrape_tasks
+        self.lease_seconds = lease_seconds or float(os.getenv("SCRAPE_TASK_LEASE_SECONDS", "600"))
+        self.max_attempts = max_attempts
+
+    async def ensure_indexes(self):
+        await self.tasks.create_index([("status", 1), ("created_at", 1)])
+        await self.tasks.create_index([("status", 1), ("lease_expires_at", 1)])
+        await self.tasks.create_index([("status", 1), ("search_term", 1), ("location", 1)])
+
+    @staticmethod
+    def _new_task(search_term: str, location: str, pages: int, sources: List[str], expires_in: Optional[float]) -> dict:
+        now = datetime.utcnow()
+        doc = {
+            "search_term": search_term,
+            "location": location,
+            "pages": pages,
+            "sources": sources,
+            "status": STATUS_QUEUED,
+            "attempts": 0,
+            "created_at": now,
+        }
+        if expires_in:
+            # Not worth running once the next periodic refresh is due
+            doc["expires_at"] = now + timedelta(seconds=expires_in)
+        return doc
+
+    async def enqueue(
+        self, search_term: str, location: str, pages: int, sources: List[str], expires_in: Optional[float] = None
+    ) -> dict:
+        doc = self._new_task(search_term, location, pages, sources, expires_in)
+        result = await self.tasks.insert_one(doc)
+        doc["_id"] = result.inserted_id
+        return doc
+
+    async def enqueue_unique(
+        self, search_term: str, location: str, pages: int, sources: List[str], expires_in: Optional[float] = None
+    ) -> Tuple[dict, bool]:
+        """Enqueue unless an identical task is already queued or running.
+
+        Returns (task, created); `task` is the existing one when created is False.
+        """
+        now = datetime.utcnow()
+        existing = await self.tasks.find_one({
+            "search_term": search_term,
+            "location": location,
+            "pages": pages,
+            "sources": sources,
+            "status": {"$in": [STATUS_QUEUED, STATUS_RUNNING]},
+            "attempts": {"$lt": self.max_attempts},
+            "expires_at": {"$not": {"$lte": now}},
+        })
+        if existing is not None:
+            return existing, False
+        return await self.enqueue(search_term, location, pages, sources, expires_in), True
+
+    async def get(self, task_id: str) -> Optional[dict]:
+        if not ObjectId.is_valid(task_id):
+            return None
+        return await self.tasks.find_one({"_id": ObjectId(task_id)})
+
+    async def claim(self, worker_id: str) -> Optional[dict]:
+        """Atomically take the oldest runnable task; None when the queue is empty."""
+        now = datetime.utcnow()
+        return await self.tasks.find_one_and_update(
+            {
+                "$or": [
+                    {"status": STATUS_QUEUED},
+                    # Lease ran out: the worker holding it is gone
+                    {"status": STATUS_RUNNING, "lease_expires_at": {"$lt": now}},
+                ],
+                "attempts": {"$lt": self.max_attempts},
+                "expires_at": {"$not": {"$lte": now}},
+            },
+            {
+                "$set": {
+                    "status": STATUS_RUNNING,
+                    "worker_id": worker_id,
+                    "started_at": now,
+                    "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def complete(self, task_id: ObjectId, worker_id: str, source_breakdown: dict):
+        await self.tasks.update_one(
+            {"_id": task_id, "worker_id": worker_id},
+            {"$set": {"status": STATUS_DONE, "finished_at": datetime.utcnow(), "source_breakdown": source_breakdown}},
+        )
+
+    async def fail(self, task_id: ObjectId, worker_id: str, error: str, attempts: int):
+        # Retry until max_attempts, then give up
+        status = STATUS_QUEUED if attempts < self.max_attempts else STATUS_FAILED
+        await self.tasks.update_one(
+            {"_id": task_id, "worker_id": worker_id},
+            {"$set": {"status": status, "error": error, "finished_at": datetime.utcnow()}},
+        )
+
+    async def fail_abandoned(self) -> int:
+        """Mark tasks whose last allowed attempt lost its lease, and queued
+        tasks past their expiry, as failed."""
+        now = datetime.utcnow()
+        result = await self.tasks.update_many(
+            {"status": STATUS_RUNNING, "lease_expires_at": {"$lt": now}, "attempts": {"$gte": self.max_attempts}},
+            {"$set": {"status": STATUS_FAILED, "error": "lease expired", "finished_at": now}},
+        )
+        expired = await self.tasks.update_many(
+            {"status": STATUS_QUEUED, "expires_at": {"$lte": now}},
+            {"$set": {"status": STATUS_FAILED, "error": "expired before a worker claimed it", "finished_at": now}},
+        )
+        return result.modified_count + expired.modified_count
@@ -0,0 +1,140 @@
+# backend/utils/tiered_cache.py
+"""Two-tier TTL cache with single-flight loading, shared by utils.scrape_cache
+and utils.recommendation_cache.
+
+    memory  LRU bounded to `max_entries` entries
+    mongo   optional (pass a collection), shared by workers / restarts;
+            TTL index on expires_at
+
+Concurrent misses for the same key are coalesced: the first caller computes,
+the others await its result (or its exception). If the first caller is
+cancelled, a waiting caller takes over the computation.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TieredCache:
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        collection=None,
+        encode: Callable[[Any], dict] = lambda value: {"value": value},
+        decode: Callable[[dict], Any] = lambda doc: doc["value"],
+        doc_id: Callable[[Hashable], str] = str,
+    ):
+        """`encode` / `decode` map a value to / from the Mongo document fields;
+        `doc_id` maps a key to the document _id."""
+        self.name = name
+        self.max_entries = max_entries
+        self.collection = collection
+        self.encode, self.decode, self.doc_id = encode, decode, doc_id
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.counters = {"hits": 0, "mongo_hits": 0, "misses": 0, "coalesced": 0}
+
+    async def ensure_indexes(self):
+        if self.collection is not None:
+            await self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    def stats(self) -> dict:
+        return {**self.counters, "entries": len(self._entries), "inflight": len(self._inflight)}
+
+    def _memory_get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _memory_put(self, key: Hashable, value: Any, ttl: float):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _mongo_get(self, key: Hashable) -> Optional[Any]:
+        if self.collection is None:
+            return None
+        try:
+            doc = await self.collection.find_one({"_id": self.doc_id(key), "expires_at": {"$gt": datetime.utcnow()}})
+        except Exception as e:
+            print(f"{self.name} read error: {e}")
+            return None
+        if doc is None:
+            return None
+        value = self.decode(doc)
+        # Keep the remaining lifetime when promoting to memory
+        self._memory_put(key, value, (doc["expires_at"] - datetime.utcnow()).total_seconds())
+        return value
+
+    async def _mongo_put(self, key: Hashable, value: Any, ttl: float):
+        if self.collection is None:
+            return
+        try:
+            await self.collection.replace_one(
+                {"_id": self.doc_id(key)},
+                {**self.encode(value), "expires_at": datetime.utcnow() + timedelta(seconds=ttl)},
+                upsert=True,
+            )
+        except Exception as e:
+            print(f"{self.name} write error: {e}")
+
+    async def get(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float,
+        cacheable: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """Cached value for `key`, or the result of `compute()` (stored for `ttl` if `cacheable`)."""
+        while True:
+            value = self._memory_get(key)
+            if value is not None:
+                self.counters["hits"] += 1
+                return value
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            self.counters["coalesced"] += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # we were cancelled ourselves
+                # The computing caller was cancelled: try again, possibly computing it ourselves
+
+        # Claim the key before any await so concurrent callers coalesce onto us
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._mongo_get(key)
+            if value is not None:
+                self.counters["mongo_hits"] += 1
+            else:
+                self.counters["misses"] += 1
+                value = await compute()
+                if cacheable(value):
+                    self._memory_put(key, value, ttl)
+                    await self._mongo_put(key, value, ttl)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            if not future.done():
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    # Coalesced callers see the same failure instead of waiting forever
+                    future.set_exception(e)
+                    future.exception()  # mark retrieved: nobody may be waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
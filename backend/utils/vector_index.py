@@ -0,0 +1,363 @@
+# backend/utils/vector_index.py
+"""Persistent nearest-neighbour index over stored jobs, so /api/recommendations
+can find candidates for a resume without being sent a job list.
+
+Each job is embedded as a dense DIMENSIONS-wide vector: the same hashed
+title / description / skill terms utils.ranking uses, folded down with
+signed feature hashing and L2-normalised, so a dot product is a cosine.
+Vectors live in a memory-mapped float32 matrix on disk (JOB_INDEX_DIR) and
+are grouped IVF-style: k-means centroids over the vectors, every row tagged
+with its nearest centroid, and a query only scores the rows of the
+JOB_INDEX_PROBES centroids closest to it. Below JOB_INDEX_MIN_TRAIN jobs,
+or until the first training, every row is scored.
+
+The index follows the job store rather than the scrapers: `sync` embeds the
+jobs whose `updated_at` moved since the last sync (so jobs written by
+worker.py processes are picked up too), tombstones the ones no query lists
+any more, and the centroids are retrained when the index has grown
+JOB_INDEX_RETRAIN_GROWTH times since the last training.
+
+One process owns an index directory, held with an exclusive lock: when
+JOB_INDEX_DIR is taken (another uvicorn worker), the process uses the first
+free JOB_INDEX_DIR-1, JOB_INDEX_DIR-2, ... instead, so each worker keeps its
+own index across restarts.
+
+Configuration (env):
+    JOB_INDEX_DIR               directory for the index files (data/job_index)
+    JOB_INDEX_SYNC_SECONDS      seconds between syncs from the job store (60)
+    JOB_INDEX_PROBES            centroids scanned per query (8)
+    JOB_INDEX_MIN_TRAIN         jobs needed before centroids are trained (2000)
+    JOB_INDEX_RETRAIN_GROWTH    retrain once the index is this many times larger (2)
+"""
+import asyncio
+import fcntl
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.job import Job
+from utils.job_store import JobStore
+from utils.ranking import job_terms
+
+DIMENSIONS = 256
+_INDEX_MASK = DIMENSIONS - 1
+# Hashed term ids use their low bits for the column, the next bit for the sign
+_SIGN_SHIFT = DIMENSIONS.bit_length() - 1
+
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLE = 50000
+# Writes stamped just before a sync can commit just after it; re-read this much
+_SYNC_OVERLAP = timedelta(seconds=120)
+_SYNC_BATCH = 1000
+# Directories tried (JOB_INDEX_DIR, JOB_INDEX_DIR-1, ...) before giving up
+_MAX_DIRS = 64
+
+
+def embed_terms(terms: Dict[int, float]) -> np.ndarray:
+    """Dense unit vector for hashed terms (utils.ranking.job_terms / resume_terms)."""
+    vector = np.zeros(DIMENSIONS, dtype=np.float32)
+    if terms:
+        keys = np.fromiter(terms.keys(), dtype=np.int64, count=len(terms))
+        weights = 1.0 + np.log(np.fromiter(terms.values(), dtype=np.float64, count=len(terms)))
+        signs = 1 - 2 * ((keys >> _SIGN_SHIFT) & 1)
+        np.add.at(vector, keys & _INDEX_MASK, (weights * signs).astype(np.float32))
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+    return vector
+
+
+class JobVectorIndex:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv("JOB_INDEX_DIR", os.path.join("data", "job_index"))
+        self.probes = int(os.getenv("JOB_INDEX_PROBES", "8"))
+        self.min_train = int(os.getenv("JOB_INDEX_MIN_TRAIN", "2000"))
+        self.retrain_growth = float(os.getenv("JOB_INDEX_RETRAIN_GROWTH", "2"))
+        self.sync_interval = float(os.getenv("JOB_INDEX_SYNC_SECONDS", "60"))
+
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.vectors = None  # np.memmap, capacity x DIMENSIONS
+        self.assignments = np.zeros(0, dtype=np.int32)  # centroid per row, -1 before training
+        self.listed = np.zeros(0, dtype=bool)  # False for tombstoned rows
+        self.unlisted = 0
+        self.centroids: Optional[np.ndarray] = None
+        self.trained_on = 0
+        self.synced_at: Optional[datetime] = None
+        self._synced_id = ""  # job_id of the last job synced at `synced_at`
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._dir_lock = None  # open lock file while this process owns `path`
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {"syncs": 0, "embedded": 0, "trainings": 0, "queries": 0, "last_query_ms": None}
+
+    def __len__(self) -> int:
+        return len(self.ids) - self.unlisted
+
+    @property
+    def version(self) -> str:
+        """Last job-store write synced; the same in every process once caught up."""
+        return f"{self.synced_at.isoformat() if self.synced_at else ''}|{self._synced_id}"
+
+    # ------------------------------------------------------------------ storage
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _claim_dir(self):
+        """Lock the first free directory among `path`, `path`-1, ...; raises if all are taken."""
+        base = self.path
+        for slot in range(_MAX_DIRS):
+            path = base if slot == 0 else f"{base}-{slot}"
+            os.makedirs(path, exist_ok=True)
+            lock = open(os.path.join(path, "lock"), "w")
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock.close()
+                continue
+            if slot:
+                print(f"Job vector index: {base} is in use by another process, using {path}")
+            self.path, self._dir_lock = path, lock
+            return
+        raise RuntimeError(f"Job vector index: {base} and its {_MAX_DIRS - 1} fallbacks are all locked by other processes")
+
+    def load(self):
+        """Open the index files in JOB_INDEX_DIR (or a free fallback), or start empty."""
+        if self._dir_lock is None:
+            self._claim_dir()
+        meta_path = self._file("meta.json")
+        if not os.path.exists(meta_path):
+            self._resize(1024)
+            return
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get("dimensions") != DIMENSIONS:
+                raise ValueError(f"index built with {meta.get('dimensions')} dimensions")
+            self.ids = meta["ids"]
+            self.rows = {job_id: row for row, job_id in enumerate(self.ids)}
+            self.trained_on = meta.get("trained_on", 0)
+            self.synced_at = datetime.fromisoformat(meta["synced_at"]) if meta.get("synced_at") else None
+            self._synced_id = meta.get("synced_id", "")
+            self._resize(max(1024, len(self.ids)), meta.get("capacity", 0))
+            assignments = np.load(self._file("assignments.npy"))
+            self.assignments[:len(assignments)] = assignments
+            self.listed[:len(self.ids)] = True
+            if os.path.exists(self._file("listed.npy")):
+                listed = np.load(self._file("listed.npy"))
+                self.listed[:len(listed)] = listed
+            self.unlisted = int(len(self.ids) - self.listed[:len(self.ids)].sum())
+            if os.path.exists(self._file("centroids.npy")):
+                self.centroids = np.load(self._file("centroids.npy"))
+        except Exception as e:
+            print(f"Job vector index load error, rebuilding from the job store: {e}")
+            self.ids, self.rows, self.centroids, self.trained_on = [], {}, None, 0
+            self.synced_at, self._synced_id = None, ""
+            self.vectors, self.assignments = None, np.zeros(0, dtype=np.int32)
+            self.listed, self.unlisted = np.zeros(0, dtype=bool), 0
+            self._resize(1024, 0)
+
+    def _resize(self, capacity: int, on_disk: Optional[int] = None):
+        """Grow the memory-mapped matrix (and the per-row arrays) to `capacity` rows."""
+        if on_disk is None:
+            on_disk = self.vectors.shape[0] if self.vectors is not None else 0
+        capacity = max(capacity, on_disk)
+        if self.vectors is not None:
+            self.vectors.flush()
+            self.vectors = None
+        path = self._file("vectors.f32")
+        with open(path, "ab") as f:
+            f.truncate(capacity * DIMENSIONS * 4)  # new rows read as zeros
+        self.vectors = np.memmap(path, dtype=np.float32, mode="r+", shape=(capacity, DIMENSIONS))
+        assignments = np.full(capacity, -1, dtype=np.int32)
+        assignments[:len(self.assignments)] = self.assignments[:capacity]
+        self.assignments = assignments
+        listed = np.zeros(capacity, dtype=bool)
+        listed[:len(self.listed)] = self.listed[:capacity]
+        self.listed = listed
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self.vectors.flush()
+            meta = {
+                "dimensions": DIMENSIONS,
+                "capacity": int(self.vectors.shape[0]),
+                "trained_on": self.trained_on,
+                "synced_at": self.synced_at.isoformat() if self.synced_at else None,
+                "synced_id": self._synced_id,
+                "ids": self.ids,
+            }
+            # Write-then-rename so a crash never leaves half a file behind
+            self._write(self._file("assignments.npy"), lambda f: np.save(f, self.assignments[:len(self.ids)]))
+            self._write(self._file("listed.npy"), lambda f: np.save(f, self.listed[:len(self.ids)]))
+            if self.centroids is not None:
+                self._write(self._file("centroids.npy"), lambda f: np.save(f, self.centroids))
+            self._write(self._file("meta.json"), lambda f: f.write(json.dumps(meta).encode()))
+            self._dirty = False
+
+    @staticmethod
+    def _write(path: str, write):
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------------------ updates
+
+    def add(self, jobs: Sequence[Job]) -> int:
+        """Embed and insert (or overwrite) `jobs`; returns how many were written."""
+        if not jobs:
+            return 0
+        vectors = np.stack([embed_terms(job_terms(job)) for job in jobs])
+        with self._lock:
+            rows = []
+            relisted = set()
+            for job in jobs:
+                row = self.rows.get(job.job_id)
+                if row is not None and not self.listed[row]:
+                    relisted.add(row)
+                if row is None:
+                    row = len(self.ids)
+                    self.ids.append(job.job_id)
+                    self.rows[job.job_id] = row
+                rows.append(row)
+            if len(self.ids) > self.vectors.shape[0]:
+                self._resize(max(len(self.ids), 2 * self.vectors.shape[0]))
+            rows = np.asarray(rows)
+            self.vectors[rows] = vectors
+            self.listed[rows] = True
+            self.unlisted -= len(relisted)
+            if self.centroids is not None:
+                self.assignments[rows] = np.argmax(vectors @ self.centroids.T, axis=1)
+            self._dirty = True
+            self._stats["embedded"] += len(jobs)
+            if len(self.ids) >= self.min_train and len(self.ids) >= self.retrain_growth * max(self.trained_on, 1):
+                self._train()
+        return len(jobs)
+
+    def remove(self, job_ids: Sequence[str]) -> int:
+        """Tombstone `job_ids` so searches skip them; returns how many were listed."""
+        with self._lock:
+            rows = np.asarray([self.rows[job_id] for job_id in job_ids if job_id in self.rows], dtype=np.int64)
+            rows = np.unique(rows[self.listed[rows]])
+            self.listed[rows] = False
+            self.unlisted += len(rows)
+            if len(rows):
+                self._dirty = True
+        return len(rows)
+
+    def _train(self):
+        """Spherical k-means over (a sample of) the vectors, then reassign every row."""
+        count = len(self.ids)
+        vectors = self.vectors[:count]
+        lists = int(min(4096, max(16, np.sqrt(count))))
+        rng = np.random.default_rng(0)
+        sample = vectors[rng.choice(count, size=min(count, _KMEANS_SAMPLE), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=lists, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            nearest = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, nearest, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # An empty cluster keeps its old centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+        for start in range(0, count, 65536):
+            chunk = vectors[start:start + 65536]
+            self.assignments[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+        self.centroids = centroids.astype(np.float32)
+        self.trained_on = count
+        self._stats["trainings"] += 1
+        print(f"Job vector index trained: {lists} lists over {count} jobs")
+
+    async def sync(self, store: JobStore) -> int:
+        """Embed the jobs written to `store` since the last sync; returns how many."""
+        loop = asyncio.get_running_loop()
+        since, after_id = self.synced_at, self._synced_id
+        if since is not None and since > datetime.utcnow() - _SYNC_OVERLAP:
+            # Recent writes may still be committing with older stamps: re-read them
+            since, after_id = since - _SYNC_OVERLAP, ""
+        total = 0
+        while True:
+            batch = await store.jobs_updated_since(since, after_id, _SYNC_BATCH)
+            if not batch:
+                break
+            total += await loop.run_in_executor(None, self.add, [job for job, _, listed in batch if listed])
+            unlisted = [job.job_id for job, _, listed in batch if not listed]
+            if unlisted:
+                await loop.run_in_executor(None, self.remove, unlisted)
+            since, after_id = batch[-1][1], batch[-1][0].job_id
+            if self.synced_at is None or (since, after_id) > (self.synced_at, self._synced_id):
+                self.synced_at, self._synced_id = since, after_id
+        await loop.run_in_executor(None, self.save)
+        self._stats["syncs"] += 1
+        return total
+
+    async def _sync_loop(self, store: JobStore):
+        while True:
+            try:
+                added = await self.sync(store)
+                if added:
+                    print(f"Job vector index: {added} jobs embedded, {len(self)} total")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Job vector index sync error: {e}")
+            await asyncio.sleep(self.sync_interval)
+
+    def start(self, store: JobStore):
+        if self._task is None:
+            self._task = asyncio.create_task(self._sync_loop(store))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.save()
+        if self._dir_lock is not None:
+            self._dir_lock.close()
+            self._dir_lock = None
+
+    # ------------------------------------------------------------------ queries
+
+    def search(self, vector: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Up to `k` (job_id, cosine) pairs nearest to `vector`, best first."""
+        started = time.perf_counter()
+        with self._lock:
+            count = len(self.ids)
+            if not count:
+                return []
+            listed = self.listed[:count]
+            if self.centroids is not None:
+                probes = np.argsort(-(self.centroids @ vector))[:self.probes]
+                rows = np.flatnonzero(np.isin(self.assignments[:count], probes) & listed)
+                if len(rows) < k:
+                    rows = np.flatnonzero(listed)
+            else:
+                rows = np.flatnonzero(listed)
+            if not len(rows):
+                return []
+            scores = self.vectors[rows] @ vector
+            top = np.argpartition(-scores, min(k, len(rows)) - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            hits = [(self.ids[rows[i]], float(scores[i])) for i in top]
+        self._stats["queries"] += 1
+        self._stats["last_query_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return hits
+
+    def stats(self) -> dict:
+        return {
+            "jobs": len(self),
+            "unlisted": self.unlisted,
+            "lists": 0 if self.centroids is None else len(self.centroids),
+            "synced_at": self.synced_at,
+            **self._stats,
+        }
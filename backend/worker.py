@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Scrape worker: pulls tasks from the Mongo task queue (utils/task_queue.py),
+runs the scrapers and writes results to the job store.
+
+Run as many as you like, on this machine or others pointing at the same
+MONGO_URI; each one keeps its own browser pool, so Selenium no longer
+competes with the API process for CPU and memory.
+
+    python worker.py [--concurrency 2] [--poll 2.0]
+
+Tasks are created with POST /api/scrape-tasks, or by the API's background
+refresh scheduler when REFRESH_VIA_QUEUE=1.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import uuid
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from scrapers.async_http import shutdown_fetch_loop
+from scrapers.driver_pool import get_driver_pool
+from scrapers.registry import build_scrapers, remember_fingerprints, source_tasks
+from utils.fanout import ScrapeFanout
+from utils.job_store import JobStore
+from utils.scheduler import RefreshScheduler
+from utils.task_queue import TaskQueue
+
+load_dotenv()
+
+
+async def work(slot: int, worker_id: str, queue: TaskQueue, scheduler: RefreshScheduler, poll: float):
+    while True:
+        task = await queue.claim(worker_id)
+        if task is None:
+            await queue.fail_abandoned()
+            await asyncio.sleep(poll)
+            continue
+        print(f"[worker {slot}] task {task['_id']}: '{task['search_term']}' @ {task['location']} {task['sources']}")
+        try:
+            # Same incremental scrape + store write as the in-process scheduler
+            breakdown = await scheduler.refresh(task["search_term"], task["location"], task["pages"], task["sources"])
+            if breakdown and not any(isinstance(count, int) for count in breakdown.values()):
+                # Every source timed out or errored: retry rather than report success
+                raise RuntimeError(f"no source succeeded: {breakdown}")
+            await queue.complete(task["_id"], worker_id, breakdown)
+            print(f"[worker {slot}] task {task['_id']} done: {breakdown}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[worker {slot}] task {task['_id']} failed: {e}")
+            await queue.fail(task["_id"], worker_id, str(e), task["attempts"])
+
+
+async def main(concurrency: int, poll: float):
+    db = AsyncIOMotorClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))[os.getenv("MONGO_DB_NAME", "jobr_db")]
+    store = JobStore(db)
+    queue = TaskQueue(db)
+    await store.ensure_indexes()
+    await queue.ensure_indexes()
+
+    scrapers = build_scrapers()
+    remember_fingerprints(scrapers, await store.card_fingerprints(int(os.getenv("SCRAPER_SEEN_WARM_CARDS", "50000"))))
+    fanout = ScrapeFanout()
+    scheduler = RefreshScheduler(
+        store, fanout,
+        lambda search_term, location, pages, incremental=False: source_tasks(scrapers, search_term, location, pages, incremental),
+    )
+    asyncio.get_running_loop().run_in_executor(None, get_driver_pool().warm)
+
+    worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+    print(f"Scrape worker {worker_id} started with {concurrency} slots")
+    try:
+        await asyncio.gather(*[work(slot, worker_id, queue, scheduler, poll) for slot in range(concurrency)])
+    finally:
+        fanout.shutdown()
+        get_driver_pool().close_all()
+        await asyncio.get_running_loop().run_in_executor(None, shutdown_fetch_loop)
+        db.client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("SCRAPE_WORKER_CONCURRENCY", "2")))
+    parser.add_argument("--poll", type=float, default=2.0, help="Seconds between polls when the queue is empty")
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.concurrency, args.poll))
+    except KeyboardInterrupt:
+        pass